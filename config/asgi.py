@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# Bajo ASGI se enrutan las variantes async de las vistas
+os.environ.setdefault('ASYNC_VIEWS', 'True')
 
 application = get_asgi_application()
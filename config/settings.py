@@ -102,6 +102,37 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Por defecto en memoria: no añade consultas SQL. Con varios procesos (workers
+# web y comandos de gestión) debe ser compartida para que las invalidaciones
+# lleguen a todos (ver core.checks), por ejemplo Redis:
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache CACHE_LOCATION=redis://...
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'dashboard'),
+    }
+}
+
+# Segundos que se conservan los datos derivados de los dashboards
+DASHBOARD_CACHE_TIMEOUT = int(os.getenv('DASHBOARD_CACHE_TIMEOUT', 60 * 60))
+
+# Hilos para lanzar en paralelo los servicios independientes de los dashboards (1 = en serie)
+DASHBOARD_MAX_WORKERS = int(os.getenv('DASHBOARD_MAX_WORKERS', 4))
+
+# Vistas async (las activa config/asgi.py) y tamaño del pool que ejecuta su código síncrono
+ASYNC_VIEWS = os.getenv('ASYNC_VIEWS', 'False') == 'True'
+ASYNC_VIEW_MAX_WORKERS = int(os.getenv('ASYNC_VIEW_MAX_WORKERS', 16))
+
+# Totales del listado de transacciones del admin (por filtros activos)
+ADMIN_TOTALS_CACHE_TIMEOUT = int(os.getenv('ADMIN_TOTALS_CACHE_TIMEOUT', 60))
+
+# A partir de cuántas filas el admin usa el recuento estimado de PostgreSQL
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(os.getenv('ADMIN_ESTIMATED_COUNT_THRESHOLD', 10000))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -14,17 +14,19 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 from django.shortcuts import redirect
-from core.views import home
+from core.views import home, home_async
 
 urlpatterns = [
     path("", lambda request: redirect("home"), name="root"),
-    path("home/", home, name="home"),
+    path("home/", home_async if settings.ASYNC_VIEWS else home, name="home"),
     path('admin/', admin.site.urls),
     path('accounts/', include('allauth.urls')),
     path('finances/', include('finances.urls')),
     path('investments/', include('investments.urls')),
     path('reports/', include('reports.urls')),
+    path('api/', include('core.api_urls')),
 ]
@@ -0,0 +1,106 @@
+import hashlib
+from decimal import Decimal
+
+from django.contrib.auth.decorators import login_required
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
+
+from core.services.cache import get_persisted_version, version_to_datetime
+from finances.services.api import get_annual_cashflow_summary
+from holdings.services.api import get_annual_balance_evolution
+from holdings.services.history import get_net_worth_evolution
+from investments.services.api import get_portfolio_overview
+from investments.services.history import get_monthly_contributions_bar
+
+
+class ChartJSONEncoder(DjangoJSONEncoder):
+    # Las gráficas esperan números, no los strings que DjangoJSONEncoder usa para Decimal
+    def default(self, o):
+        if isinstance(o, Decimal):
+            return float(o)
+        return super().default(o)
+
+
+def _data_version(request):
+    # Versión persistida (no la de la caché): una sola lectura por petición
+    if not hasattr(request, '_data_version'):
+        request._data_version = get_persisted_version(request.user)
+    return request._data_version
+
+
+def _today(request):
+    # Sin parámetro year los endpoints usan el año en curso: la fecha forma parte del validador
+    if not hasattr(request, '_today'):
+        request._today = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    return request._today
+
+
+def _data_etag(request, *args, **kwargs):
+    # Cambia con cada modificación confirmada de los datos del usuario (ver core.signals) y cada día
+    key = f"{request.user.pk}:{_data_version(request)}:{_today(request).date()}:{request.get_full_path()}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def _data_last_modified(request, *args, **kwargs):
+    return max(version_to_datetime(_data_version(request)), _today(request))
+
+
+def user_data_endpoint(view):
+    """
+    Endpoint JSON de solo lectura con ETag fuerte y Last-Modified derivados de
+    la versión persistida de los datos del usuario y de la fecha: si no han
+    cambiado responde 304 sin ejecutar la vista.
+    """
+    view = condition(etag_func=_data_etag, last_modified_func=_data_last_modified)(view)
+    view = cache_control(private=True, no_cache=True)(view)
+    return login_required(require_GET(view))
+
+
+def _json(data):
+    return JsonResponse(data, encoder=ChartJSONEncoder)
+
+
+def _year(request):
+    try:
+        return int(request.GET.get('year', _today(request).year))
+    except ValueError:
+        return _today(request).year
+
+
+@user_data_endpoint
+def net_worth_history(request):
+    return _json({'history': get_net_worth_evolution(request.user)})
+
+
+@user_data_endpoint
+def cashflow_summary(request):
+    year = _year(request)
+    return _json({'year': year, 'months': get_annual_cashflow_summary(request.user, year)})
+
+
+@user_data_endpoint
+def portfolio_overview(request):
+    data = dict(get_portfolio_overview(request.user))
+    # Sustituimos las instancias de Asset por sus datos básicos
+    for key in ('portfolio', 'chart_assets'):
+        data[key] = [
+            {**{k: v for k, v in item.items() if k != 'obj'},
+             'asset': {'id': item['obj'].pk, 'name': item['obj'].name, 'category': item['obj'].category}}
+            for item in data[key]
+        ]
+    return _json(data)
+
+
+@user_data_endpoint
+def balance_matrix(request):
+    year = _year(request)
+    return _json({'year': year, **get_annual_balance_evolution(request.user, year)})
+
+
+@user_data_endpoint
+def contributions_bar(request):
+    labels, datasets = get_monthly_contributions_bar(request.user)
+    return _json({'labels': labels, 'datasets': datasets})
@@ -0,0 +1,11 @@
+from django.urls import path
+from . import api
+
+app_name = 'api'
+urlpatterns = [
+    path('net-worth/', api.net_worth_history, name='net_worth'),
+    path('cashflow/', api.cashflow_summary, name='cashflow'),
+    path('portfolio/', api.portfolio_overview, name='portfolio'),
+    path('balance-matrix/', api.balance_matrix, name='balance_matrix'),
+    path('contributions/', api.contributions_bar, name='contributions'),
+]
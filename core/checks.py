@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# Backends cuyo contenido solo ve el proceso que lo escribe
+PROCESS_LOCAL_CACHES = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    Las versiones por usuario de core.services.cache se invalidan desde el
+    proceso que escribe los datos: con una caché por proceso y varios workers,
+    el resto seguiría sirviendo dashboards antiguos hasta DASHBOARD_CACHE_TIMEOUT.
+    """
+    backend = settings.CACHES['default']['BACKEND']
+    if settings.DEBUG or backend not in PROCESS_LOCAL_CACHES:
+        return []
+
+    return [Warning(
+        f"The default cache ({backend}) is not shared between processes.",
+        hint="When running more than one worker process, set CACHE_BACKEND to Redis "
+             "so cache invalidation reaches every worker.",
+        id='core.W001',
+    )]
@@ -0,0 +1,18 @@
+from functools import wraps
+
+from django.contrib.auth.views import redirect_to_login
+
+from core.services.concurrency import run_in_pool
+
+
+def async_login_required(view):
+    """
+    Equivalente a login_required para vistas async (Django 4.2 no lo soporta).
+    La sesión y el usuario se cargan en el pool para no bloquear el event loop.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if not await run_in_pool(lambda: request.user.is_authenticated):
+            return redirect_to_login(request.get_full_path())
+        return await view(request, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:10
+
+import time
+
+from django.conf import settings
+from django.db import migrations
+
+
+def create_versions(apps, schema_editor):
+    # Una versión por usuario existente: las lecturas no tienen que crearla
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    UserDataVersion = apps.get_model('core', 'UserDataVersion')
+
+    version = time.time_ns()
+    UserDataVersion.objects.bulk_create(
+        [
+            UserDataVersion(user_id=pk, version=version)
+            for pk in User.objects.filter(data_version__isnull=True).values_list('pk', flat=True)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_user_data_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(create_versions, migrations.RunPython.noop),
+    ]
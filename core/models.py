@@ -1,3 +1,20 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+
+class UserDataVersion(models.Model):
+    """
+    Versión persistida de los datos del usuario: time.time_ns() del último
+    cambio confirmado. La renueva core.services.cache.invalidate_user_cache
+    tras el commit y valida los ETag/Last-Modified de los endpoints JSON.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='data_version',
+    )
+    version = models.BigIntegerField()
+
+    def __str__(self):
+        return f"{self.user} v{self.version}"
@@ -0,0 +1,120 @@
+import hashlib
+import time
+from datetime import datetime, timezone
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+from core.models import UserDataVersion
+
+KEY_PREFIX = "dashboard"
+
+
+def _user_id(user):
+    return getattr(user, "pk", user)
+
+
+def _version_key(user_id):
+    return f"{KEY_PREFIX}:version:{user_id}"
+
+
+def get_persisted_version(user):
+    """
+    Versión guardada en BD (UserDataVersion) de los datos del usuario: no
+    depende de la caché, así que sirve como validador HTTP. Es solo una
+    lectura: la fila se crea con el usuario (o en la migración) y se renueva
+    al escribir. Sin fila la versión es 0.
+    """
+    version = (
+        UserDataVersion.objects.filter(user_id=_user_id(user))
+        .values_list('version', flat=True)
+        .first()
+    )
+    return version or 0
+
+
+def get_user_version(user):
+    """
+    Versión de los datos derivados del usuario para las claves de la caché.
+    Si no está en la caché (primer acceso o expulsada) se lee de la BD.
+    """
+    key = _version_key(_user_id(user))
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, get_persisted_version(user), None)
+        version = cache.get(key)
+    return version
+
+
+def version_to_datetime(version):
+    """Momento del cambio que generó la versión (un time.time_ns())."""
+    return datetime.fromtimestamp(version / 1e9, tz=timezone.utc)
+
+
+def _bump_version(user_id):
+    version = time.time_ns()
+    if not UserDataVersion.objects.filter(user_id=user_id).update(version=version):
+        # Sin fila: se crea ahora, salvo que el usuario se haya borrado en la misma transacción
+        if not get_user_model().objects.filter(pk=user_id).exists():
+            return
+        UserDataVersion.objects.update_or_create(user_id=user_id, defaults={'version': version})
+    cache.set(_version_key(user_id), version, None)
+
+
+def invalidate_user_cache(user):
+    """
+    Descarta todos los datos derivados cacheados para el usuario y renueva su
+    versión persistida. Dentro de una transacción espera al commit: si no,
+    una petición concurrente podría cachear los datos anteriores bajo la
+    versión nueva.
+    """
+    user_id = _user_id(user)
+    transaction.on_commit(lambda: _bump_version(user_id))
+
+
+def reset_user_version(user):
+    """
+    Crea la versión de un usuario nuevo y reemplaza la cacheada. Es inmediato:
+    sirve para ids reutilizados por usuarios nuevos.
+    """
+    user_id, version = _user_id(user), time.time_ns()
+    UserDataVersion.objects.update_or_create(user_id=user_id, defaults={'version': version})
+    cache.set(_version_key(user_id), version, None)
+
+
+def get_or_set_per_user(user, name, params, compute, timeout=None):
+    """
+    Devuelve el valor cacheado para (usuario, nombre, parámetros) en la
+    versión actual de sus datos o lo calcula con compute().
+    """
+    digest = hashlib.md5(repr(params).encode()).hexdigest()
+    user_id = _user_id(user)
+    key = f"{KEY_PREFIX}:{name}:{user_id}:{get_user_version(user_id)}:{digest}"
+
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        cache.set(key, result, settings.DASHBOARD_CACHE_TIMEOUT if timeout is None else timeout)
+    return result
+
+
+def cached_per_user(name):
+    """
+    Cachea el resultado de un servicio cuyo primer argumento es el usuario.
+    La clave incluye el usuario, sus parámetros y la versión de sus datos,
+    que las señales de core.signals renuevan cuando cambian los datos.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(user, *args, **kwargs):
+            return get_or_set_per_user(
+                user, name, (args, sorted(kwargs.items())),
+                lambda: func(user, *args, **kwargs),
+            )
+
+        wrapper.uncached = func
+        return wrapper
+    return decorator
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+_executors = {}
+_executor_lock = Lock()
+
+
+def _get_executor(setting):
+    # Un pool por setting: las vistas async no compiten con el fan-out de los dashboards
+    with _executor_lock:
+        if setting not in _executors:
+            _executors[setting] = ThreadPoolExecutor(
+                max_workers=getattr(settings, setting), thread_name_prefix=setting.lower()
+            )
+        return _executors[setting]
+
+
+def _run_in_worker(func):
+    # Cada hilo usa su propia conexión: la liberamos al terminar según CONN_MAX_AGE
+    try:
+        return func()
+    finally:
+        close_old_connections()
+
+
+def run_concurrently(*funcs):
+    """
+    Ejecuta funciones independientes sin argumentos en un pool de hilos y
+    devuelve sus resultados en el mismo orden. Se ejecutan en serie si
+    DASHBOARD_MAX_WORKERS <= 1 o dentro de una transacción, porque otro
+    hilo no vería los datos sin confirmar (p.ej. en los tests).
+    """
+    if settings.DASHBOARD_MAX_WORKERS <= 1 or len(funcs) < 2 or connection.in_atomic_block:
+        return [func() for func in funcs]
+
+    executor = _get_executor("DASHBOARD_MAX_WORKERS")
+    futures = [executor.submit(_run_in_worker, func) for func in funcs]
+    return [future.result() for future in futures]
+
+
+async def run_in_pool(func, *args, **kwargs):
+    """
+    Ejecuta código síncrono (ORM, servicios, plantillas) desde una vista async
+    en un pool acotado a ASYNC_VIEW_MAX_WORKERS hilos. Con 1 o menos se usa el
+    hilo síncrono compartido de Django (thread_sensitive), p.ej. en los tests.
+    """
+    if settings.ASYNC_VIEW_MAX_WORKERS <= 1:
+        return await sync_to_async(func)(*args, **kwargs)
+
+    run = sync_to_async(
+        _run_in_worker, thread_sensitive=False, executor=_get_executor("ASYNC_VIEW_MAX_WORKERS")
+    )
+    return await run(partial(func, *args, **kwargs))
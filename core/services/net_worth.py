@@ -1,6 +1,7 @@
 from datetime import timedelta
 from django.utils import timezone
 
+from core.services.concurrency import run_concurrently
 from holdings.services.api import get_current_value as get_holdings_value
 from investments.services.api import get_portfolio_overview
 
@@ -10,11 +11,11 @@ def calculate_net_worth(user):
     Calcula el patrimonio total actual y el estado de actualización de los datos.
     """
 
-    # A. Cash (holdings)
-    holdings_value, holdings_dates = get_holdings_value(user)
-
-    # B. Investments
-    investments_data = get_portfolio_overview(user)
+    # A. Cash (holdings) y B. Investments, en paralelo
+    (holdings_value, holdings_dates), investments_data = run_concurrently(
+        lambda: get_holdings_value(user),
+        lambda: get_portfolio_overview(user),
+    )
     investments_value = investments_data["global_current_value"]
     investments_date = investments_data["last_market_date"]
 
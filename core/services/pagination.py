@@ -0,0 +1,44 @@
+import json
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def estimate_count(qs):
+    """
+    Recuento aproximado según las estadísticas de PostgreSQL: reltuples si el
+    queryset no tiene filtros y la estimación del planificador si los tiene.
+    Devuelve None en otros motores.
+    """
+    connection = connections[qs.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    if not qs.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                [qs.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples vale -1 (o 0) hasta el primer ANALYZE
+        return row[0] if row and row[0] > 0 else None
+
+    plan = json.loads(qs.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator que evita el COUNT(*) exacto cuando el resultado estimado supera
+    ADMIN_ESTIMATED_COUNT_THRESHOLD filas. Por debajo cuenta de forma exacta.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is not None and estimate > settings.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+            return estimate
+        return super().count
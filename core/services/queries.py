@@ -0,0 +1,20 @@
+from django.db import connection
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+
+def latest_per(qs, partition_field, date_field="date"):
+    """
+    Filtra el queryset al registro más reciente de cada `partition_field`
+    en una sola consulta: DISTINCT ON en PostgreSQL, ROW_NUMBER() en el resto.
+    """
+    if connection.features.can_distinct_on_fields:
+        return qs.order_by(partition_field, f"-{date_field}").distinct(partition_field)
+
+    return qs.annotate(
+        row_number=Window(
+            expression=RowNumber(),
+            partition_by=[F(partition_field)],
+            order_by=F(date_field).desc(),
+        )
+    ).filter(row_number=1)
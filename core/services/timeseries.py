@@ -0,0 +1,60 @@
+from datetime import date
+
+
+def month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def add_months(value, months):
+    """Desplaza una fecha (día 1) el número de meses indicado."""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_bounds(year, month):
+    """Rango [inicio, inicio del mes siguiente) para filtrar con índices."""
+    start = date(year, month, 1)
+    return start, add_months(start, 1)
+
+
+def year_bounds(year):
+    return date(year, 1, 1), date(year + 1, 1, 1)
+
+
+def month_range(start_date, end_date):
+    """
+    Lista de primeros de mes entre start_date y end_date (ambos incluidos).
+    """
+    months = []
+    current = month_start(start_date)
+    last = month_start(end_date)
+    while current <= last:
+        months.append(current)
+        current = add_months(current, 1)
+    return months
+
+
+def month_offset(value, start_date):
+    """Posición (en meses) de una fecha respecto al mes de start_date."""
+    return (value.year - start_date.year) * 12 + value.month - start_date.month
+
+
+def opening_value(points, default=0.0):
+    """Último valor anterior al inicio de la serie (índices negativos)."""
+    opening = [idx for idx in points if idx < 0]
+    return points[max(opening)] if opening else default
+
+
+def forward_fill(points, size, default=0.0):
+    """
+    Convierte {índice: valor} en una serie de `size` posiciones donde cada
+    posición arrastra el último valor conocido. Los índices negativos
+    (datos anteriores al inicio) sirven como valor de apertura.
+    """
+    series = []
+    current = opening_value(points, default)
+    for idx in range(size):
+        if idx in points:
+            current = points[idx]
+        series.append(current)
+    return series
@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+
+from core.services.cache import invalidate_user_cache, reset_user_version
+from finances.models import Category, SubCategory, Transaction
+from holdings.models import AccountBalanceSnapshot, BankAccount
+from investments.models import Asset, AssetHistory
+from investments.models import Transaction as InvestmentTransaction
+
+# Modelos cuyos cambios alteran los datos derivados de los dashboards
+TRACKED_MODELS = [
+    Transaction,
+    Category,
+    SubCategory,
+    AccountBalanceSnapshot,
+    BankAccount,
+    AssetHistory,
+    InvestmentTransaction,
+    Asset,
+]
+
+
+def invalidate_owner_cache(sender, instance, **kwargs):
+    invalidate_user_cache(instance.user_id)
+
+
+def invalidate_new_user_cache(sender, instance, created, **kwargs):
+    # Los ids pueden reutilizarse (p.ej. tras borrar usuarios): empezamos limpios
+    if created:
+        reset_user_version(instance.pk)
+
+
+def connect_signals():
+    for model in TRACKED_MODELS:
+        post_save.connect(invalidate_owner_cache, sender=model, dispatch_uid=f"cache:{model._meta.label}:save")
+        post_delete.connect(invalidate_owner_cache, sender=model, dispatch_uid=f"cache:{model._meta.label}:delete")
+
+    post_save.connect(invalidate_new_user_cache, sender=settings.AUTH_USER_MODEL, dispatch_uid="cache:user:created")
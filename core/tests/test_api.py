@@ -0,0 +1,139 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from datetime import date, datetime, timezone as dt_timezone
+
+from core.models import UserDataVersion
+from finances.models import Category, SubCategory, Transaction
+from holdings.models import BankAccount, AccountBalanceSnapshot
+from investments.models import Asset, AssetHistory
+from investments.models import Transaction as InvestmentTransaction
+
+User = get_user_model()
+
+ENDPOINTS = ['api:net_worth', 'api:cashflow', 'api:portfolio', 'api:balance_matrix', 'api:contributions']
+
+
+@override_settings(CACHES={
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "core-api-tests"}
+})
+class DashboardApiTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="test", password="1234")
+        self.account = BankAccount.objects.create(
+            user=self.user, name="Checking", institution="Bank", account_type="CHECKING"
+        )
+        AccountBalanceSnapshot.objects.create(
+            user=self.user, account=self.account, date=date(2024, 1, 31), balance=1000
+        )
+        asset = Asset.objects.create(user=self.user, name="ETF", category="INDEX_FUND")
+        InvestmentTransaction.objects.create(user=self.user, asset=asset, date=date(2024, 1, 5), amount=500)
+        AssetHistory.objects.create(user=self.user, asset=asset, date=date(2024, 1, 31), total_value=550)
+        category = Category.objects.create(
+            user=self.user, name="Salary", transaction_type='INCOME', expense_type='N/A'
+        )
+        subcategory = SubCategory.objects.create(user=self.user, name="Main Job", parent_category=category)
+        Transaction.objects.create(user=self.user, date=date(2024, 1, 25), amount=3000, subcategory=subcategory)
+        self.client.force_login(self.user)
+
+    def test_endpoints_return_json_with_validators(self):
+        for name in ENDPOINTS:
+            response = self.client.get(reverse(name), {'year': 2024})
+            self.assertEqual(response.status_code, 200, name)
+            self.assertTrue(response['ETag'].startswith('"'), name)
+            self.assertIn('Last-Modified', response)
+            self.assertIn('private', response['Cache-Control'])
+
+        data = self.client.get(reverse('api:portfolio')).json()
+        self.assertEqual(data['portfolio'][0]['asset']['name'], "ETF")
+        self.assertEqual(data['global_current_value'], 550.0)
+        months = self.client.get(reverse('api:cashflow'), {'year': 2024}).json()['months']
+        self.assertEqual(months[0]['income'], 3000.0)
+
+    def test_unchanged_data_returns_304_without_recomputing(self):
+        url = reverse('api:net_worth')
+        etag = self.client.get(url)['ETag']
+
+        with mock.patch('core.api.get_net_worth_evolution') as service:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        service.assert_not_called()
+
+    def test_data_change_renews_etag(self):
+        url = reverse('api:net_worth')
+        etag = self.client.get(url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            AccountBalanceSnapshot.objects.create(
+                user=self.user, account=self.account, date=date(2024, 2, 29), balance=1200
+            )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['history'][-1]['value'], 1750.0)
+
+    def test_etag_survives_cache_loss(self):
+        url = reverse('api:net_worth')
+        etag = self.client.get(url)['ETag']
+        cache.clear()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_etag_follows_persisted_version(self):
+        # Cambio confirmado por otro proceso: la caché local no se entera, la BD sí
+        url = reverse('api:net_worth')
+        etag = self.client.get(url)['ETag']
+        UserDataVersion.objects.filter(user=self.user).update(version=F('version') + 1)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_year_rollover_renews_validators(self):
+        url = reverse('api:cashflow')
+        last_change = datetime(2025, 6, 1, tzinfo=dt_timezone.utc)
+        UserDataVersion.objects.filter(user=self.user).update(version=int(last_change.timestamp()) * 10**9)
+        with mock.patch('django.utils.timezone.now', return_value=datetime(2025, 12, 31, 12, tzinfo=dt_timezone.utc)):
+            first = self.client.get(url)
+        self.assertEqual(first.json()['year'], 2025)
+
+        # Sin cambios en los datos, el año por defecto cambia: no vale el 304
+        with mock.patch('django.utils.timezone.now', return_value=datetime(2026, 1, 1, 12, tzinfo=dt_timezone.utc)):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['year'], 2026)
+            response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+            self.assertEqual(response.status_code, 200)
+
+    def test_conditional_get_does_not_write(self):
+        UserDataVersion.objects.filter(user=self.user).delete()
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('api:net_worth'), HTTP_IF_NONE_MATCH='"stale"')
+        self.assertFalse([q for q in queries if not q['sql'].lstrip().upper().startswith(('SELECT', 'SAVEPOINT', 'RELEASE'))])
+        self.assertFalse(UserDataVersion.objects.filter(user=self.user).exists())
+
+    def test_etag_depends_on_parameters(self):
+        url = reverse('api:cashflow')
+        self.assertNotEqual(
+            self.client.get(url, {'year': 2023})['ETag'],
+            self.client.get(url, {'year': 2024})['ETag'],
+        )
+
+    def test_anonymous_users_are_redirected(self):
+        self.client.logout()
+        self.assertEqual(self.client.get(reverse('api:net_worth')).status_code, 302)
+
+
+class LazyHomeTest(TestCase):
+
+    def test_home_renders_without_net_worth_series(self):
+        user = User.objects.create_user(username="test", password="1234")
+        self.client.force_login(user)
+        with mock.patch('holdings.services.history.get_net_worth_evolution') as service:
+            response = self.client.get(reverse('home'))
+        service.assert_not_called()
+        self.assertContains(response, f'data-url="{reverse("api:net_worth")}"')
@@ -0,0 +1,87 @@
+import json
+import threading
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test import AsyncRequestFactory, SimpleTestCase, TestCase, override_settings
+
+from finances.models import Category, SubCategory, Transaction
+from finances.views import summary_async, transaction_page_async, transaction_search_async
+from holdings.models import BankAccount, AccountBalanceSnapshot
+from investments.views import investments_dashboard_async
+from reports.views import financial_report_async, holdings_report_async, investment_report_async
+
+from ..services.concurrency import run_in_pool
+from ..views import home_async
+
+User = get_user_model()
+
+
+class RunInPoolTest(SimpleTestCase):
+
+    @override_settings(ASYNC_VIEW_MAX_WORKERS=4)
+    async def test_runs_in_bounded_pool(self):
+        ident = await run_in_pool(threading.get_ident)
+        self.assertNotEqual(ident, threading.get_ident())
+        self.assertEqual(await run_in_pool(max, 1, 3), 3)
+
+
+# Con un solo hilo el código síncrono va al hilo del test y ve su transacción
+@override_settings(ASYNC_VIEW_MAX_WORKERS=1)
+class AsyncViewsTest(TestCase):
+
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+        self.user = User.objects.create_user(username="test", password="1234")
+        account = BankAccount.objects.create(
+            user=self.user, name="Checking", institution="Bank", account_type="CHECKING"
+        )
+        AccountBalanceSnapshot.objects.create(
+            user=self.user, account=account, date=date(2024, 1, 31), balance=1000
+        )
+        category = Category.objects.create(
+            user=self.user, name="Salary", transaction_type='INCOME', expense_type='N/A'
+        )
+        subcategory = SubCategory.objects.create(user=self.user, name="Main Job", parent_category=category)
+        Transaction.objects.create(
+            user=self.user, date=date(2024, 1, 25), amount=3000, subcategory=subcategory, description="Payroll"
+        )
+
+    def _get(self, path, user=None, **params):
+        request = self.factory.get(path, params)
+        request.user = user or self.user
+        return request
+
+    async def test_anonymous_user_is_redirected_to_login(self):
+        response = await home_async(self._get('/home/', user=AnonymousUser()))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('next=/home/', response.url)
+
+    async def test_html_views_render(self):
+        cases = [
+            (home_async, {}),
+            (investments_dashboard_async, {}),
+            (summary_async, {'year': 2024, 'month': 1}),
+            (financial_report_async, {'year': 2024}),
+            (investment_report_async, {'year': 2024}),
+            (holdings_report_async, {'year': 2024}),
+        ]
+        for view, params in cases:
+            with self.subTest(view=view.__name__):
+                response = await view(self._get('/', **params))
+                self.assertEqual(response.status_code, 200)
+
+    async def test_home_shows_net_worth(self):
+        response = await home_async(self._get('/home/'))
+        self.assertIn(b'<span class="amount">1000</span>', response.content)
+
+    async def test_json_views(self):
+        response = await transaction_search_async(self._get('/finances/search/', q='pay'))
+        self.assertEqual([r['description'] for r in json.loads(response.content)['results']], ["Payroll"])
+
+        response = await transaction_page_async(self._get('/finances/transactions/', year=2024, month=1))
+        self.assertEqual(len(json.loads(response.content)['results']), 1)
+
+        response = await transaction_page_async(self._get('/finances/transactions/', after='bad'))
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,227 @@
+"""
+Benchmark de regresión de las vistas principales.
+
+Genera un dataset sintético (varios usuarios, años de transacciones diarias,
+cuentas y activos) y mide para cada vista el número de consultas, el tiempo
+y el pico de memoria, en frío (caché vacía) y en caliente. Falla si se supera
+el presupuesto y deja los resultados en JSON para comparar ejecuciones.
+
+El número de consultas no depende del volumen de datos: ViewQueryBudgetTest lo
+comprueba con un dataset pequeño en la suite por defecto. Tiempo y memoria
+dependen del reloj y de la máquina, así que ViewBenchmarkTest es opcional:
+
+    RUN_BENCHMARKS=1 python manage.py test core.tests.test_benchmarks
+
+Variables de entorno: BENCHMARK_USERS, BENCHMARK_YEARS, BENCHMARK_ACCOUNTS,
+BENCHMARK_ASSETS y BENCHMARK_OUTPUT. Los presupuestos se pueden sobrescribir
+con settings.BENCHMARK_BUDGETS = {vista: {"queries": n, "seconds": s, "memory_mb": m}}.
+"""
+import json
+import os
+import time
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.services.timeseries import add_months, month_range
+from finances.models import Category, SubCategory, Transaction
+from finances.services.rollups import rebuild_rollups
+from holdings.models import BankAccount, AccountBalanceSnapshot
+from holdings.services.history import rebuild_net_worth_points
+from investments.models import Asset, AssetHistory
+from investments.models import Transaction as InvestmentTransaction
+
+User = get_user_model()
+
+USERS = int(os.getenv("BENCHMARK_USERS", 3))
+YEARS = int(os.getenv("BENCHMARK_YEARS", 10))
+ACCOUNTS = int(os.getenv("BENCHMARK_ACCOUNTS", 20))
+ASSETS = int(os.getenv("BENCHMARK_ASSETS", 30))
+OUTPUT = os.getenv("BENCHMARK_OUTPUT", "benchmark_results.json")
+
+END_DATE = date(2025, 12, 31)
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+
+# Las gráficas se cargan aparte del HTML (api:* y */chart/): se miden las páginas y esos endpoints
+DEFAULT_BUDGETS = {
+    "home": {"queries": 8, "seconds": 2.0, "memory_mb": 20},
+    "api_net_worth": {"queries": 8, "seconds": 2.0, "memory_mb": 20},
+    "summary": {"queries": 10, "seconds": 2.0, "memory_mb": 20},
+    "investments_dashboard": {"queries": 8, "seconds": 3.0, "memory_mb": 20},
+    "report_finance": {"queries": 6, "seconds": 2.0, "memory_mb": 20},
+    "report_finance_chart": {"queries": 6, "seconds": 2.0, "memory_mb": 20},
+    "report_investments": {"queries": 6, "seconds": 2.0, "memory_mb": 20},
+    "report_holdings": {"queries": 6, "seconds": 2.0, "memory_mb": 20},
+    "report_holdings_chart": {"queries": 6, "seconds": 2.0, "memory_mb": 20},
+}
+
+
+def _get_budget(view_name):
+    budget = dict(DEFAULT_BUDGETS[view_name])
+    budget.update(getattr(settings, "BENCHMARK_BUDGETS", {}).get(view_name, {}))
+    return budget
+
+
+def _seed_user(user, years, account_count, asset_count):
+    salary_cat = Category.objects.create(user=user, name="Salary", transaction_type="INCOME", expense_type="N/A")
+    rent_cat = Category.objects.create(
+        user=user, name="Rent", transaction_type="EXPENSE", expense_type="FIXED", is_housing=True
+    )
+    daily_cat = Category.objects.create(user=user, name="Daily", transaction_type="EXPENSE", expense_type="VARIABLE")
+
+    salary = SubCategory.objects.create(user=user, parent_category=salary_cat, name="Job")
+    rent = SubCategory.objects.create(user=user, parent_category=rent_cat, name="Apartment")
+    daily = [
+        SubCategory.objects.create(user=user, parent_category=daily_cat, name=name)
+        for name in ("Groceries", "Transport", "Restaurants", "Leisure")
+    ]
+
+    start_date = date(END_DATE.year - years + 1, 1, 1)
+    months = month_range(start_date, END_DATE)
+    transactions = []
+    for month in months:
+        transactions.append(Transaction(user=user, date=month + timedelta(days=24), amount=Decimal("3200"), subcategory=salary))
+        transactions.append(Transaction(user=user, date=month, amount=Decimal("-900"), subcategory=rent))
+
+    day = start_date
+    while day <= END_DATE:
+        transactions.append(Transaction(
+            user=user, date=day, amount=-Decimal(5 + day.toordinal() % 40),
+            subcategory=daily[day.toordinal() % len(daily)], description=f"Gasto {day:%d/%m}"
+        ))
+        day += timedelta(days=1)
+    Transaction.objects.bulk_create_normalized(transactions, refresh=False, batch_size=2000)
+
+    month_ends = [add_months(m, 1) - timedelta(days=1) for m in months]
+
+    accounts = BankAccount.objects.bulk_create([
+        BankAccount(user=user, name=f"Account {i}", institution="Bank", account_type="CHECKING")
+        for i in range(account_count)
+    ])
+    AccountBalanceSnapshot.objects.bulk_create([
+        AccountBalanceSnapshot(user=user, account=acc, date=month_end, balance=Decimal(1000 + 10 * idx))
+        for acc in accounts
+        for idx, month_end in enumerate(month_ends)
+    ], batch_size=2000)
+
+    assets = Asset.objects.bulk_create([
+        Asset(user=user, name=f"Asset {i}", category="INDEX_FUND", platform="Broker")
+        for i in range(asset_count)
+    ])
+    InvestmentTransaction.objects.bulk_create([
+        InvestmentTransaction(user=user, asset=asset, date=month + timedelta(days=4), amount=Decimal("100"))
+        for asset in assets
+        for month in months
+    ], batch_size=2000)
+    AssetHistory.objects.bulk_create([
+        AssetHistory(user=user, asset=asset, date=month_end, total_value=Decimal(110 * (idx + 1)))
+        for asset in assets
+        for idx, month_end in enumerate(month_ends)
+    ], batch_size=2000)
+
+
+class ViewMeasurementMixin:
+    """Siembra el dataset y mide cada vista en frío (caché vacía) y en caliente."""
+    users_count = years = accounts = assets = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            User.objects.create_user(username=f"bench{i}", password="1234")
+            for i in range(cls.users_count)
+        ]
+        for user in cls.users:
+            _seed_user(user, cls.years, cls.accounts, cls.assets)
+        # bulk_create no dispara señales: reconstruimos los agregados
+        rebuild_rollups()
+        rebuild_net_worth_points()
+
+    def setUp(self):
+        self.client.force_login(self.users[0])
+
+    def _views(self):
+        year = {"year": END_DATE.year}
+        return [
+            ("home", reverse("home"), {}),
+            ("api_net_worth", reverse("api:net_worth"), {}),
+            ("summary", reverse("summary"), {"year": END_DATE.year, "month": END_DATE.month}),
+            ("investments_dashboard", reverse("investment_dashboard"), {}),
+            ("report_finance", reverse("reports:report_finance"), year),
+            ("report_finance_chart", reverse("reports:report_finance_chart"), year),
+            ("report_investments", reverse("reports:report_investments"), year),
+            ("report_holdings", reverse("reports:report_holdings"), year),
+            ("report_holdings_chart", reverse("reports:report_holdings_chart"), year),
+        ]
+
+    def _measure(self, url, params):
+        tracemalloc.start()
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(response.status_code, 200)
+        return {
+            "queries": len(queries),
+            "seconds": round(elapsed, 4),
+            "memory_mb": round(peak / (1024 * 1024), 2),
+        }
+
+    def assert_views_within_budget(self, metrics):
+        results = {}
+        for view_name, url, params in self._views():
+            with self.subTest(view=view_name):
+                cache.clear()
+                cold = self._measure(url, params)
+                warm = self._measure(url, params)
+                results[view_name] = {"cold": cold, "warm": warm}
+
+                budget = _get_budget(view_name)
+                for metric in metrics:
+                    self.assertLessEqual(
+                        cold[metric], budget[metric],
+                        f"{view_name}: {metric}={cold[metric]} supera el presupuesto ({budget[metric]})"
+                    )
+        return results
+
+
+class ViewQueryBudgetTest(ViewMeasurementMixin, TestCase):
+    """Presupuesto de consultas con la configuración por defecto (caché incluida)."""
+    users_count, years, accounts, assets = 2, 2, 3, 3
+
+    def test_views_within_query_budget(self):
+        results = self.assert_views_within_budget(["queries"])
+        for view_name, result in results.items():
+            self.assertLessEqual(result["warm"]["queries"], result["cold"]["queries"], view_name)
+
+
+@tag("benchmark")
+@skipUnless(RUN_BENCHMARKS, "Benchmark de reloj: se ejecuta con RUN_BENCHMARKS=1")
+class ViewBenchmarkTest(ViewMeasurementMixin, TestCase):
+    users_count, years, accounts, assets = USERS, YEARS, ACCOUNTS, ASSETS
+    results = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        with open(OUTPUT, "w", encoding="utf-8") as f:
+            json.dump({
+                "dataset": {"users": USERS, "years": YEARS, "accounts": ACCOUNTS, "assets": ASSETS},
+                "database": connection.vendor,
+                "views": cls.results,
+            }, f, indent=2)
+        super().tearDownClass()
+
+    def test_views_within_budget(self):
+        type(self).results = self.assert_views_within_budget(["queries", "seconds", "memory_mb"])
@@ -0,0 +1,149 @@
+from django.core.checks import Warning
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from datetime import date
+
+from core.models import UserDataVersion
+from core.services.cache import get_persisted_version
+from holdings.models import BankAccount, AccountBalanceSnapshot
+from holdings.services.api import get_current_value
+from investments.models import Asset, AssetHistory
+from investments.services.api import get_portfolio_overview
+
+from ..checks import check_shared_cache
+
+User = get_user_model()
+
+
+@override_settings(CACHES={
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "core-cache-tests"}
+})
+class DerivedDataCacheTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="test", password="1234")
+        self.other = User.objects.create_user(username="other", password="1234")
+
+        self.account = BankAccount.objects.create(
+            user=self.user, name="Cash", institution="Bank", account_type="CHECKING"
+        )
+        AccountBalanceSnapshot.objects.create(
+            user=self.user, account=self.account, date=date(2024, 1, 31), balance=1000
+        )
+        self.asset = Asset.objects.create(user=self.user, name="ETF", category="INDEX_FUND")
+
+    def test_second_call_is_served_from_cache(self):
+        get_current_value(self.user)
+
+        with self.assertNumQueries(0):
+            value, _ = get_current_value(self.user)
+        self.assertEqual(value, 1000)
+
+    def test_snapshot_change_invalidates(self):
+        get_current_value(self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AccountBalanceSnapshot.objects.create(
+                user=self.user, account=self.account, date=date(2024, 2, 29), balance=1500
+            )
+        self.assertEqual(get_current_value(self.user)[0], 1500)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AccountBalanceSnapshot.objects.filter(date=date(2024, 2, 29)).get().delete()
+        self.assertEqual(get_current_value(self.user)[0], 1000)
+
+    def test_asset_history_invalidates_only_owner(self):
+        get_portfolio_overview(self.user)
+        get_portfolio_overview(self.other)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AssetHistory.objects.create(
+                user=self.user, asset=self.asset, date=date(2024, 1, 31), total_value=2000
+            )
+
+        with self.assertNumQueries(0):
+            get_portfolio_overview(self.other)
+        self.assertEqual(get_portfolio_overview(self.user)["global_current_value"], 2000)
+
+    def test_invalidation_waits_for_commit(self):
+        get_current_value(self.user)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            AccountBalanceSnapshot.objects.create(
+                user=self.user, account=self.account, date=date(2024, 2, 29), balance=1500
+            )
+            # Antes del commit la versión no cambia: nadie cachea datos sin confirmar bajo la nueva
+            with self.assertNumQueries(0):
+                get_current_value(self.user)
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(get_current_value(self.user)[0], 1500)
+
+    def test_missing_version_is_created_on_write(self):
+        UserDataVersion.objects.filter(user=self.user).delete()
+        self.assertEqual(get_persisted_version(self.user), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AccountBalanceSnapshot.objects.create(
+                user=self.user, account=self.account, date=date(2024, 2, 29), balance=1500
+            )
+        self.assertGreater(get_persisted_version(self.user), 0)
+
+
+class DefaultCacheQueriesTest(TestCase):
+    """Con la caché por defecto de config.settings (sin override_settings)."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="test", password="1234")
+        asset = Asset.objects.create(user=self.user, name="ETF", category="INDEX_FUND")
+        AssetHistory.objects.create(user=self.user, asset=asset, date=date(2024, 1, 31), total_value=2000)
+
+    def test_cache_adds_no_queries(self):
+        with CaptureQueriesContext(connection) as uncached:
+            get_portfolio_overview.uncached(self.user)
+
+        with self.assertNumQueries(len(uncached)):
+            get_portfolio_overview(self.user)
+        with self.assertNumQueries(0):
+            get_portfolio_overview(self.user)
+
+    def test_version_miss_is_a_single_read(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            get_portfolio_overview(self.user)
+        with CaptureQueriesContext(connection) as uncached:
+            get_portfolio_overview.uncached(self.user)
+
+        self.assertEqual(len(queries), len(uncached) + 1)
+        self.assertTrue(all(q['sql'].lstrip().upper().startswith('SELECT') for q in queries))
+
+    def test_warm_pages_skip_the_services(self):
+        self.client.force_login(self.user)
+        for name in ('home', 'summary', 'investment_dashboard'):
+            with self.subTest(name):
+                with CaptureQueriesContext(connection) as cold:
+                    self.client.get(reverse(name))
+                with CaptureQueriesContext(connection) as warm:
+                    self.client.get(reverse(name))
+                self.assertLess(len(warm), len(cold))
+
+
+class SharedCacheCheckTest(SimpleTestCase):
+
+    @override_settings(DEBUG=False, CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    })
+    def test_process_local_cache_warns(self):
+        self.assertEqual([e.id for e in check_shared_cache(None) if isinstance(e, Warning)], ['core.W001'])
+
+    @override_settings(DEBUG=False, CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://localhost:6379"}
+    })
+    def test_shared_cache_passes(self):
+        self.assertEqual(check_shared_cache(None), [])
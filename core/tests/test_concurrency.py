@@ -0,0 +1,44 @@
+import threading
+import time
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from ..services.concurrency import run_concurrently
+
+
+class RunConcurrentlyTest(SimpleTestCase):
+    def test_returns_results_in_order(self):
+        def slow(value, delay):
+            time.sleep(delay)
+            return value
+
+        results = run_concurrently(
+            lambda: slow("a", 0.05),
+            lambda: slow("b", 0.01),
+            lambda: slow("c", 0),
+        )
+        self.assertEqual(results, ["a", "b", "c"])
+
+    def test_calls_overlap_in_time(self):
+        start = time.monotonic()
+        run_concurrently(*(lambda: time.sleep(0.2) for _ in range(3)))
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_exceptions_propagate(self):
+        def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            run_concurrently(lambda: 1, fail)
+
+    @override_settings(DASHBOARD_MAX_WORKERS=1)
+    def test_serial_when_disabled(self):
+        idents = run_concurrently(threading.get_ident, threading.get_ident)
+        self.assertEqual(set(idents), {threading.get_ident()})
+
+
+class RunConcurrentlyAtomicTest(TestCase):
+    def test_serial_inside_transaction(self):
+        # Dentro de una transacción otro hilo no vería los datos sin confirmar
+        idents = run_concurrently(threading.get_ident, threading.get_ident)
+        self.assertEqual(set(idents), {threading.get_ident()})
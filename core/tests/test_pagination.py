@@ -0,0 +1,35 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+
+from ..services.pagination import EstimatedCountPaginator, estimate_count
+
+User = get_user_model()
+
+
+class EstimatedCountPaginatorTest(TestCase):
+
+    def setUp(self):
+        User.objects.bulk_create([User(username=f"user{i}") for i in range(30)])
+
+    def test_small_results_use_exact_count(self):
+        paginator = EstimatedCountPaginator(User.objects.order_by('pk'), 10)
+        self.assertEqual(paginator.count, 30)
+        self.assertEqual(paginator.num_pages, 3)
+
+    @skipUnless(connection.vendor != 'postgresql', "Solo motores sin estimación")
+    def test_other_backends_have_no_estimate(self):
+        self.assertIsNone(estimate_count(User.objects.all()))
+
+    @skipUnless(connection.vendor == 'postgresql', "Requiere PostgreSQL")
+    @override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=0)
+    def test_postgresql_uses_planner_estimate(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {User._meta.db_table}")
+        qs = User.objects.filter(username__startswith="user").order_by('pk')
+        with self.assertNumQueries(1):
+            count = EstimatedCountPaginator(qs, 10).count
+        self.assertGreater(count, 0)
+        self.assertEqual(estimate_count(User.objects.all()), 30)
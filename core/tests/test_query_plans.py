@@ -0,0 +1,85 @@
+from unittest import skipUnless
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.db import connection
+from datetime import date
+
+from core.services.timeseries import month_bounds, year_bounds
+from finances.models import SubCategory, Transaction, MonthlyCategoryRollup
+from finances.services.search import _match_prefixes, filter_transactions
+from holdings.models import BankAccount, AccountBalanceSnapshot
+from investments.models import Asset, AssetHistory
+from investments.models import Transaction as InvestmentTransaction
+
+User = get_user_model()
+
+
+@skipUnless(connection.vendor == "postgresql", "EXPLAIN checks require PostgreSQL")
+class QueryPlanIndexTest(TestCase):
+    """
+    Con seq scans desactivados, el planificador solo evita un Seq Scan si
+    existe un índice utilizable para el filtro usuario/cuenta/activo + fecha.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="test", password="1234")
+        self.account = BankAccount.objects.create(
+            user=self.user, name="Cash", institution="Bank", account_type="CHECKING"
+        )
+        self.asset = Asset.objects.create(user=self.user, name="ETF", category="INDEX_FUND")
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assert_uses_index(self, qs, index_name=None):
+        plan = qs.explain()
+        self.assertNotIn(f"Seq Scan on {qs.model._meta.db_table}", plan)
+        if index_name:
+            self.assertIn(index_name, plan)
+
+    def test_summary_transactions_use_user_date_index(self):
+        start, end = month_bounds(2024, 1)
+        self.assert_uses_index(
+            Transaction.objects.filter(user=self.user, date__gte=start, date__lt=end),
+            "fin_tx_user_date_id_idx",
+        )
+
+    def test_transaction_keyset_page_uses_date_id_index(self):
+        start, end = month_bounds(2024, 1)
+        qs = Transaction.objects.filter(
+            user=self.user, date__gte=start, date__lt=end
+        ).order_by('-date', '-id')[:51]
+        self.assert_uses_index(qs, "fin_tx_user_date_id_idx")
+
+    def test_description_search_uses_full_text_index(self):
+        self.assert_uses_index(
+            filter_transactions(Transaction.objects.all(), "mercadona semana"),
+            "fin_tx_desc_search_idx",
+        )
+
+    def test_subcategory_search_uses_full_text_index(self):
+        # La subconsulta de filter_by_subcategory: con pocas transacciones el
+        # planificador puede recorrerlas por la clave ajena en lugar de usarla
+        subcategories, _ = _match_prefixes(SubCategory.objects.all(), "name", ["super"])
+        self.assert_uses_index(subcategories, "fin_subcat_name_search_idx")
+
+    def test_report_rollup_uses_user_month_index(self):
+        start, end = year_bounds(2024)
+        self.assert_uses_index(
+            MonthlyCategoryRollup.objects.filter(user=self.user, month__gte=start, month__lt=end)
+        )
+
+    def test_dashboard_lookups_use_asset_and_account_indexes(self):
+        cutoff = date(2024, 12, 31)
+        self.assert_uses_index(
+            InvestmentTransaction.objects.filter(asset=self.asset, date__lte=cutoff),
+            "inv_tx_asset_date_idx",
+        )
+        self.assert_uses_index(
+            AssetHistory.objects.filter(asset=self.asset, date__lte=cutoff).order_by("-date"),
+            "inv_hist_asset_date_idx",
+        )
+        self.assert_uses_index(
+            AccountBalanceSnapshot.objects.filter(account=self.account, date__lte=cutoff).order_by("-date")
+        )
@@ -1,6 +1,10 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
+# Bajo ASGI (settings.ASYNC_VIEWS) se sirven las variantes async
+ASYNC = settings.ASYNC_VIEWS
+
 urlpatterns = [
-    path('home', views.home, name='home'),
+    path('home', views.home_async if ASYNC else views.home, name='home'),
 ]
\ No newline at end of file
@@ -1,19 +1,31 @@
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 
+from core.decorators import async_login_required
+from core.services.concurrency import run_in_pool
 from core.services.net_worth import calculate_net_worth
-from holdings.services.history import get_net_worth_evolution
 
 
 @login_required
 def home(request):
-    net_worth_history = get_net_worth_evolution(request.user)
+    # La serie de patrimonio la pide la plantilla a api:net_worth tras renderizar
     net_worth = calculate_net_worth(request.user)
 
     context = {
-        "net_worth_history": net_worth_history,
         **net_worth,
         "user_name": request.user.username,
     }
 
     return render(request, "core/index.html", context)
+
+
+@async_login_required
+async def home_async(request):
+    net_worth = await run_in_pool(calculate_net_worth, request.user)
+
+    context = {
+        **net_worth,
+        "user_name": request.user.username,
+    }
+
+    return await run_in_pool(render, request, "core/index.html", context)
@@ -1,30 +1,43 @@
 import calendar
 from decimal import Decimal
 
+from django.conf import settings
 from django.contrib import admin
 from django.contrib.admin import SimpleListFilter
-from django.db.models import Sum
+from django.contrib.admin.views.main import ORDER_VAR, PAGE_VAR
+from django.db.models import Q, Sum
 from django.utils.translation import gettext_lazy as _
 
-from .models import Category, SubCategory, Location, Transaction
+from core.services.cache import get_or_set_per_user
+from core.services.pagination import EstimatedCountPaginator
+from core.services.timeseries import month_bounds, year_bounds
+from .models import Category, SubCategory, Location, Transaction, MonthlyCategoryRollup
+from .services.search import filter_by_subcategory, filter_transactions
 
 
 # ======================================================
 # FILTROS DE FECHA
 # ======================================================
 
+def _rollup_years(request):
+    # El agregado mensual tiene una fila por mes y subcategoría: mucho más barato que las transacciones
+    qs = MonthlyCategoryRollup.objects.all()
+    if not request.user.is_superuser:
+        qs = qs.filter(user=request.user)
+    return [y.year for y in qs.dates('month', 'year')]
+
+
 class YearFilter(SimpleListFilter):
     title = _('year')
     parameter_name = 'year'
 
     def lookups(self, request, model_admin):
-        qs = model_admin.get_queryset(request)
-        years = qs.dates('date', 'year')
-        return [(y.year, y.year) for y in years]
+        return [(year, year) for year in _rollup_years(request)]
 
     def queryset(self, request, queryset):
         if self.value():
-            return queryset.filter(date__year=self.value())
+            start, end = year_bounds(int(self.value()))
+            return queryset.filter(date__gte=start, date__lt=end)
         return queryset
 
 
@@ -36,9 +49,22 @@ class MonthFilter(SimpleListFilter):
         return [(i, _(calendar.month_name[i])) for i in range(1, 13)]
 
     def queryset(self, request, queryset):
-        if self.value():
-            return queryset.filter(date__month=self.value())
-        return queryset
+        if not self.value():
+            return queryset
+
+        # Rangos de fechas en lugar de EXTRACT(month): usan el índice (user, transaction_type, date).
+        # Con un año seleccionado basta un rango; si no, uno por cada año con datos
+        month = int(self.value())
+        year = request.GET.get(YearFilter.parameter_name)
+        years = [int(year)] if year else _rollup_years(request)
+        if not years:
+            return queryset.none()
+
+        condition = Q()
+        for y in years:
+            start, end = month_bounds(y, month)
+            condition |= Q(date__gte=start, date__lt=end)
+        return queryset.filter(condition)
 
 
 class TransactionTypeFilter(SimpleListFilter):
@@ -53,9 +79,7 @@ class TransactionTypeFilter(SimpleListFilter):
 
     def queryset(self, request, queryset):
         if self.value():
-            return queryset.filter(
-                subcategory__parent_category__transaction_type=self.value()
-            )
+            return queryset.filter(transaction_type=self.value())
         return queryset
 
 
@@ -70,18 +94,29 @@ class SubCategorySearchFilter(SimpleListFilter):
     def lookups(self, request, model_admin):
         return ()
 
+    def has_output(self):
+        # Sin lookups el changelist descartaría el filtro y nunca se aplicaría
+        return True
+
     def queryset(self, request, queryset):
         value = self.value()
         if value:
-            return queryset.filter(subcategory__name__icontains=value)
+            # Prefijos de palabra sobre el índice de texto completo de SubCategory
+            return filter_by_subcategory(queryset, value)
         return queryset
 
     def choices(self, changelist):
         yield {
-            'selected': False,
-            'query_string': '',
-            'display': '',
+            'selected': self.value() is None,
+            'query_string': changelist.get_query_string(remove=[self.parameter_name]),
+            'display': _('All'),
         }
+        if self.value():
+            yield {
+                'selected': True,
+                'query_string': changelist.get_query_string({self.parameter_name: self.value()}),
+                'display': self.value(),
+            }
 
 
 # ======================================================
@@ -218,9 +253,14 @@ class TransactionAdmin(UserOwnedAdmin):
     )
 
     search_fields = ('description',)
+    search_help_text = _('Matches descriptions containing every word as a word prefix (e.g. "merc week").')
     autocomplete_fields = ('subcategory', 'location')
     ordering = ('-date',)
 
+    # Evita el COUNT(*) sin filtros y estima el total en listados muy grandes
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_select_related = (
         'user',
         'subcategory',
@@ -230,18 +270,42 @@ class TransactionAdmin(UserOwnedAdmin):
 
     @admin.display(description=_('Type'))
     def transaction_type(self, obj):
-        return obj.subcategory.parent_category.transaction_type
+        return obj.transaction_type
 
     @admin.display(description=_('Category'))
     def category(self, obj):
         return obj.subcategory.parent_category.name
 
+    def get_search_results(self, request, queryset, search_term):
+        # Búsqueda por prefijos de palabra respaldada por el índice de texto completo
+        if not search_term:
+            return queryset, False
+        return filter_transactions(queryset, search_term), False
+
+    def get_total_amount(self, request, qs):
+        def compute():
+            return qs.aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
+
+        # El superusuario ve transacciones de todos: la versión de sus propios
+        # datos no cambia cuando otro usuario edita las suyas, así que no se cachea
+        if request.user.is_superuser:
+            return compute()
+
+        # Cacheado unos segundos por usuario, versión de sus datos y filtros activos
+        params = sorted(
+            (key, values) for key, values in request.GET.lists()
+            if key not in (PAGE_VAR, ORDER_VAR)
+        )
+        return get_or_set_per_user(
+            request.user, "admin_transaction_total", params, compute,
+            timeout=settings.ADMIN_TOTALS_CACHE_TIMEOUT,
+        )
+
     def changelist_view(self, request, extra_context=None):
         response = super().changelist_view(request, extra_context)
         try:
             qs = response.context_data['cl'].queryset
-            total = qs.aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
-            response.context_data['total_amount'] = total
+            response.context_data['total_amount'] = self.get_total_amount(request, qs)
         except Exception:
             pass
         return response
@@ -0,0 +1,256 @@
+import csv
+import json
+import os
+import re
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core.services.cache import invalidate_user_cache
+from finances.models import Category, SubCategory, Transaction
+from finances.services.rollups import rebuild_rollups
+
+MONTHS_EN = {
+    1: "January", 2: "February", 3: "March", 4: "April",
+    5: "May", 6: "June", 7: "July", 8: "August",
+    9: "September", 10: "October", 11: "November", 12: "December"
+}
+EMPTY_VALUES = {"", "0", "0,0", "0,00", "0.0", "0.00", "...", "-"}
+# Con decimal_comma, "2.450" o "-1.250.000" solo llevan separadores de miles
+THOUSANDS_ONLY = re.compile(r'^-?\d{1,3}(\.\d{3})+$')
+# Nombre de subcategoría presente en varias categorías del usuario
+AMBIGUOUS = object()
+
+
+class Command(BaseCommand):
+    help = (
+        'Importa transacciones desde cualquier CSV con un mapeo declarativo (JSON). '
+        'Soporta una fila por transacción ("rows") o una fila por concepto con 12 columnas mensuales ("monthly").'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', type=str, help='Ruta al archivo CSV')
+        parser.add_argument('--mapping', type=str, help='Ruta al JSON con el mapeo (ver scripts/data_imports/mappings)')
+        parser.add_argument('--user', type=str, help='Username propietario (por defecto, el primer superusuario)')
+        parser.add_argument('--batch-size', type=int, default=2000, help='Filas por cada bulk_create')
+        # Atajos para el layout "rows" sin escribir un JSON
+        parser.add_argument('--delimiter', type=str)
+        parser.add_argument('--date-column', type=str)
+        parser.add_argument('--date-format', type=str)
+        parser.add_argument('--amount-column', type=str)
+        parser.add_argument('--category-column', type=str)
+        parser.add_argument('--subcategory-column', type=str)
+        parser.add_argument('--description-column', type=str)
+
+    def handle(self, *args, **options):
+        file_path = options['file']
+        if not os.path.exists(file_path):
+            raise CommandError(f'Archivo no encontrado: {file_path}')
+
+        User = get_user_model()
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+        else:
+            user = User.objects.filter(is_superuser=True).first()
+        if not user:
+            raise CommandError('Usuario no encontrado.')
+
+        self.mapping = self.load_mapping(options)
+        self.user = user
+        self.categories = {c.name: c for c in Category.objects.filter(user=user)}
+        self.subcategories = {}
+        self.subcategories_by_name = {}
+        for subcategory in SubCategory.objects.filter(user=user).select_related('parent_category'):
+            self.cache_subcategory(subcategory)
+
+        batch_size = options['batch_size']
+        created = 0
+        skipped = 0
+        dates = []
+        pending = []
+
+        with open(file_path, mode='r', encoding=self.mapping.get('encoding', 'utf-8-sig')) as f, transaction.atomic():
+            reader = csv.reader(f, delimiter=self.mapping.get('delimiter', ';'))
+            if self.mapping.get('layout', 'rows') == 'monthly':
+                parsed_rows = self.iter_monthly(reader)
+            else:
+                parsed_rows = self.iter_rows(reader)
+
+            for parsed in parsed_rows:
+                if parsed is None:
+                    skipped += 1
+                    continue
+
+                tx_date, amount, subcategory, description = parsed
+                pending.append(Transaction(
+                    user=user,
+                    date=tx_date,
+                    amount=amount,
+                    description=description,
+                    subcategory=subcategory
+                ))
+                dates.append(tx_date)
+
+                if len(pending) >= batch_size:
+                    created += self.flush(pending)
+                    pending = []
+
+            if pending:
+                created += self.flush(pending)
+
+            # bulk_create no dispara señales: actualizamos agregados y caché
+            if dates:
+                rebuild_rollups(user, min(dates), max(dates))
+
+        invalidate_user_cache(user)
+
+        self.stdout.write(self.style.SUCCESS(f'Éxito: Se crearon {created} transacciones.'))
+        if skipped:
+            self.stdout.write(self.style.WARNING(f'Filas omitidas (sin mapeo, incompletas o con valor inválido): {skipped}'))
+
+    # --- Mapeo ---
+    def load_mapping(self, options):
+        mapping = {}
+        if options['mapping']:
+            with open(options['mapping'], encoding='utf-8') as f:
+                mapping = json.load(f)
+
+        columns = mapping.setdefault('columns', {})
+        for field in ('date', 'amount', 'category', 'subcategory', 'description'):
+            if options[f'{field}_column']:
+                columns[field] = options[f'{field}_column']
+        if options['date_format']:
+            mapping['date_format'] = options['date_format']
+        if options['delimiter']:
+            mapping['delimiter'] = options['delimiter']
+
+        if mapping.get('layout', 'rows') == 'rows':
+            missing = [field for field in ('date', 'amount') if field not in columns]
+            if missing or not ('subcategory' in columns or 'category' in columns):
+                raise CommandError('El mapeo "rows" necesita columnas date, amount y subcategory/category.')
+        elif 'items' not in mapping or 'year' not in mapping:
+            raise CommandError('El mapeo "monthly" necesita "year" e "items".')
+
+        return mapping
+
+    def resolve_subcategory(self, category_name, subcategory_name):
+        """Resuelve (y crea si hace falta) categoría y subcategoría usando la caché local."""
+        key = (category_name, subcategory_name)
+        if key in self.subcategories:
+            return self.subcategories[key]
+
+        category = self.categories.get(category_name)
+        if category is None:
+            defaults = {'transaction_type': 'EXPENSE', 'expense_type': 'VARIABLE'}
+            defaults.update(self.mapping.get('categories', {}).get(category_name, {}))
+            category = Category.objects.create(user=self.user, name=category_name, **defaults)
+            self.categories[category_name] = category
+
+        subcategory = SubCategory.objects.create(user=self.user, parent_category=category, name=subcategory_name)
+        self.cache_subcategory(subcategory)
+        return subcategory
+
+    def cache_subcategory(self, subcategory):
+        self.subcategories[(subcategory.parent_category.name, subcategory.name)] = subcategory
+        known = self.subcategories_by_name.get(subcategory.name)
+        self.subcategories_by_name[subcategory.name] = subcategory if known is None else AMBIGUOUS
+
+    def find_subcategory(self, subcategory_name):
+        """Subcategoría por nombre, sin categoría: el nombre debe ser único."""
+        subcategory = self.subcategories_by_name.get(subcategory_name)
+        if subcategory is AMBIGUOUS:
+            raise CommandError(
+                f'La subcategoría "{subcategory_name}" existe en varias categorías: '
+                'añade la columna de categoría o un alias en el mapeo.'
+            )
+        return subcategory
+
+    # --- Parsers ---
+    def parse_amount(self, raw):
+        value = (raw or '').strip()
+        if value in EMPTY_VALUES:
+            return None
+        if self.mapping.get('decimal_comma', True):
+            if ',' in value or THOUSANDS_ONLY.match(value):
+                value = value.replace('.', '').replace(',', '.')
+        try:
+            amount = Decimal(value).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        except InvalidOperation:
+            return None
+        return amount or None
+
+    def iter_rows(self, reader):
+        columns = self.mapping['columns']
+        header = [h.strip() for h in next(reader, [])]
+        missing = [name for name in columns.values() if name not in header]
+        if missing:
+            raise CommandError(f'Columnas del mapeo ausentes en la cabecera del CSV: {", ".join(missing)}')
+        index = {field: header.index(name) for field, name in columns.items()}
+        min_length = max(index.values()) + 1
+        aliases = {key.lower(): value for key, value in self.mapping.get('subcategories', {}).items()}
+        date_format = self.mapping.get('date_format', '%Y-%m-%d')
+
+        for row in reader:
+            if not row or not any(cell.strip() for cell in row):
+                continue
+            if len(row) < min_length:
+                # Fila incompleta: se cuenta como omitida
+                yield None
+                continue
+            try:
+                tx_date = datetime.strptime(row[index['date']].strip(), date_format).date()
+            except ValueError:
+                yield None
+                continue
+
+            amount = self.parse_amount(row[index['amount']])
+            raw_sub = row[index['subcategory']].strip() if 'subcategory' in index else ''
+            raw_cat = row[index['category']].strip() if 'category' in index else ''
+            description = row[index['description']].strip() if 'description' in index else ''
+
+            if raw_sub.lower() in aliases:
+                subcategory = self.resolve_subcategory(*aliases[raw_sub.lower()])
+            elif raw_cat:
+                subcategory = self.resolve_subcategory(raw_cat, raw_sub or raw_cat)
+            else:
+                subcategory = self.find_subcategory(raw_sub)
+
+            if amount is None or subcategory is None:
+                yield None
+                continue
+
+            yield tx_date, amount, subcategory, description
+
+    def iter_monthly(self, reader):
+        items = {key.lower(): item for key, item in self.mapping['items'].items()}
+        default_item = self.mapping.get('default_item')
+        year = self.mapping['year']
+        day = self.mapping.get('day', 1)
+
+        for row in reader:
+            if not row or len(row) < 2:
+                continue
+
+            raw_name = row[0].strip()
+            item = items.get(raw_name.lower(), default_item)
+            if item is None:
+                # Filas de cabecera o conceptos sin mapeo
+                continue
+
+            subcategory = self.resolve_subcategory(item['category'], item['subcategory'])
+            template = item.get('description', '{name}')
+
+            for month_idx, value_str in enumerate(row[1:13], start=1):
+                amount = self.parse_amount(value_str)
+                if amount is None:
+                    continue
+                description = template.format(name=raw_name, month=MONTHS_EN[month_idx])
+                yield date(year, month_idx, day), amount, subcategory, description
+
+    def flush(self, pending):
+        # Misma normalización de signos que Transaction.save, con los tipos ya en memoria
+        categories = {tx.subcategory_id: tx.subcategory.parent_category for tx in pending}
+        return len(Transaction.objects.bulk_create(Transaction.normalize_signs(pending, categories)))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from core.services.cache import invalidate_user_cache
+from finances.services.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el agregado mensual (MonthlyCategoryRollup) desde las transacciones'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=str, help='Username a reconstruir (por defecto, todos)')
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        user = None
+        if options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"Usuario no encontrado: {options['user']}")
+
+        with transaction.atomic():
+            created = rebuild_rollups(user)
+
+            # Los datos cacheados (índice de periodos, gráficas) se leen del agregado
+            user_ids = [user.pk] if user else User.objects.values_list('pk', flat=True)
+            for user_id in user_ids:
+                invalidate_user_cache(user_id)
+
+        self.stdout.write(self.style.SUCCESS(f'Agregado reconstruido: {created} filas.'))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from core.services.cache import invalidate_user_cache
+from finances.models import Transaction
+from finances.services.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = 'Recopia tipo, tipo de gasto y vivienda de la categoría en cada transacción'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=str, help='Username a sincronizar (por defecto, todos)')
+
+    def handle(self, *args, **options):
+        filters = {}
+        if options['user']:
+            User = get_user_model()
+            try:
+                filters['user'] = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"Usuario no encontrado: {options['user']}")
+
+        with transaction.atomic():
+            updated = Transaction.objects.sync_category_attributes(**filters)
+
+            # QuerySet.update no dispara señales: agregados y caché de cada usuario a mano
+            user_ids = Transaction.objects.filter(**filters).values_list('user_id', flat=True).distinct()
+            for user_id in user_ids.order_by():
+                rebuild_rollups(user_id)
+                invalidate_user_cache(user_id)
+
+        self.stdout.write(self.style.SUCCESS(f'Transacciones sincronizadas: {updated}.'))
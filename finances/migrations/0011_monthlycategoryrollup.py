@@ -0,0 +1,74 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:58
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+
+def populate_rollups(apps, schema_editor):
+    # Carga inicial del agregado con las transacciones existentes
+    Transaction = apps.get_model('finances', 'Transaction')
+    MonthlyCategoryRollup = apps.get_model('finances', 'MonthlyCategoryRollup')
+
+    rows = (
+        Transaction.objects.order_by()
+        .annotate(month=TruncMonth('date'))
+        .values(
+            'user_id',
+            'month',
+            'subcategory_id',
+            'subcategory__parent_category_id',
+            'subcategory__parent_category__transaction_type',
+            'subcategory__parent_category__expense_type',
+            'subcategory__parent_category__is_housing',
+        )
+        .annotate(total=Sum('amount'), count=Count('id'))
+    )
+
+    MonthlyCategoryRollup.objects.bulk_create([
+        MonthlyCategoryRollup(
+            user_id=row['user_id'],
+            month=row['month'],
+            subcategory_id=row['subcategory_id'],
+            category_id=row['subcategory__parent_category_id'],
+            transaction_type=row['subcategory__parent_category__transaction_type'],
+            expense_type=row['subcategory__parent_category__expense_type'],
+            is_housing=row['subcategory__parent_category__is_housing'],
+            total=row['total'],
+            count=row['count'],
+        )
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('finances', '0010_alter_subcategory_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyCategoryRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='Primer día del mes')),
+                ('transaction_type', models.CharField(choices=[('INCOME', 'Income'), ('EXPENSE', 'Expense')], max_length=10)),
+                ('expense_type', models.CharField(choices=[('FIXED', 'Fixed'), ('VARIABLE', 'Variable'), ('N/A', 'Not Applicable')], max_length=10)),
+                ('is_housing', models.BooleanField(default=False)),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to='finances.category')),
+                ('subcategory', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to='finances.subcategory')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-month'],
+                'unique_together': {('user', 'month', 'subcategory')},
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0011_monthlycategoryrollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'date'], name='fin_tx_user_date_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:09
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_category_attributes(apps, schema_editor):
+    # Rellena los atributos desnormalizados de las transacciones existentes
+    Transaction = apps.get_model('finances', 'Transaction')
+    Category = apps.get_model('finances', 'Category')
+
+    category = Category.objects.filter(subcategories=OuterRef('subcategory_id'))
+    Transaction.objects.update(**{
+        field: Subquery(category.values(field)[:1])
+        for field in ('transaction_type', 'expense_type', 'is_housing')
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0012_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='expense_type',
+            field=models.CharField(choices=[('FIXED', 'Fixed'), ('VARIABLE', 'Variable'), ('N/A', 'Not Applicable')], default='VARIABLE', editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name='transaction',
+            name='is_housing',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='transaction',
+            name='transaction_type',
+            field=models.CharField(choices=[('INCOME', 'Income'), ('EXPENSE', 'Expense')], default='EXPENSE', editable=False, max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'transaction_type', 'date'], name='fin_tx_user_type_date_idx'),
+        ),
+        migrations.RunPython(copy_category_attributes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+# Índice de texto completo solo en PostgreSQL; en SQLite la búsqueda usa REGEXP.
+# La expresión debe coincidir con SearchVector('description', config='simple')
+INDEX_NAME = 'fin_tx_desc_search_idx'
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON finances_transaction "
+        "USING gin (to_tsvector('simple'::regconfig, COALESCE((description)::text, '')))"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0013_transaction_category_attributes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
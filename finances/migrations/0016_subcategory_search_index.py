@@ -0,0 +1,32 @@
+from django.db import migrations
+
+# Índice de texto completo solo en PostgreSQL, como el de 0014.
+# La expresión debe coincidir con SearchVector('name', config='simple'),
+# que en un CharField aplica el COALESCE antes del cast a text
+INDEX_NAME = 'fin_subcat_name_search_idx'
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON finances_subcategory "
+        "USING gin (to_tsvector('simple'::regconfig, (COALESCE(name, ''::character varying))::text))"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finances', '0015_transaction_keyset_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
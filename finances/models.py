@@ -1,4 +1,6 @@
-from django.db import models
+from collections import defaultdict
+
+from django.db import models, transaction
 from django.conf import settings
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
@@ -74,7 +76,71 @@ class Location(models.Model):
     def __str__(self):
         return f"{self.name} ({self.user.username})"
 
+class TransactionManager(models.Manager):
+
+    def bulk_create_normalized(self, objs, refresh=True, **kwargs):
+        """
+        bulk_create aplicando antes la misma normalización que save(). Como
+        no hay señales, con refresh=True recalcula los agregados de los meses
+        afectados e invalida la caché de sus usuarios; con refresh=False lo
+        debe hacer quien llama (p.ej. una vez al final de una importación).
+        """
+        objs = self.model.normalize_signs(objs)
+        if not refresh:
+            return self.bulk_create(objs, **kwargs)
+
+        with transaction.atomic(using=self.db):
+            created = self.bulk_create(objs, **kwargs)
+            self._refresh_derived_data(created)
+        return created
+
+    def bulk_update_normalized(self, objs, fields, refresh=True, **kwargs):
+        """bulk_update con la normalización de save() y el mismo refresh que bulk_create_normalized."""
+        objs = self.model.normalize_signs(objs)
+        fields = list(fields)
+        for field in ('amount',) + self.model.CATEGORY_FIELDS:
+            if field not in fields:
+                fields.append(field)
+
+        if not refresh:
+            return self.bulk_update(objs, fields, **kwargs)
+
+        with transaction.atomic(using=self.db):
+            # Los meses de antes de la edición también cambian si se mueve la fecha
+            previous = list(self.filter(pk__in=[tx.pk for tx in objs]).values_list('user_id', 'date'))
+            updated = self.bulk_update(objs, fields, **kwargs)
+            self._refresh_derived_data(objs, previous)
+        return updated
+
+    def _refresh_derived_data(self, transactions, extra_dates=()):
+        from core.services.cache import invalidate_user_cache
+        from .services.rollups import rebuild_rollups
+
+        dates_by_user = defaultdict(list)
+        for tx in transactions:
+            dates_by_user[tx.user_id].append(tx.date)
+        for user_id, tx_date in extra_dates:
+            dates_by_user[user_id].append(tx_date)
+
+        for user_id, dates in dates_by_user.items():
+            rebuild_rollups(user_id, min(dates), max(dates))
+            invalidate_user_cache(user_id)
+
+    def sync_category_attributes(self, **filters):
+        """
+        Recopia los atributos de la categoría en las transacciones filtradas
+        con un único UPDATE. Devuelve el número de filas actualizadas.
+        """
+        category = Category.objects.filter(subcategories=models.OuterRef('subcategory_id'))
+        return self.filter(**filters).update(**{
+            field: models.Subquery(category.values(field)[:1])
+            for field in self.model.CATEGORY_FIELDS
+        })
+
 class Transaction(models.Model):
+    # Atributos de la categoría copiados en la transacción para agregar sin joins
+    CATEGORY_FIELDS = ('transaction_type', 'expense_type', 'is_housing')
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, 
         on_delete=models.CASCADE, 
@@ -86,11 +152,86 @@ class Transaction(models.Model):
     
     subcategory = models.ForeignKey(SubCategory, on_delete=models.PROTECT, related_name='transactions')
     location = models.ForeignKey(Location, on_delete=models.SET_NULL, null=True, blank=True)
+    transaction_type = models.CharField(
+        max_length=10, choices=Category.TRANSACTION_TYPES, editable=False, default='EXPENSE'
+    )
+    expense_type = models.CharField(
+        max_length=10, choices=Category.EXPENSE_TYPES, editable=False, default='VARIABLE'
+    )
+    is_housing = models.BooleanField(default=False, editable=False)
+
+    objects = TransactionManager()
 
     class Meta:
         ordering = ['-date']
+        indexes = [
+            models.Index(fields=['user', 'transaction_type', 'date'], name='fin_tx_user_type_date_idx'),
+            # Sirve a los rangos de fechas y a la paginación por clave (date DESC, id DESC)
+            models.Index(fields=['user', '-date', '-id'], name='fin_tx_user_date_id_idx'),
+        ]
+
+    @staticmethod
+    def signed_amount(amount, category_type):
+        return -abs(amount) if category_type == 'EXPENSE' else abs(amount)
+
+    @classmethod
+    def normalize_signs(cls, transactions, categories=None):
+        """
+        Aplica la regla de signos a un lote y copia los atributos de la
+        categoría. Las categorías se resuelven con una sola consulta salvo
+        que se pasen ya cacheadas como {subcategory_id: Category}.
+        """
+        transactions = list(transactions)
+        if categories is None:
+            subcategory_ids = {tx.subcategory_id for tx in transactions}
+            categories = {
+                sub.pk: sub.parent_category
+                for sub in SubCategory.objects.filter(pk__in=subcategory_ids).select_related('parent_category')
+            }
+        for tx in transactions:
+            tx.apply_category(categories[tx.subcategory_id])
+        return transactions
+
+    def apply_category(self, category):
+        self.amount = self.signed_amount(self.amount, category.transaction_type)
+        for field in self.CATEGORY_FIELDS:
+            setattr(self, field, getattr(category, field))
+
+    def _category(self):
+        # Si la relación no está en memoria basta una consulta con join
+        if self.subcategory_id and not Transaction.subcategory.is_cached(self):
+            return Category.objects.only(*self.CATEGORY_FIELDS).get(subcategories=self.subcategory_id)
+        return self.subcategory.parent_category
 
     def save(self, *args, **kwargs):
-        category_type = self.subcategory.parent_category.transaction_type
-        self.amount = -abs(self.amount) if category_type == 'EXPENSE' else abs(self.amount)
-        super().save(*args, **kwargs)
\ No newline at end of file
+        self.apply_category(self._category())
+        super().save(*args, **kwargs)
+
+class MonthlyCategoryRollup(models.Model):
+    """
+    Agregado mensual de transacciones por subcategoría, mantenido por las
+    señales de finances.signals (ver finances.services.rollups).
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='monthly_rollups'
+    )
+    month = models.DateField(help_text="Primer día del mes")
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='monthly_rollups')
+    subcategory = models.ForeignKey(SubCategory, on_delete=models.CASCADE, related_name='monthly_rollups')
+
+    # Copia de los atributos de la categoría para agregar sin joins
+    transaction_type = models.CharField(max_length=10, choices=Category.TRANSACTION_TYPES)
+    expense_type = models.CharField(max_length=10, choices=Category.EXPENSE_TYPES)
+    is_housing = models.BooleanField(default=False)
+
+    total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-month']
+        unique_together = ('user', 'month', 'subcategory')
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} {self.subcategory.name}: {self.total} ({self.count})"
@@ -1,37 +1,56 @@
 # finances/services/api.py
-from . import queries, metrics # Importamos tus utilidades internas existentes
+from . import queries, metrics, rollups # Importamos tus utilidades internas existentes
 from datetime import date
 
-def get_annual_cashflow_summary(user, year):
+from core.services.cache import cached_per_user
+from core.services.timeseries import month_range
+
+@cached_per_user("cashflow_summary")
+def get_cashflow_summary(user, start_date, end_date):
     """
-    Devuelve el desglose de ingresos, gastos y ahorro mes a mes.
+    Desglose mensual de ingresos, gastos y ahorro entre dos fechas
+    (meses completos), leído del agregado mensual con una única consulta.
     """
+    months = month_range(start_date, end_date)
+    if not months:
+        return []
+
+    period_qs = rollups.get_rollup_qs(user).filter(
+        month__gte=months[0],
+        month__lte=months[-1]
+    )
+    stats_by_month = metrics.get_monthly_metrics(period_qs)
+    empty_stats = metrics.empty_metrics()
+
     monthly_data = []
-    
-    for month in range(1, 13):
-        base_qs = queries.get_base_transaction_qs(user)
-        period_qs = base_qs.filter(date__year=year, date__month=month)
-        
-        stats = metrics.get_period_metrics(period_qs)
-        
+    for month_date in months:
+        stats = stats_by_month.get(month_date, empty_stats)
+
         # Calcular tasa de ahorro
         savings_rate = 0
         if stats["income"] > 0:
             savings_rate = (stats["savings"] / stats["income"]) * 100
 
         monthly_data.append({
-            "month": month,
-            "date_obj": date(year, month, 1),
+            "month": month_date.month,
+            "date_obj": month_date,
             "income": stats["income"],
             "expenses": stats["expenses"],
             "fixed": stats["fixed"],
             "variable": stats["variable"],
+            "no_housing": stats["no_housing"],
             "savings": stats["savings"],
             "savings_rate": savings_rate
         })
-        
+
     return monthly_data
 
+def get_annual_cashflow_summary(user, year):
+    """
+    Devuelve el desglose de ingresos, gastos y ahorro mes a mes.
+    """
+    return get_cashflow_summary(user, date(year, 1, 1), date(year, 12, 31))
+
 def get_available_transaction_years(user):
     """Exponemos la lista de años disponibles"""
-    return queries.get_available_years(user)
\ No newline at end of file
+    return queries.get_available_years(user)
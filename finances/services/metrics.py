@@ -1,22 +1,44 @@
-from django.db.models import Sum, Q
+from django.db.models import F, Sum, Q
+from django.db.models.functions import TruncMonth
 from calendar import month_name
+from datetime import date
+
+from core.services.timeseries import add_months
+from ..models import MonthlyCategoryRollup
+
+# Campos según el origen: transacciones (atributos desnormalizados) o agregado mensual
+TRANSACTION_FIELDS = {
+    "amount": "amount",
+    "category_name": "subcategory__parent_category__name",
+    "month": TruncMonth('date'),
+}
+ROLLUP_FIELDS = {
+    "amount": "total",
+    "category_name": "category__name",
+    "month": F('month'),
+}
+
+def _fields(qs):
+    return ROLLUP_FIELDS if qs.model is MonthlyCategoryRollup else TRANSACTION_FIELDS
 
 def _clean(val):
     return abs(val or 0)
 
-def get_period_metrics(qs):
-    metrics = qs.aggregate(
-        income=Sum('amount', filter=Q(subcategory__parent_category__transaction_type='INCOME')),
-        expenses=Sum('amount', filter=Q(subcategory__parent_category__transaction_type='EXPENSE')),
-        fixed=Sum('amount', filter=Q(subcategory__parent_category__expense_type='FIXED')),
-        variable=Sum('amount', filter=Q(subcategory__parent_category__expense_type='VARIABLE')),
-        no_housing=Sum('amount', filter=Q(subcategory__parent_category__transaction_type='EXPENSE') & 
-                                 Q(subcategory__parent_category__is_housing=False))
-    )
-    
+def _metric_aggregates(fields=TRANSACTION_FIELDS):
+    # Definición única de cada métrica sobre los atributos de la categoría
+    amount = fields["amount"]
+    return {
+        "income": Sum(amount, filter=Q(transaction_type='INCOME')),
+        "expenses": Sum(amount, filter=Q(transaction_type='EXPENSE')),
+        "fixed": Sum(amount, filter=Q(expense_type='FIXED')),
+        "variable": Sum(amount, filter=Q(expense_type='VARIABLE')),
+        "no_housing": Sum(amount, filter=Q(transaction_type='EXPENSE', is_housing=False)),
+    }
+
+def _build_stats(metrics):
     inc = _clean(metrics['income'])
     exp = _clean(metrics['expenses'])
-    
+
     return {
         "income": inc,
         "expenses": exp,
@@ -27,28 +49,87 @@ def get_period_metrics(qs):
         "is_incomplete": (inc - exp) < 0 and inc < 2000
     }
 
+def empty_metrics():
+    return _build_stats(dict.fromkeys(_metric_aggregates()))
+
+def get_period_metrics(qs):
+    """Acepta transacciones o filas de MonthlyCategoryRollup."""
+    return _build_stats(qs.aggregate(**_metric_aggregates(_fields(qs))))
+
+def get_monthly_metrics(qs):
+    """
+    Igual que get_period_metrics pero agrupado por mes en una sola consulta.
+    Devuelve {date(año, mes, 1): stats} solo para los meses con movimientos.
+    """
+    fields = _fields(qs)
+    rows = (
+        qs.order_by()
+        .annotate(month_trunc=fields["month"])
+        .values('month_trunc')
+        .annotate(**_metric_aggregates(fields))
+    )
+    return {row['month_trunc']: _build_stats(row) for row in rows}
+
+def _sum_metrics(rows):
+    # Las métricas son sumas: las de varias filas agrupadas se suman sin recalcular condiciones
+    totals = dict.fromkeys(_metric_aggregates())
+    for row in rows:
+        for key in totals:
+            if row[key] is not None:
+                totals[key] = (totals[key] or 0) + row[key]
+    return totals
+
+def get_summary_window(rollup_qs, month):
+    """
+    KPIs del mes, ingresos del mes anterior y distribución de gastos por
+    categoría con una única consulta sobre el agregado mensual de los dos
+    meses, agrupada por mes y categoría.
+    """
+    previous = add_months(month, -1)
+    rows = list(
+        rollup_qs.filter(month__gte=previous, month__lte=month)
+        .order_by()
+        .values('month', 'category__name')
+        .annotate(**_metric_aggregates(ROLLUP_FIELDS))
+    )
+    current = [row for row in rows if row['month'] == month]
+
+    distribution = sorted(
+        ((row['category__name'], row['expenses']) for row in current if row['expenses'] is not None),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+
+    return {
+        "stats": _build_stats(_sum_metrics(current)),
+        "prev_income": _clean(_sum_metrics(row for row in rows if row['month'] == previous)['income']),
+        "chart": {
+            "labels": [name for name, _ in distribution],
+            "data": [float(_clean(total)) for _, total in distribution],
+        },
+    }
+
 def get_previous_month_income(base_qs, year, month):
-    if month == 1:
-        prev_month, prev_year = 12, year - 1
-    else:
-        prev_month, prev_year = month - 1, year
+    current_month = date(year, month, 1)
 
     data = base_qs.filter(
-        date__year=prev_year,
-        date__month=prev_month,
-        subcategory__parent_category__transaction_type='INCOME'
-    ).aggregate(total=Sum('amount'))
-    
-    return _clean(data['total'])
+        date__gte=add_months(current_month, -1),
+        date__lt=current_month,
+    ).aggregate(income=_metric_aggregates()["income"])
+
+    return _clean(data['income'])
 
 def get_expense_distribution_chart(qs):
-    expense_stats = qs.filter(
-        subcategory__parent_category__transaction_type='EXPENSE'
-    ).values(
-        'subcategory__parent_category__name'
-    ).annotate(total=Sum('amount')).order_by('-total')
+    fields = _fields(qs)
+    expense_stats = (
+        qs.order_by()
+        .values(fields["category_name"])
+        .annotate(total_amount=_metric_aggregates(fields)["expenses"])
+        .filter(total_amount__isnull=False)
+        .order_by('-total_amount')
+    )
 
     return {
-        "labels": [item['subcategory__parent_category__name'] for item in expense_stats],
-        "data": [float(_clean(item['total'])) for item in expense_stats]
-    }
\ No newline at end of file
+        "labels": [item[fields["category_name"]] for item in expense_stats],
+        "data": [float(_clean(item['total_amount'])) for item in expense_stats]
+    }
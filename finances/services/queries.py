@@ -1,17 +1,56 @@
-from django.db.models.functions import ExtractYear, ExtractMonth
-from ..models import Transaction
+from datetime import date
+
+from django.db.models import Q
+from core.services.cache import cached_per_user
+from ..models import Transaction, MonthlyCategoryRollup
 
 def get_base_transaction_qs(user):
     return Transaction.objects.filter(user=user).select_related('subcategory__parent_category')
 
+TRANSACTION_PAGE_SIZE = 50
+
+def encode_cursor(tx):
+    return f"{tx.date.isoformat()}_{tx.pk}"
+
+def decode_cursor(cursor):
+    """Convierte 'AAAA-MM-DD_id' en (date, id). Lanza ValueError si no es válido."""
+    day, _, pk = cursor.partition('_')
+    return date.fromisoformat(day), int(pk)
+
+def get_transaction_page(user, start, end, after=None, limit=TRANSACTION_PAGE_SIZE):
+    """
+    Página de transacciones entre start (incluido) y end (excluido) ordenada
+    por (fecha, id) descendente, paginada por clave: `after` es el cursor de
+    la última fila ya mostrada. Devuelve (filas, cursor siguiente o None).
+    """
+    qs = get_base_transaction_qs(user).filter(date__gte=start, date__lt=end)
+    if after:
+        after_date, after_id = decode_cursor(after)
+        qs = qs.filter(Q(date__lt=after_date) | Q(date=after_date, id__lt=after_id))
+
+    rows = list(qs.order_by('-date', '-id')[:limit + 1])
+    next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
 def get_available_years(user):
-    return get_base_transaction_qs(user).annotate(
-        y=ExtractYear('date')
-    ).values_list('y', flat=True).distinct().order_by('-y')
+    return list(get_period_index(user))
 
 def get_available_months_for_year(user, year):
-    return get_base_transaction_qs(user).filter(
-        date__year=year
-    ).annotate(
-        m=ExtractMonth('date')
-    ).values_list('m', flat=True).distinct().order_by('m')
\ No newline at end of file
+    return get_period_index(user).get(year, [])
+
+@cached_per_user("period_index")
+def get_period_index(user):
+    """
+    Años y meses con movimientos del usuario: {año: [meses]} con los años en
+    orden descendente. Se deriva del agregado mensual (mantenido por las
+    señales al crear y borrar transacciones) recorriendo su índice
+    (user, month, subcategory) y queda cacheado hasta el siguiente cambio.
+    """
+    index = {}
+    months = (
+        MonthlyCategoryRollup.objects.filter(user=user)
+        .order_by('-month').values_list('month', flat=True).distinct()
+    )
+    for month in months:
+        index.setdefault(month.year, []).insert(0, month.month)
+    return index
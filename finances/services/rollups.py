@@ -0,0 +1,118 @@
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+from core.services.timeseries import add_months, month_start
+from ..models import MonthlyCategoryRollup, SubCategory, Transaction
+
+BATCH_SIZE = 1000
+
+
+def get_rollup_qs(user):
+    return MonthlyCategoryRollup.objects.filter(user=user)
+
+
+def refresh_rollup(user_id, month, subcategory_id):
+    """
+    Recalcula la fila del agregado para (usuario, mes, subcategoría) a partir
+    de sus transacciones. Si ya no quedan transacciones la elimina.
+    """
+    month = month_start(month)
+    stats = Transaction.objects.filter(
+        user_id=user_id,
+        subcategory_id=subcategory_id,
+        date__gte=month,
+        date__lt=add_months(month, 1),
+    ).aggregate(total=Sum('amount'), count=Count('id'))
+
+    lookup = {'user_id': user_id, 'month': month, 'subcategory_id': subcategory_id}
+    if not stats['count']:
+        MonthlyCategoryRollup.objects.filter(**lookup).delete()
+        return
+
+    subcategory = SubCategory.objects.select_related('parent_category').get(pk=subcategory_id)
+    category = subcategory.parent_category
+    MonthlyCategoryRollup.objects.update_or_create(
+        **lookup,
+        defaults={
+            'category': category,
+            'transaction_type': category.transaction_type,
+            'expense_type': category.expense_type,
+            'is_housing': category.is_housing,
+            'total': stats['total'],
+            'count': stats['count'],
+        }
+    )
+
+
+def sync_category_attributes(category):
+    MonthlyCategoryRollup.objects.filter(category=category).update(
+        transaction_type=category.transaction_type,
+        expense_type=category.expense_type,
+        is_housing=category.is_housing,
+    )
+
+
+def sync_subcategory_parent(subcategory):
+    category = subcategory.parent_category
+    MonthlyCategoryRollup.objects.filter(subcategory=subcategory).exclude(category=category).update(
+        category=category,
+        transaction_type=category.transaction_type,
+        expense_type=category.expense_type,
+        is_housing=category.is_housing,
+    )
+
+
+def rebuild_rollups(user=None, start_date=None, end_date=None):
+    """
+    Reconstruye el agregado desde cero (opcionalmente para un usuario y/o
+    un rango de meses) con una consulta agrupada y bulk_create.
+    Devuelve el número de filas creadas.
+    """
+    tx_qs = Transaction.objects.all()
+    rollup_qs = MonthlyCategoryRollup.objects.all()
+    if user is not None:
+        tx_qs = tx_qs.filter(user=user)
+        rollup_qs = rollup_qs.filter(user=user)
+    if start_date:
+        tx_qs = tx_qs.filter(date__gte=month_start(start_date))
+        rollup_qs = rollup_qs.filter(month__gte=month_start(start_date))
+    if end_date:
+        tx_qs = tx_qs.filter(date__lt=add_months(month_start(end_date), 1))
+        rollup_qs = rollup_qs.filter(month__lte=month_start(end_date))
+
+    rows = (
+        tx_qs.order_by()
+        .annotate(month=TruncMonth('date'))
+        .values(
+            'user_id',
+            'month',
+            'subcategory_id',
+            'subcategory__parent_category_id',
+            'transaction_type',
+            'expense_type',
+            'is_housing',
+        )
+        .annotate(total=Sum('amount'), count=Count('id'))
+    )
+
+    rollups = (
+        MonthlyCategoryRollup(
+            user_id=row['user_id'],
+            month=row['month'],
+            subcategory_id=row['subcategory_id'],
+            category_id=row['subcategory__parent_category_id'],
+            transaction_type=row['transaction_type'],
+            expense_type=row['expense_type'],
+            is_housing=row['is_housing'],
+            total=row['total'],
+            count=row['count'],
+        )
+        for row in rows
+    )
+
+    with transaction.atomic():
+        rollup_qs.delete()
+        created = MonthlyCategoryRollup.objects.bulk_create(rollups, batch_size=BATCH_SIZE)
+
+    return len(created)
@@ -0,0 +1,72 @@
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+from ..models import SubCategory
+from .queries import get_base_transaction_qs
+
+SEARCH_LIMIT = 50
+# Debe coincidir con los índices GIN de las migraciones 0014 y 0016
+SEARCH_CONFIG = 'simple'
+
+
+def _terms(query):
+    return re.findall(r'\w+', query or '')
+
+
+def _match_prefixes(qs, field, terms):
+    """
+    Filtra qs exigiendo que `field` contenga todas las palabras como prefijo
+    de palabra. Devuelve (queryset, rank): en PostgreSQL usa texto completo
+    sobre el índice GIN y rank es la expresión SearchRank; en otros motores
+    usa una expresión regular equivalente y rank es None.
+    """
+    if connections[qs.db].vendor != 'postgresql':
+        condition = Q()
+        for term in terms:
+            # Inicio de palabra, igual que los prefijos "term:*" del tsquery
+            condition &= Q(**{f'{field}__iregex': rf'\b{term}'})
+        return qs.filter(condition), None
+
+    from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+    vector = SearchVector(field, config=SEARCH_CONFIG)
+    search_query = SearchQuery(
+        ' & '.join(f"{term}:*" for term in terms), config=SEARCH_CONFIG, search_type='raw'
+    )
+    return qs.annotate(search=vector).filter(search=search_query), SearchRank(vector, search_query)
+
+
+def filter_transactions(qs, query):
+    """
+    Filtra transacciones por descripción exigiendo todas las palabras, cada
+    una como prefijo de palabra. En PostgreSQL ordena por relevancia y en
+    otros motores por fecha.
+    """
+    terms = _terms(query)
+    if not terms:
+        return qs.none()
+
+    qs, rank = _match_prefixes(qs, 'description', terms)
+    if rank is None:
+        return qs.order_by('-date', '-id')
+    return qs.annotate(rank=rank).order_by('-rank', '-date', '-id')
+
+
+def filter_by_subcategory(qs, query):
+    """
+    Filtra transacciones cuya subcategoría contiene todas las palabras como
+    prefijo: las subcategorías se buscan en su índice de texto completo y las
+    transacciones por la clave ajena indexada.
+    """
+    terms = _terms(query)
+    if not terms:
+        return qs.none()
+
+    subcategories, _ = _match_prefixes(SubCategory.objects.all(), 'name', terms)
+    return qs.filter(subcategory__in=subcategories.values('pk'))
+
+
+def search_transactions(user, query, limit=SEARCH_LIMIT):
+    return filter_transactions(get_base_transaction_qs(user), query)[:limit]
@@ -1,22 +1,24 @@
 from calendar import month_name
-from . import queries, metrics
+from core.services.timeseries import month_bounds
+from . import queries, metrics, rollups
 
 def get_summary_page_data(user, year, month):
     """
     Orquestador que recolecta toda la información necesaria para la página de resumen.
     """
-    base_qs = queries.get_base_transaction_qs(user)
-    period_qs = base_qs.filter(date__year=year, date__month=month)
+    start, end = month_bounds(year, month)
+    transactions, next_cursor = queries.get_transaction_page(user, start, end)
     
-    # Datos de navegación
-    years = queries.get_available_years(user)
-    months_idx = queries.get_available_months_for_year(user, year)
-    months_list = [(m, month_name[m]) for m in months_idx]
+    # Datos de navegación (índice de periodos cacheado)
+    period_index = queries.get_period_index(user)
+    years = list(period_index)
+    months_list = [(m, month_name[m]) for m in period_index.get(year, [])]
     
-    # Cálculos
-    stats = metrics.get_period_metrics(period_qs)
-    prev_income = metrics.get_previous_month_income(base_qs, year, month)
-    exp_chart = metrics.get_expense_distribution_chart(period_qs)
+    # Cálculos: una consulta agrupada sobre el agregado de este mes y el anterior
+    window = metrics.get_summary_window(rollups.get_rollup_qs(user), start)
+    stats = window["stats"]
+    prev_income = window["prev_income"]
+    exp_chart = window["chart"]
     
     # Estructura de KPIs (Lógica de presentación movida aquí)
     kpis = [
@@ -29,7 +31,8 @@ def get_summary_page_data(user, year, month):
     ]
 
     return {
-        'transactions': period_qs.order_by('-date'),
+        'transactions': transactions,
+        'next_cursor': next_cursor,
         'years': years,
         'months': months_list,
         'sel_year': year,
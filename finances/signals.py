@@ -0,0 +1,58 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from core.services.timeseries import month_start
+from .models import Category, SubCategory, Transaction
+from .services import rollups
+
+
+def _rollup_key(tx):
+    return (tx.user_id, month_start(tx.date), tx.subcategory_id)
+
+
+def remember_previous_rollup(sender, instance, **kwargs):
+    # Guardamos el bucket anterior por si la edición cambia de mes/subcategoría
+    instance._previous_rollup_key = None
+    if instance.pk:
+        previous = sender.objects.filter(pk=instance.pk).values('user_id', 'date', 'subcategory_id').first()
+        if previous:
+            instance._previous_rollup_key = (
+                previous['user_id'], month_start(previous['date']), previous['subcategory_id']
+            )
+
+
+def update_rollup_on_save(sender, instance, **kwargs):
+    keys = {_rollup_key(instance), getattr(instance, '_previous_rollup_key', None)}
+    for key in keys - {None}:
+        rollups.refresh_rollup(*key)
+
+
+def update_rollup_on_delete(sender, instance, **kwargs):
+    rollups.refresh_rollup(*_rollup_key(instance))
+
+
+def _sync_transactions(category, **filters):
+    # Solo tocamos las filas cuyos atributos copiados han cambiado
+    attrs = {field: getattr(category, field) for field in Transaction.CATEGORY_FIELDS}
+    Transaction.objects.filter(**filters).exclude(**attrs).update(**attrs)
+
+
+def sync_category(sender, instance, created, **kwargs):
+    if created:
+        return
+    _sync_transactions(instance, subcategory__parent_category=instance)
+    rollups.sync_category_attributes(instance)
+
+
+def sync_subcategory(sender, instance, created, **kwargs):
+    if created:
+        return
+    _sync_transactions(instance.parent_category, subcategory=instance)
+    rollups.sync_subcategory_parent(instance)
+
+
+def connect_signals():
+    pre_save.connect(remember_previous_rollup, sender=Transaction, dispatch_uid="rollup:transaction:pre_save")
+    post_save.connect(update_rollup_on_save, sender=Transaction, dispatch_uid="rollup:transaction:save")
+    post_delete.connect(update_rollup_on_delete, sender=Transaction, dispatch_uid="rollup:transaction:delete")
+    post_save.connect(sync_category, sender=Category, dispatch_uid="rollup:category:save")
+    post_save.connect(sync_subcategory, sender=SubCategory, dispatch_uid="rollup:subcategory:save")
@@ -59,16 +59,7 @@ const SummaryModule = {
         });
 
         // --- GENERAR FILTROS DE CATEGORÍA ---
-        const cats = [...new Set(this.tableState.rows.map(r => r.dataset.cat.trim()))].sort();
-        cats.forEach(c => {
-            const div = document.createElement('div');
-            div.className = 'form-check mb-2';
-            div.innerHTML = `
-                <input class="form-check-input" type="checkbox" value="${c}" checked id="cat-${c}">
-                <label class="form-check-label small ms-2" for="cat-${c}">${c}</label>`;
-            div.querySelector('input').onchange = () => this.applyFilters();
-            checkboxContainer.appendChild(div);
-        });
+        this.addCategoryFilters(this.tableState.rows);
 
         if (toggleBtn) {
             toggleBtn.onclick = () => {
@@ -84,9 +75,85 @@ const SummaryModule = {
             searchInput.oninput = () => this.applyFilters();
         }
 
+        // --- CARGAR MÁS (paginación por cursor en el servidor) ---
+        const loadMoreBtn = document.getElementById('loadMoreTx');
+        if (loadMoreBtn) {
+            loadMoreBtn.onclick = () => this.loadMore(loadMoreBtn);
+        }
+
         this.updateTable();
     },
 
+    addCategoryFilters: function(rows) {
+        const checkboxContainer = document.getElementById('checkboxContainer');
+        const existing = [...checkboxContainer.querySelectorAll('input')].map(cb => cb.value);
+        const cats = [...new Set(rows.map(r => r.dataset.cat.trim()))]
+            .filter(c => !existing.includes(c))
+            .sort();
+        cats.forEach(c => {
+            const div = document.createElement('div');
+            div.className = 'form-check mb-2';
+            div.innerHTML = `
+                <input class="form-check-input" type="checkbox" checked>
+                <label class="form-check-label small ms-2"></label>`;
+            const input = div.querySelector('input');
+            const label = div.querySelector('label');
+            input.value = c;
+            input.id = `cat-${c}`;
+            label.htmlFor = input.id;
+            label.textContent = c;
+            input.onchange = () => this.applyFilters();
+            checkboxContainer.appendChild(div);
+        });
+    },
+
+    buildRow: function(tx) {
+        // Misma estructura que las filas renderizadas por el template
+        const tr = document.createElement('tr');
+        tr.className = 'tx-row';
+        tr.dataset.cat = tx.category;
+        tr.innerHTML = `
+            <td class="ps-4 tx-date"></td>
+            <td class="fw-medium"></td>
+            <td><span class="badge bg-light text-dark rounded-pill px-3"></span></td>
+            <td class="text-muted small"></td>
+            <td class="text-end pe-4 tx-amount fw-bold"><span></span></td>`;
+        const cells = tr.querySelectorAll('td');
+        cells[0].dataset.val = tx.date;
+        cells[0].textContent = tx.date;
+        cells[1].textContent = tx.description;
+        cells[2].querySelector('span').textContent = tx.category;
+        cells[3].textContent = tx.subcategory;
+        cells[4].dataset.val = tx.amount;
+        const amount = cells[4].querySelector('span');
+        amount.className = tx.amount > 0 ? 'text-success' : 'text-dark';
+        amount.textContent = `${tx.amount.toFixed(2)} €`;
+        return tr;
+    },
+
+    loadMore: function(button) {
+        const url = `${button.dataset.url}&after=${encodeURIComponent(button.dataset.cursor)}`;
+        button.disabled = true;
+
+        fetch(url, { credentials: 'same-origin' })
+            .then(response => response.json())
+            .then(data => {
+                const rows = data.results.map(tx => this.buildRow(tx));
+                this.tableState.rows.push(...rows);
+                this.addCategoryFilters(rows);
+
+                if (data.next) {
+                    button.dataset.cursor = data.next;
+                    button.disabled = false;
+                } else {
+                    button.parentElement.remove();
+                }
+                // Después de quitar el botón: los contadores dejan de ser parciales
+                this.applyFilters();
+            })
+            .catch(() => { button.disabled = false; });
+    },
+
     sortTable: function(column) {
         const state = this.tableState;
         if (state.sortState.column === column) {
@@ -96,6 +163,18 @@ const SummaryModule = {
             state.sortState.ascending = true;
         }
 
+        this.applySort();
+        this.updateSortIcons(column);
+        state.currentPage = 1;
+        this.updateTable();
+    },
+
+    applySort: function() {
+        // Reaplica la ordenación activa (p.ej. tras filtrar o cargar más filas)
+        const state = this.tableState;
+        const column = state.sortState.column;
+        if (!column) return;
+
         state.filteredRows.sort((a, b) => {
             let valA, valB;
             if (column === 'date') {
@@ -111,10 +190,11 @@ const SummaryModule = {
             }
             return state.sortState.ascending ? valA - valB : valB - valA;
         });
+    },
 
-        this.updateSortIcons(column);
-        state.currentPage = 1;
-        this.updateTable();
+    hasMoreRows: function() {
+        // Mientras exista "Load more" la tabla solo contiene parte del mes
+        return Boolean(document.getElementById('loadMoreTx'));
     },
 
     updateTable: function() {
@@ -133,8 +213,9 @@ const SummaryModule = {
             tableBody.appendChild(r);
         });
         
-        document.getElementById('paginationInfo').innerText = 
-            `Showing ${total > 0 ? start + 1 : 0} to ${Math.min(end, total)} of ${total}`;
+        const scope = this.hasMoreRows() ? ' loaded rows (more available)' : '';
+        document.getElementById('paginationInfo').innerText =
+            `Showing ${total > 0 ? start + 1 : 0} to ${Math.min(end, total)} of ${total}${scope}`;
         
         this.renderPagination(pages);
         this.updateTotalSum();
@@ -165,6 +246,8 @@ const SummaryModule = {
         );
         
         // Uso del formateador global
+        document.getElementById('tableTotalLabel').innerText =
+            this.hasMoreRows() ? 'LOADED ROWS TOTAL:' : 'VISIBLE TOTAL:';
         totalDisplay.innerText = FinancialFormatter.currency(sum);
         totalDisplay.className = sum < 0 ? 'h6 fw-bold text-danger mb-0' : 'h6 fw-bold text-success mb-0';
     },
@@ -191,7 +274,8 @@ const SummaryModule = {
             const matchesSearch = r.innerText.toLowerCase().includes(searchTerm);
             return matchesCat && matchesSearch;
         });
-        
+        this.applySort();
+
         state.currentPage = 1;
         this.updateTable();
     },
@@ -0,0 +1,89 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.urls import reverse
+from datetime import date
+from decimal import Decimal
+
+from ..models import Transaction, Category, SubCategory
+
+User = get_user_model()
+
+
+class TransactionChangelistTest(TestCase):
+
+    def setUp(self):
+        # Usuario de staff: el admin solo le muestra sus transacciones
+        self.user = User.objects.create_user(username="staff", password="password123", is_staff=True)
+        self.user.user_permissions.set(Permission.objects.filter(
+            content_type__app_label='finances', codename__in=['view_transaction', 'change_transaction']
+        ))
+        cat_food = Category.objects.create(
+            user=self.user, name="Groceries", transaction_type='EXPENSE', expense_type='VARIABLE'
+        )
+        self.sub_food = SubCategory.objects.create(user=self.user, name="Supermarket", parent_category=cat_food)
+        for day in (date(2023, 6, 1), date(2024, 1, 10), date(2024, 2, 10)):
+            Transaction.objects.create(user=self.user, date=day, amount=100, subcategory=self.sub_food)
+        self.client.force_login(self.user)
+        self.url = reverse('admin:finances_transaction_changelist')
+
+    def _sum_queries(self, params):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, params)
+        sums = [q for q in ctx.captured_queries if 'SUM(' in q['sql'].upper()]
+        return response, sums
+
+    def test_year_lookups_come_from_rollup(self):
+        response = self.client.get(self.url)
+        year_filter = next(
+            spec for spec in response.context_data['cl'].filter_specs if spec.parameter_name == 'year'
+        )
+        self.assertEqual([value for value, _ in year_filter.lookup_choices], [2023, 2024])
+
+    def test_month_filter_uses_date_ranges(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, {'year': '2024', 'month': '1'})
+        self.assertEqual([tx.date for tx in response.context_data['cl'].result_list], [date(2024, 1, 10)])
+
+        # Sin año: el mes de cada año con datos
+        Transaction.objects.create(user=self.user, date=date(2023, 1, 20), amount=100, subcategory=self.sub_food)
+        response = self.client.get(self.url, {'month': '1'})
+        self.assertEqual(
+            sorted(tx.date for tx in response.context_data['cl'].result_list),
+            [date(2023, 1, 20), date(2024, 1, 10)],
+        )
+
+        sql = ' '.join(q['sql'] for q in ctx.captured_queries if 'finances_transaction' in q['sql'])
+        self.assertNotIn('EXTRACT', sql.upper())
+        self.assertNotIn('django_date_extract', sql)
+
+    def test_totals_are_cached_per_filters(self):
+        response, sums = self._sum_queries({'year': '2024'})
+        self.assertEqual(response.context_data['total_amount'], Decimal('-200'))
+        self.assertEqual(len(sums), 1)
+
+        # Cambiar de página u orden reutiliza el total; otro filtro no
+        _, sums = self._sum_queries({'year': '2024', 'o': '1'})
+        self.assertEqual(sums, [])
+        response, sums = self._sum_queries({'year': '2023'})
+        self.assertEqual(response.context_data['total_amount'], Decimal('-100'))
+        self.assertEqual(len(sums), 1)
+
+    def test_totals_refresh_after_data_change(self):
+        self.client.get(self.url, {'year': '2024'})
+        with self.captureOnCommitCallbacks(execute=True):
+            Transaction.objects.create(user=self.user, date=date(2024, 3, 1), amount=50, subcategory=self.sub_food)
+        response = self.client.get(self.url, {'year': '2024'})
+        self.assertEqual(response.context_data['total_amount'], Decimal('-250'))
+
+    def test_superuser_totals_follow_other_users_changes(self):
+        admin = User.objects.create_superuser(username="admin", password="password123")
+        self.client.force_login(admin)
+        self.assertEqual(self.client.get(self.url).context_data['total_amount'], Decimal('-300'))
+
+        # La edición es de otro usuario: la versión de datos del superusuario no cambia
+        with self.captureOnCommitCallbacks(execute=True):
+            Transaction.objects.create(user=self.user, date=date(2024, 3, 1), amount=50, subcategory=self.sub_food)
+        self.assertEqual(self.client.get(self.url).context_data['total_amount'], Decimal('-350'))
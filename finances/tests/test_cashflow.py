@@ -0,0 +1,69 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from datetime import date
+
+from ..models import Transaction, Category, SubCategory
+from ..services import queries, metrics
+from ..services.api import get_annual_cashflow_summary, get_cashflow_summary
+
+User = get_user_model()
+
+
+class CashflowSummaryTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="password123")
+
+        cat_income = Category.objects.create(
+            user=self.user, name="Salary", transaction_type='INCOME', expense_type='N/A'
+        )
+        cat_rent = Category.objects.create(
+            user=self.user, name="Rent", transaction_type='EXPENSE',
+            expense_type='FIXED', is_housing=True
+        )
+        cat_food = Category.objects.create(
+            user=self.user, name="Groceries", transaction_type='EXPENSE', expense_type='VARIABLE'
+        )
+        sub_salary = SubCategory.objects.create(user=self.user, name="Main Job", parent_category=cat_income)
+        sub_rent = SubCategory.objects.create(user=self.user, name="Apartment", parent_category=cat_rent)
+        sub_food = SubCategory.objects.create(user=self.user, name="Supermarket", parent_category=cat_food)
+
+        for tx_date, amount, sub in [
+            (date(2023, 12, 20), 3000, sub_salary),
+            (date(2024, 1, 25), 5000, sub_salary),
+            (date(2024, 1, 5), 1500, sub_rent),
+            (date(2024, 1, 10), 500, sub_food),
+            (date(2024, 3, 31), 200, sub_food),
+            (date(2025, 1, 1), 4000, sub_salary),
+        ]:
+            Transaction.objects.create(user=self.user, date=tx_date, amount=amount, subcategory=sub)
+
+    def test_annual_summary_matches_period_metrics(self):
+        with self.assertNumQueries(1):
+            summary = get_annual_cashflow_summary(self.user, 2024)
+
+        self.assertEqual(len(summary), 12)
+        base_qs = queries.get_base_transaction_qs(self.user)
+        for row in summary:
+            stats = metrics.get_period_metrics(
+                base_qs.filter(date__year=2024, date__month=row["month"])
+            )
+            self.assertEqual(row["date_obj"], date(2024, row["month"], 1))
+            for key in ("income", "expenses", "fixed", "variable", "no_housing", "savings"):
+                self.assertEqual(row[key], stats[key])
+
+        january = summary[0]
+        self.assertEqual(january["income"], 5000)
+        self.assertEqual(january["expenses"], 2000)
+        self.assertEqual(january["no_housing"], 500)
+        self.assertEqual(january["savings_rate"], 60)
+        self.assertEqual(summary[1]["savings_rate"], 0)
+
+    def test_multi_year_range_single_query(self):
+        with self.assertNumQueries(1):
+            summary = get_cashflow_summary(self.user, date(2023, 12, 1), date(2025, 1, 31))
+
+        self.assertEqual(len(summary), 14)
+        self.assertEqual(summary[0]["income"], 3000)
+        self.assertEqual(summary[-1]["date_obj"], date(2025, 1, 1))
+        self.assertEqual(summary[-1]["income"], 4000)
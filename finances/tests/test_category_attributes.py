@@ -0,0 +1,76 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from datetime import date
+from io import StringIO
+
+from core.models import UserDataVersion
+from ..models import Transaction, Category, SubCategory, MonthlyCategoryRollup
+from ..services import metrics, queries
+
+User = get_user_model()
+
+
+class TransactionCategoryAttributesTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="password123")
+        self.cat_rent = Category.objects.create(
+            user=self.user, name="Rent", transaction_type='EXPENSE',
+            expense_type='FIXED', is_housing=True
+        )
+        self.cat_food = Category.objects.create(
+            user=self.user, name="Groceries", transaction_type='EXPENSE', expense_type='VARIABLE'
+        )
+        self.sub_rent = SubCategory.objects.create(user=self.user, name="Apartment", parent_category=self.cat_rent)
+        self.sub_food = SubCategory.objects.create(user=self.user, name="Supermarket", parent_category=self.cat_food)
+        self.rent = Transaction.objects.create(
+            user=self.user, date=date(2024, 1, 5), amount=1500, subcategory=self.sub_rent
+        )
+        self.food = Transaction.objects.create(
+            user=self.user, date=date(2024, 1, 10), amount=80, subcategory=self.sub_food
+        )
+
+    def _attributes(self, tx):
+        return Transaction.objects.filter(pk=tx.pk).values_list(*Transaction.CATEGORY_FIELDS).get()
+
+    def test_save_copies_category_attributes(self):
+        self.assertEqual(self._attributes(self.rent), ('EXPENSE', 'FIXED', True))
+        self.assertEqual(self._attributes(self.food), ('EXPENSE', 'VARIABLE', False))
+
+    def test_category_change_updates_transactions(self):
+        self.cat_food.expense_type = 'FIXED'
+        self.cat_food.save()
+        self.assertEqual(self._attributes(self.food), ('EXPENSE', 'FIXED', False))
+
+    def test_subcategory_move_updates_transactions(self):
+        self.sub_food.parent_category = self.cat_rent
+        self.sub_food.save()
+        self.assertEqual(self._attributes(self.food), ('EXPENSE', 'FIXED', True))
+
+    def test_sync_command_repairs_drift(self):
+        Transaction.objects.update(transaction_type='INCOME', expense_type='N/A', is_housing=False)
+        MonthlyCategoryRollup.objects.update(transaction_type='INCOME', expense_type='N/A', is_housing=False)
+        version = UserDataVersion.objects.get(user=self.user).version
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('sync_transaction_categories', user=self.user.username, stdout=StringIO())
+
+        self.assertEqual(self._attributes(self.rent), ('EXPENSE', 'FIXED', True))
+        self.assertEqual(self._attributes(self.food), ('EXPENSE', 'VARIABLE', False))
+        # Agregados y versión de la caché reflejan la nueva clasificación
+        self.assertEqual(
+            set(MonthlyCategoryRollup.objects.values_list('subcategory__name', 'expense_type', 'is_housing')),
+            {('Apartment', 'FIXED', True), ('Supermarket', 'VARIABLE', False)},
+        )
+        self.assertGreater(UserDataVersion.objects.get(user=self.user).version, version)
+
+    def test_period_metrics_use_a_single_table(self):
+        qs = queries.get_base_transaction_qs(self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            stats = metrics.get_period_metrics(qs)
+        self.assertNotIn('JOIN', ctx.captured_queries[0]['sql'])
+        self.assertEqual(stats['fixed'], 1500)
+        self.assertEqual(stats['no_housing'], 80)
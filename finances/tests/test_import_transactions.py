@@ -0,0 +1,156 @@
+import json
+import os
+import tempfile
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.conf import settings
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from ..management.commands.import_transactions import Command
+from ..models import Transaction, Category, SubCategory, MonthlyCategoryRollup
+from ..services import rollups
+
+User = get_user_model()
+
+DATA_DIR = os.path.join(settings.BASE_DIR, 'scripts', 'data_imports')
+
+BANK_EXPORT = """Fecha;Concepto;Importe;Descripción
+01/03/2025;Mercadona;-45,30;Compra semanal
+05/03/2025;Alquiler;-900,00;Piso marzo
+25/03/2025;Nómina;2.450,10;Salario
+31/02/2025;Mercadona;-10,00;Fecha inválida
+06/03/2025;Desconocido;-3,00;Sin mapeo
+"""
+
+
+class ImportTransactionsCommandTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="importer", password="1234")
+
+    def run_import(self, file_path, mapping):
+        out = StringIO()
+        call_command(
+            'import_transactions', file_path,
+            mapping=os.path.join(DATA_DIR, 'mappings', mapping),
+            user='importer', batch_size=7, stdout=out
+        )
+        return out.getvalue()
+
+    def import_csv(self, content, mapping='bank_export_example.json'):
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            f.write(content)
+        try:
+            return self.run_import(path, mapping)
+        finally:
+            os.remove(path)
+
+    def test_monthly_layout_income(self):
+        self.run_import(os.path.join(DATA_DIR, 'income_2025.csv'), 'income_2025.json')
+
+        salary = Transaction.objects.filter(user=self.user, subcategory__name='Salary')
+        self.assertEqual(salary.count(), 12)
+        first = salary.get(date=date(2025, 1, 25))
+        self.assertEqual(first.amount, Decimal('2299.45'))
+        self.assertEqual(first.description, 'Salary Deloitte: January')
+        self.assertEqual(Category.objects.get(user=self.user, name='Income').transaction_type, 'INCOME')
+
+    def test_monthly_layout_expenses_are_negative_and_rolled_up(self):
+        self.run_import(os.path.join(DATA_DIR, 'expenses_2025.csv'), 'expenses_2025.json')
+
+        qs = Transaction.objects.filter(user=self.user)
+        self.assertTrue(qs.exists())
+        self.assertFalse(qs.filter(amount__gte=0).exists())
+        self.assertEqual(Category.objects.get(user=self.user, name='Housing').expense_type, 'FIXED')
+
+        # El agregado mensual queda igual que una reconstrucción completa
+        incremental = sorted(MonthlyCategoryRollup.objects.filter(user=self.user).values_list(
+            'month', 'subcategory_id', 'total', 'count'))
+        rollups.rebuild_rollups(self.user)
+        rebuilt = sorted(MonthlyCategoryRollup.objects.filter(user=self.user).values_list(
+            'month', 'subcategory_id', 'total', 'count'))
+        self.assertEqual(incremental, rebuilt)
+
+    def test_rows_layout(self):
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            f.write(BANK_EXPORT)
+        try:
+            output = self.run_import(path, 'bank_export_example.json')
+        finally:
+            os.remove(path)
+
+        self.assertIn('Se crearon 3 transacciones', output)
+        self.assertIn('Filas omitidas (sin mapeo, incompletas o con valor inválido): 2', output)
+        amounts = dict(Transaction.objects.filter(user=self.user).values_list('subcategory__name', 'amount'))
+        self.assertEqual(amounts, {
+            'Groceries': Decimal('-45.30'),
+            'Rent': Decimal('-900.00'),
+            'Salary': Decimal('2450.10'),
+        })
+
+    def test_parse_amount_decimal_comma(self):
+        command = Command()
+        command.mapping = {'decimal_comma': True}
+        cases = {
+            '2.450,10': Decimal('2450.10'),
+            '2.450': Decimal('2450'),
+            '-1.250.000': Decimal('-1250000'),
+            '45,3': Decimal('45.30'),
+            '12.5': Decimal('12.50'),
+            '0,00': None,
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(command.parse_amount(raw), expected)
+
+    def test_ambiguous_subcategory_name_is_an_error(self):
+        for name in ('Food', 'Leisure'):
+            category = Category.objects.create(
+                user=self.user, name=name, transaction_type='EXPENSE', expense_type='VARIABLE'
+            )
+            SubCategory.objects.create(user=self.user, name='Other', parent_category=category)
+
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            f.write("Fecha;Concepto;Importe;Descripción\n01/03/2025;Other;-5,00;Varios\n")
+        try:
+            with self.assertRaisesMessage(CommandError, '"Other" existe en varias categorías'):
+                self.run_import(path, 'bank_export_example.json')
+        finally:
+            os.remove(path)
+        self.assertFalse(Transaction.objects.filter(user=self.user).exists())
+
+    def test_missing_mapped_column_is_an_error(self):
+        with self.assertRaisesMessage(CommandError, 'ausentes en la cabecera del CSV: Importe'):
+            self.import_csv("Fecha;Concepto;Descripción\n01/03/2025;Mercadona;Compra\n")
+
+    def test_short_rows_are_skipped(self):
+        output = self.import_csv(
+            "Fecha;Concepto;Importe;Descripción\n"
+            "01/03/2025;Mercadona\n"
+            "02/03/2025;Mercadona;-12,00;Compra\n"
+        )
+        self.assertIn('Se crearon 1 transacciones', output)
+        self.assertIn('omitidas (sin mapeo, incompletas o con valor inválido): 1', output)
+
+    def test_alias_keys_ignore_case(self):
+        with open(os.path.join(DATA_DIR, 'mappings', 'bank_export_example.json'), encoding='utf-8') as f:
+            mapping = json.load(f)
+        mapping['subcategories'] = {'MERCADONA': ['Food & Dinning', 'Groceries']}
+
+        handle, mapping_path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            json.dump(mapping, f)
+        try:
+            # Ruta absoluta: run_import la usa tal cual
+            self.import_csv("Fecha;Concepto;Importe;Descripción\n01/03/2025;Mercadona;-12,00;Compra\n", mapping_path)
+        finally:
+            os.remove(mapping_path)
+        self.assertEqual(Transaction.objects.get(user=self.user).subcategory.name, 'Groceries')
@@ -0,0 +1,54 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from datetime import date
+
+from ..models import Transaction, Category, SubCategory
+from ..services import queries
+
+User = get_user_model()
+
+
+class PeriodIndexTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="password123")
+        cat = Category.objects.create(
+            user=self.user, name="Groceries", transaction_type='EXPENSE', expense_type='VARIABLE'
+        )
+        self.sub = SubCategory.objects.create(user=self.user, name="Supermarket", parent_category=cat)
+        self.sub2 = SubCategory.objects.create(user=self.user, name="Bakery", parent_category=cat)
+        for day, sub in [
+            (date(2023, 12, 3), self.sub),
+            (date(2024, 1, 5), self.sub),
+            (date(2024, 1, 9), self.sub2),
+            (date(2024, 3, 2), self.sub),
+        ]:
+            Transaction.objects.create(user=self.user, date=day, amount=10, subcategory=sub)
+
+    def test_years_and_months(self):
+        self.assertEqual(queries.get_available_years(self.user), [2024, 2023])
+        self.assertEqual(queries.get_available_months_for_year(self.user, 2024), [1, 3])
+        self.assertEqual(queries.get_available_months_for_year(self.user, 2022), [])
+
+    def test_follows_inserts_and_deletes(self):
+        queries.get_period_index(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            tx = Transaction.objects.create(user=self.user, date=date(2025, 6, 1), amount=10, subcategory=self.sub)
+        self.assertEqual(queries.get_available_years(self.user), [2025, 2024, 2023])
+        with self.captureOnCommitCallbacks(execute=True):
+            tx.delete()
+            Transaction.objects.filter(date=date(2024, 3, 2)).delete()
+        self.assertEqual(queries.get_available_years(self.user), [2024, 2023])
+        self.assertEqual(queries.get_available_months_for_year(self.user, 2024), [1])
+
+    def test_lookups_are_served_from_cache(self):
+        queries.get_period_index(self.user)
+        with self.assertNumQueries(0):
+            queries.get_available_years(self.user)
+            queries.get_available_months_for_year(self.user, 2024)
+
+    def test_report_year_selector(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('reports:report_finance'), {'year': 2024})
+        self.assertEqual(response.context['years'], [2024, 2023])
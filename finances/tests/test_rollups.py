@@ -0,0 +1,110 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from datetime import date
+from io import StringIO
+
+from ..models import Transaction, Category, SubCategory, MonthlyCategoryRollup
+from ..services import metrics, queries, rollups
+
+User = get_user_model()
+
+
+def _snapshot(user):
+    return sorted(
+        MonthlyCategoryRollup.objects.filter(user=user).values_list(
+            'month', 'subcategory_id', 'category_id', 'transaction_type',
+            'expense_type', 'is_housing', 'total', 'count'
+        )
+    )
+
+
+class MonthlyRollupTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="password123")
+
+        self.cat_income = Category.objects.create(
+            user=self.user, name="Salary", transaction_type='INCOME', expense_type='N/A'
+        )
+        self.cat_rent = Category.objects.create(
+            user=self.user, name="Rent", transaction_type='EXPENSE',
+            expense_type='FIXED', is_housing=True
+        )
+        self.cat_food = Category.objects.create(
+            user=self.user, name="Groceries", transaction_type='EXPENSE', expense_type='VARIABLE'
+        )
+        self.sub_salary = SubCategory.objects.create(user=self.user, name="Main Job", parent_category=self.cat_income)
+        self.sub_rent = SubCategory.objects.create(user=self.user, name="Apartment", parent_category=self.cat_rent)
+        self.sub_food = SubCategory.objects.create(user=self.user, name="Supermarket", parent_category=self.cat_food)
+
+        self.salary = Transaction.objects.create(
+            user=self.user, date=date(2024, 1, 25), amount=5000, subcategory=self.sub_salary
+        )
+        Transaction.objects.create(user=self.user, date=date(2024, 1, 5), amount=1500, subcategory=self.sub_rent)
+        self.food = Transaction.objects.create(
+            user=self.user, date=date(2024, 1, 10), amount=500, subcategory=self.sub_food
+        )
+        Transaction.objects.create(user=self.user, date=date(2024, 1, 12), amount=100, subcategory=self.sub_food)
+
+    def assert_matches_rebuild(self):
+        incremental = _snapshot(self.user)
+        rollups.rebuild_rollups(self.user)
+        self.assertEqual(incremental, _snapshot(self.user))
+
+    def test_rollup_tracks_saves_and_deletes(self):
+        food = MonthlyCategoryRollup.objects.get(user=self.user, subcategory=self.sub_food)
+        self.assertEqual((food.total, food.count), (-600, 2))
+        self.assert_matches_rebuild()
+
+        # Mover una transacción de mes y de subcategoría actualiza ambos buckets
+        self.food.date = date(2024, 2, 3)
+        self.food.subcategory = self.sub_rent
+        self.food.save()
+        self.assert_matches_rebuild()
+
+        self.salary.delete()
+        self.assertFalse(
+            MonthlyCategoryRollup.objects.filter(user=self.user, subcategory=self.sub_salary).exists()
+        )
+        self.assert_matches_rebuild()
+
+    def test_metrics_from_rollup_match_transactions(self):
+        tx_qs = queries.get_base_transaction_qs(self.user).filter(date__year=2024, date__month=1)
+        rollup_qs = rollups.get_rollup_qs(self.user).filter(month=date(2024, 1, 1))
+
+        self.assertEqual(metrics.get_period_metrics(rollup_qs), metrics.get_period_metrics(tx_qs))
+        self.assertEqual(
+            metrics.get_expense_distribution_chart(rollup_qs),
+            metrics.get_expense_distribution_chart(tx_qs)
+        )
+
+    def test_category_changes_are_synced(self):
+        self.cat_food.expense_type = 'FIXED'
+        self.cat_food.save()
+        self.assertEqual(
+            set(MonthlyCategoryRollup.objects.filter(category=self.cat_food).values_list('expense_type', flat=True)),
+            {'FIXED'}
+        )
+
+        self.sub_food.parent_category = self.cat_rent
+        self.sub_food.save()
+        self.assert_matches_rebuild()
+
+    def test_rebuild_command(self):
+        MonthlyCategoryRollup.objects.all().delete()
+        out = StringIO()
+        call_command('rebuild_monthly_rollups', stdout=out)
+
+        self.assertIn('3', out.getvalue())
+        self.assertEqual(MonthlyCategoryRollup.objects.filter(user=self.user).count(), 3)
+
+    def test_rebuild_command_invalidates_cache(self):
+        self.assertNotIn(2020, queries.get_period_index(self.user))
+        # QuerySet.update no dispara señales: el agregado y la caché quedan antiguos
+        Transaction.objects.filter(user=self.user).update(date=date(2020, 1, 15))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('rebuild_monthly_rollups', user=self.user.username, stdout=StringIO())
+
+        self.assertEqual(queries.get_period_index(self.user), {2020: [1]})
@@ -0,0 +1,111 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from datetime import date
+
+from ..models import Transaction, Category, SubCategory
+from ..services.search import search_transactions
+
+User = get_user_model()
+
+
+class TransactionSearchTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(username="testuser", password="password123")
+        self.other = User.objects.create_user(username="other", password="password123")
+
+        cat_food = Category.objects.create(
+            user=self.user, name="Groceries", transaction_type='EXPENSE', expense_type='VARIABLE'
+        )
+        sub_food = SubCategory.objects.create(user=self.user, name="Supermarket", parent_category=cat_food)
+        cat_leisure = Category.objects.create(
+            user=self.user, name="Leisure", transaction_type='EXPENSE', expense_type='VARIABLE'
+        )
+        sub_cinema = SubCategory.objects.create(user=self.user, name="Cinema", parent_category=cat_leisure)
+
+        self.weekly = Transaction.objects.create(
+            user=self.user, date=date(2024, 1, 10), amount=80, subcategory=sub_food, description="Weekly shopping Mercadona"
+        )
+        self.bakery = Transaction.objects.create(
+            user=self.user, date=date(2024, 1, 12), amount=5, subcategory=sub_food, description="Bakery"
+        )
+        self.movie = Transaction.objects.create(
+            user=self.user, date=date(2024, 1, 15), amount=12, subcategory=sub_cinema, description="Movie night"
+        )
+
+        other_cat = Category.objects.create(
+            user=self.other, name="Groceries", transaction_type='EXPENSE', expense_type='VARIABLE'
+        )
+        other_sub = SubCategory.objects.create(user=self.other, name="Supermarket", parent_category=other_cat)
+        Transaction.objects.create(
+            user=self.other, date=date(2024, 1, 10), amount=30, subcategory=other_sub, description="Mercadona"
+        )
+
+    def _ids(self, query):
+        return {tx.pk for tx in search_transactions(self.user, query)}
+
+    def test_matches_word_prefixes(self):
+        self.assertEqual(self._ids("Mercad"), {self.weekly.pk})
+        self.assertEqual(self._ids("shop week"), {self.weekly.pk})
+        # Mismo criterio en todos los motores: prefijos de palabra, no subcadenas
+        self.assertEqual(self._ids("ercadona"), set())
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self._ids("movie ni"), {self.movie.pk})
+        self.assertEqual(self._ids("movie bak"), set())
+
+    def test_empty_query_returns_nothing(self):
+        self.assertEqual(self._ids("  ?! "), set())
+
+    def test_endpoint_returns_only_own_transactions(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('transaction_search'), {'q': 'mercadona'})
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual([r['id'] for r in results], [self.weekly.pk])
+        self.assertEqual(results[0]['amount'], -80.0)
+        self.assertEqual(results[0]['subcategory'], "Supermarket")
+
+    def test_endpoint_clamps_limit(self):
+        for day in (13, 14):
+            Transaction.objects.create(
+                user=self.user, date=date(2024, 1, day), amount=4, subcategory=self.bakery.subcategory,
+                description="Bakery"
+            )
+        self.client.force_login(self.user)
+        for limit, expected in [('-5', 1), ('0', 1), ('2', 2), ('abc', 3)]:
+            with self.subTest(limit=limit):
+                response = self.client.get(reverse('transaction_search'), {'q': 'bakery', 'limit': limit})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.json()['results']), expected)
+
+    def test_admin_search_uses_service(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('admin:finances_transaction_changelist'), {'q': 'movie'})
+        self.assertEqual(list(response.context_data['cl'].result_list), [self.movie])
+
+    def test_admin_subcategory_filter_matches_word_prefixes(self):
+        self.client.force_login(self.user)
+        url = reverse('admin:finances_transaction_changelist')
+        response = self.client.get(url, {'subcategory_search': 'super'})
+        self.assertEqual(
+            sorted(tx.description for tx in response.context_data['cl'].result_list),
+            ["Bakery", "Mercadona", "Weekly shopping Mercadona"],
+        )
+        response = self.client.get(url, {'subcategory_search': 'market'})
+        self.assertEqual(list(response.context_data['cl'].result_list), [])
+
+    @skipUnless(connection.vendor == 'postgresql', "Requiere PostgreSQL")
+    def test_postgresql_ranks_by_similarity(self):
+        Transaction.objects.create(
+            user=self.user, date=date(2024, 2, 1), amount=3, subcategory=self.bakery.subcategory,
+            description="Bakery bakery"
+        )
+        results = list(search_transactions(self.user, "bakery"))
+        self.assertTrue(all(hasattr(tx, 'rank') for tx in results))
+        self.assertEqual(results, sorted(results, key=lambda tx: -tx.rank))
+        self.assertGreater(results[0].rank, results[-1].rank)
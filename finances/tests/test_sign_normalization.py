@@ -0,0 +1,92 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from datetime import date
+from decimal import Decimal
+
+from core.models import UserDataVersion
+from ..models import Transaction, Category, SubCategory, MonthlyCategoryRollup
+
+User = get_user_model()
+
+
+class SignNormalizationTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="password123")
+        cat_income = Category.objects.create(
+            user=self.user, name="Salary", transaction_type='INCOME', expense_type='N/A'
+        )
+        cat_food = Category.objects.create(
+            user=self.user, name="Groceries", transaction_type='EXPENSE', expense_type='VARIABLE'
+        )
+        self.sub_salary = SubCategory.objects.create(user=self.user, name="Main Job", parent_category=cat_income)
+        self.sub_food = SubCategory.objects.create(user=self.user, name="Supermarket", parent_category=cat_food)
+        self.rows = [
+            (self.sub_salary, Decimal('5000')),
+            (self.sub_salary, Decimal('-200')),
+            (self.sub_food, Decimal('120')),
+            (self.sub_food, Decimal('-35.50')),
+        ]
+
+    def _build(self, day):
+        return [
+            Transaction(user=self.user, date=date(2024, 1, day), amount=amount, subcategory_id=sub.pk)
+            for sub, amount in self.rows
+        ]
+
+    def _amounts(self, day):
+        return list(
+            Transaction.objects.filter(date=date(2024, 1, day)).order_by('pk').values_list('amount', flat=True)
+        )
+
+    def test_bulk_create_matches_save(self):
+        for tx in self._build(1):
+            tx.save()
+        with self.assertNumQueries(2):
+            Transaction.objects.bulk_create_normalized(self._build(2), refresh=False)
+
+        self.assertEqual(self._amounts(1), self._amounts(2))
+        self.assertEqual(self._amounts(2), [Decimal('5000'), Decimal('200'), Decimal('-120'), Decimal('-35.50')])
+
+    def test_bulk_update_normalizes_amount(self):
+        created = Transaction.objects.bulk_create_normalized(self._build(3))
+        for tx in created:
+            tx.amount = -tx.amount
+        Transaction.objects.bulk_update_normalized(created, ['amount'])
+
+        self.assertEqual(self._amounts(3), [Decimal('5000'), Decimal('200'), Decimal('-120'), Decimal('-35.50')])
+
+    def _monthly_totals(self):
+        return sorted(
+            MonthlyCategoryRollup.objects.filter(user=self.user).values_list('month', 'subcategory__name', 'total')
+        )
+
+    def test_bulk_helpers_refresh_rollups_and_cache(self):
+        version = UserDataVersion.objects.get(user=self.user).version
+        with self.captureOnCommitCallbacks(execute=True):
+            created = Transaction.objects.bulk_create_normalized(self._build(5))
+        self.assertEqual(self._monthly_totals(), [
+            (date(2024, 1, 1), 'Main Job', Decimal('5200')),
+            (date(2024, 1, 1), 'Supermarket', Decimal('-155.50')),
+        ])
+        self.assertGreater(UserDataVersion.objects.get(user=self.user).version, version)
+
+        # Mover una transacción de mes actualiza el mes de origen y el de destino
+        created[2].date = date(2024, 2, 5)
+        Transaction.objects.bulk_update_normalized([created[2]], ['date'])
+        self.assertEqual(self._monthly_totals(), [
+            (date(2024, 1, 1), 'Main Job', Decimal('5200')),
+            (date(2024, 1, 1), 'Supermarket', Decimal('-35.50')),
+            (date(2024, 2, 1), 'Supermarket', Decimal('-120')),
+        ])
+
+    def test_save_without_loaded_relation_uses_single_lookup(self):
+        tx = Transaction(user=self.user, date=date(2024, 1, 4), amount=10, subcategory_id=self.sub_food.pk)
+        with CaptureQueriesContext(connection) as ctx:
+            tx.save()
+        # Una única consulta (con join) antes del INSERT; el resto son las señales del rollup
+        statements = [q['sql'].split()[0] for q in ctx.captured_queries]
+        self.assertEqual(statements.index('INSERT'), 1)
+        self.assertEqual(tx.amount, -10)
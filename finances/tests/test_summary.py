@@ -0,0 +1,79 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from datetime import date
+
+from ..models import Transaction, Category, SubCategory
+from ..services import metrics, queries
+from ..services.selectors import get_summary_page_data
+
+User = get_user_model()
+
+
+class SummaryPipelineTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="password123")
+        categories = {
+            'salary': ('INCOME', 'N/A', False),
+            'rent': ('EXPENSE', 'FIXED', True),
+            'food': ('EXPENSE', 'VARIABLE', False),
+            'leisure': ('EXPENSE', 'VARIABLE', False),
+        }
+        self.subs = {}
+        for name, (tx_type, exp_type, housing) in categories.items():
+            cat = Category.objects.create(
+                user=self.user, name=name, transaction_type=tx_type, expense_type=exp_type, is_housing=housing
+            )
+            self.subs[name] = SubCategory.objects.create(user=self.user, name=name, parent_category=cat)
+
+        for day, sub, amount in [
+            (date(2023, 11, 25), 'salary', 2800),
+            (date(2023, 12, 25), 'salary', 3000),
+            (date(2023, 12, 5), 'rent', 900),
+            (date(2024, 1, 25), 'salary', 3100),
+            (date(2024, 1, 5), 'rent', 900),
+            (date(2024, 1, 8), 'food', 120),
+            (date(2024, 1, 19), 'food', 80),
+            (date(2024, 1, 20), 'leisure', 60),
+        ]:
+            Transaction.objects.create(user=self.user, date=day, amount=amount, subcategory=self.subs[sub])
+
+    def test_matches_transaction_based_metrics(self):
+        data = get_summary_page_data(self.user, 2024, 1)
+        base_qs = queries.get_base_transaction_qs(self.user)
+        period_qs = base_qs.filter(date__gte=date(2024, 1, 1), date__lt=date(2024, 2, 1))
+        stats = metrics.get_period_metrics(period_qs)
+        chart = metrics.get_expense_distribution_chart(period_qs)
+
+        self.assertEqual(data['savings_val'], stats['savings'])
+        self.assertEqual([k['value'] for k in data['kpis']], [
+            stats['savings'], stats['income'], stats['expenses'],
+            stats['fixed'], stats['variable'], stats['no_housing'],
+        ])
+        self.assertEqual(data['prev_income'], metrics.get_previous_month_income(base_qs, 2024, 1))
+        self.assertEqual(data['prev_income'], 3000)
+        self.assertEqual(data['chart_labels'], chart['labels'])
+        self.assertEqual(data['chart_data'], chart['data'])
+
+    def test_navigation_comes_from_period_index(self):
+        data = get_summary_page_data(self.user, 2023, 12)
+        self.assertEqual(data['years'], [2024, 2023])
+        self.assertEqual([m for m, _ in data['months']], [11, 12])
+
+    def test_two_queries_with_warm_period_index(self):
+        get_summary_page_data(self.user, 2024, 1)
+        with self.assertNumQueries(2):
+            data = get_summary_page_data(self.user, 2024, 1)
+            list(data['transactions'])
+
+    def test_empty_month(self):
+        data = get_summary_page_data(self.user, 2022, 5)
+        self.assertEqual(data['savings_val'], 0)
+        self.assertEqual(data['chart_labels'], [])
+        self.assertEqual(data['months'], [])
+
+    def test_summary_page_renders(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('summary'), {'year': 2024, 'month': 1})
+        self.assertEqual(response.status_code, 200)
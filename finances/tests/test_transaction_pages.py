@@ -0,0 +1,66 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from datetime import date
+
+from ..models import Transaction, Category, SubCategory
+from ..services.queries import get_transaction_page
+from ..services.selectors import get_summary_page_data
+
+User = get_user_model()
+
+
+class TransactionKeysetPaginationTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="password123")
+        cat = Category.objects.create(
+            user=self.user, name="Groceries", transaction_type='EXPENSE', expense_type='VARIABLE'
+        )
+        sub = SubCategory.objects.create(user=self.user, name="Supermarket", parent_category=cat)
+        # Varias transacciones por día para comprobar el desempate por id
+        self.ids = [
+            Transaction.objects.create(
+                user=self.user, date=date(2024, 1, 1 + i // 3), amount=10 + i, subcategory=sub
+            ).pk
+            for i in range(8)
+        ]
+        Transaction.objects.create(user=self.user, date=date(2024, 2, 1), amount=5, subcategory=sub)
+        self.start, self.end = date(2024, 1, 1), date(2024, 2, 1)
+
+    def expected_order(self):
+        return list(
+            Transaction.objects.filter(pk__in=self.ids).order_by('-date', '-id').values_list('pk', flat=True)
+        )
+
+    def test_pages_cover_month_without_gaps_or_duplicates(self):
+        seen, cursor = [], None
+        while True:
+            rows, cursor = get_transaction_page(self.user, self.start, self.end, after=cursor, limit=3)
+            seen.extend(tx.pk for tx in rows)
+            if not cursor:
+                break
+        self.assertEqual(seen, self.expected_order())
+
+    def test_each_page_is_one_query(self):
+        with self.assertNumQueries(1):
+            rows, cursor = get_transaction_page(self.user, self.start, self.end, limit=5)
+        self.assertEqual(len(rows), 5)
+        self.assertIsNotNone(cursor)
+
+    def test_summary_renders_first_page_and_cursor(self):
+        data = get_summary_page_data(self.user, 2024, 1)
+        self.assertEqual([tx.pk for tx in data['transactions']], self.expected_order())
+        self.assertIsNone(data['next_cursor'])
+
+    def test_load_more_endpoint(self):
+        self.client.force_login(self.user)
+        url = reverse('transaction_page')
+        _, cursor = get_transaction_page(self.user, self.start, self.end, limit=4)
+
+        data = self.client.get(url, {'year': 2024, 'month': 1, 'after': cursor}).json()
+        self.assertEqual([r['id'] for r in data['results']], self.expected_order()[4:])
+        self.assertIsNone(data['next'])
+
+        response = self.client.get(url, {'year': 2024, 'month': 1, 'after': 'nope'})
+        self.assertEqual(response.status_code, 400)
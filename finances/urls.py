@@ -1,6 +1,12 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
+# Bajo ASGI (settings.ASYNC_VIEWS) se sirven las variantes async
+ASYNC = settings.ASYNC_VIEWS
+
 urlpatterns = [
-    path('', views.summary, name='summary'),
-]
\ No newline at end of file
+    path('', views.summary_async if ASYNC else views.summary, name='summary'),
+    path('search/', views.transaction_search_async if ASYNC else views.transaction_search, name='transaction_search'),
+    path('transactions/', views.transaction_page_async if ASYNC else views.transaction_page, name='transaction_page'),
+]
@@ -1,6 +1,12 @@
+from django.http import JsonResponse
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 from django.utils import timezone
+from core.decorators import async_login_required
+from core.services.concurrency import run_in_pool
+from core.services.timeseries import month_bounds
+from .services.queries import get_transaction_page
+from .services.search import SEARCH_LIMIT, search_transactions
 from .services.selectors import get_summary_page_data
 
 @login_required
@@ -14,4 +20,77 @@ def summary(request):
     context = get_summary_page_data(request.user, year, month)
     
     # 3. Respuesta (Output)
-    return render(request, 'finances/summary.html', context)
\ No newline at end of file
+    return render(request, 'finances/summary.html', context)
+
+def _serialize_transaction(tx):
+    return {
+        'id': tx.pk,
+        'date': tx.date.isoformat(),
+        'description': tx.description,
+        'amount': float(tx.amount),
+        'category': tx.subcategory.parent_category.name,
+        'subcategory': tx.subcategory.name,
+    }
+
+
+def _search_payload(request):
+    query = request.GET.get('q', '')
+    try:
+        limit = max(1, min(int(request.GET.get('limit', SEARCH_LIMIT)), SEARCH_LIMIT))
+    except ValueError:
+        limit = SEARCH_LIMIT
+
+    results = [_serialize_transaction(tx) for tx in search_transactions(request.user, query, limit)]
+    return {'query': query, 'results': results}
+
+
+def _page_payload(request):
+    # Lanza ValueError si los parámetros o el cursor no son válidos
+    now = timezone.now()
+    year = int(request.GET.get('year', now.year))
+    month = int(request.GET.get('month', now.month))
+    start, end = month_bounds(year, month)
+    rows, next_cursor = get_transaction_page(request.user, start, end, after=request.GET.get('after'))
+    return {'results': [_serialize_transaction(tx) for tx in rows], 'next': next_cursor}
+
+
+@login_required
+def transaction_search(request):
+    return JsonResponse(_search_payload(request))
+
+
+@login_required
+def transaction_page(request):
+    # "Cargar más" del resumen: siguiente página tras el cursor (fecha, id)
+    try:
+        payload = _page_payload(request)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid parameters'}, status=400)
+
+    return JsonResponse(payload)
+
+
+# Variantes async (ASGI): el código síncrono se ejecuta en el pool acotado
+@async_login_required
+async def summary_async(request):
+    now = timezone.now()
+    year = int(request.GET.get('year', now.year))
+    month = int(request.GET.get('month', now.month))
+
+    context = await run_in_pool(get_summary_page_data, request.user, year, month)
+    return await run_in_pool(render, request, 'finances/summary.html', context)
+
+
+@async_login_required
+async def transaction_search_async(request):
+    return JsonResponse(await run_in_pool(_search_payload, request))
+
+
+@async_login_required
+async def transaction_page_async(request):
+    try:
+        payload = await run_in_pool(_page_payload, request)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid parameters'}, status=400)
+
+    return JsonResponse(payload)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class HoldingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'holdings'
+
+    def ready(self):
+        from holdings.signals import connect_signals
+        connect_signals()
@@ -1,78 +1,139 @@
+import calendar
 import csv
+import json
 import os
-from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from core.services.cache import invalidate_user_cache
 from holdings.models import BankAccount, AccountBalanceSnapshot
+from holdings.services.history import update_net_worth_points
 from datetime import date
 from decimal import Decimal
 
+# Columna del CSV -> cuenta en BD. "column" es opcional: si falta se busca
+# la cabecera con el mismo nombre.
+DEFAULT_MAPPING = {
+    'ING Esp': {'column': 1, 'name': 'ING Spain Corriente', 'institution': 'ING Spain', 'type': 'CHECKING'},
+    'ING Bel': {'column': 2, 'name': 'ING Belgium', 'institution': 'ING Belgium', 'type': 'CHECKING'},
+    'Revolut Corriente': {'column': 3, 'name': 'Revolut Corriente', 'institution': 'Revolut', 'type': 'CHECKING'},
+    'Revolut Ahorro': {'column': 4, 'name': 'Revolut Savings', 'institution': 'Revolut', 'type': 'SAVINGS'},
+    'MyInvestor (Corriente)': {'column': 5, 'name': 'MyInvestor Corriente', 'institution': 'MyInvestor', 'type': 'CHECKING'},
+    'Trade Republic (Corriente)': {'column': 6, 'name': 'Trade Republic', 'institution': 'Trade Republic', 'type': 'SAVINGS'},
+}
+
+MONTHS_MAP = {
+    'Enero': 1, 'Febrero': 2, 'Marzo': 3, 'Abril': 4, 'Mayo': 5, 'Junio': 6,
+    'Julio': 7, 'Agosto': 8, 'Septiembre': 9, 'Octubre': 10, 'Noviembre': 11, 'Diciembre': 12
+}
+
 class Command(BaseCommand):
     help = 'Imports snapshots from accounts_snapshot.csv with detailed tracking'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--file', type=str, default='accounts_snapshot.csv', help='Path to the CSV file')
+        parser.add_argument('--user', type=str, help='Owner username (defaults to the first superuser)')
+        parser.add_argument('--start-year', type=int, default=2024, help='Year of the rows before the first year marker and first year imported')
+        parser.add_argument('--end-year', type=int, default=2026, help='Last year imported: blocks of later (or earlier) years are skipped')
+        parser.add_argument('--day', type=int, default=28, help='Day of month used for the snapshot date (capped at the last day of each month)')
+        parser.add_argument('--mapping', type=str, help='JSON file with the CSV column -> account mapping')
+
     def handle(self, *args, **options):
-        file_path = 'accounts_snapshot.csv'
-        
+        file_path = options['file']
+        if not 1 <= options['day'] <= 31:
+            raise CommandError(f"--day must be between 1 and 31, got {options['day']}")
+
         if not os.path.exists(file_path):
             self.stdout.write(self.style.ERROR(f'File not found at: {file_path}'))
             return
 
-        # Configuration mapping
-        account_config = {
-            'ING Esp': ('ING Spain Corriente', 'ING Spain', 'CHECKING'),
-            'ING Bel': ('ING Belgium', 'ING Belgium', 'CHECKING'),
-            'Revolut Corriente': ('Revolut Corriente', 'Revolut', 'CHECKING'),
-            'Revolut Ahorro': ('Revolut Savings', 'Revolut', 'SAVINGS'),
-            'MyInvestor (Corriente)': ('MyInvestor Corriente', 'MyInvestor', 'CHECKING'),
-            'Trade Republic (Corriente)': ('Trade Republic', 'Trade Republic', 'SAVINGS'), 
-        }
-
-        months_map = {
-            'Enero': 1, 'Febrero': 2, 'Marzo': 3, 'Abril': 4, 'Mayo': 5, 'Junio': 6,
-            'Julio': 7, 'Agosto': 8, 'Septiembre': 9, 'Octubre': 10, 'Noviembre': 11, 'Diciembre': 12
-        }
-
-        current_year = 2024
+        User = get_user_model()
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+        else:
+            user = User.objects.filter(is_superuser=True).first()
+        if not user:
+            self.stdout.write(self.style.ERROR('User not found'))
+            return
+
+        account_config = DEFAULT_MAPPING
+        if options['mapping']:
+            with open(options['mapping'], encoding='utf-8') as f:
+                account_config = json.load(f)
+
+        year_range = range(options['start_year'], options['end_year'] + 1)
+        current_year = options['start_year']
         processed_count = 0
 
         self.stdout.write(self.style.MIGRATE_LABEL(f"--- Starting import from {file_path} ---"))
 
-        with open(file_path, mode='r', encoding='utf-8-sig') as f:
+        # Upsert por (cuenta, fecha): si el CSV repite un mes gana la última fila
+        snapshots = {}
+
+        # Toda la importación (cuentas incluidas) en una única transacción
+        with open(file_path, mode='r', encoding='utf-8-sig') as f, transaction.atomic():
             reader = csv.reader(f, delimiter=';')
-            header = next(reader)
-            
+            header = [h.strip() for h in next(reader, [])]
+
+            columns = {}
+            for csv_key, config in account_config.items():
+                col_idx = config.get('column')
+                if col_idx is None:
+                    if csv_key not in header:
+                        raise CommandError(f'Column "{csv_key}" not found in the CSV header (set "column" in the mapping)')
+                    col_idx = header.index(csv_key)
+                columns[csv_key] = col_idx
+
+            # Cuentas resueltas una sola vez antes de procesar las filas
+            accounts = {}
+            for csv_key, config in account_config.items():
+                account, created = BankAccount.objects.get_or_create(
+                    user=user,
+                    name=config['name'],
+                    institution=config['institution'],
+                    defaults={
+                        'account_type': config['type'],
+                        'currency': 'EUR'
+                    }
+                )
+                if created:
+                    self.stdout.write(self.style.SUCCESS(f"   Created new account: {config['name']}"))
+                accounts[csv_key] = account
+
             for row in reader:
                 if not row or not any(row):
                     continue
                 
                 # Check for year change rows (e.g., "2025;;;;;;")
                 first_val = row[0].strip()
-                if first_val in ['2024', '2025', '2026']:
+                if len(first_val) == 4 and first_val.isdigit():
                     current_year = int(first_val)
-                    self.stdout.write(self.style.WARNING(f">> Switched to year: {current_year}"))
+                    if current_year in year_range:
+                        self.stdout.write(self.style.WARNING(f">> Switched to year: {current_year}"))
+                    else:
+                        self.stdout.write(self.style.WARNING(f">> Skipping year {current_year} (outside --start-year/--end-year)"))
+                    continue
+
+                # Las filas de un año fuera de rango no se importan (ni se asignan a otro año)
+                if current_year not in year_range:
                     continue
 
                 # Get month
                 month_name = first_val
-                if month_name not in months_map:
+                if month_name not in MONTHS_MAP:
                     self.stdout.write(f"   Skipping row: {first_val} (not a valid month)")
                     continue
                 
-                month_num = months_map[month_name]
-                snapshot_date = date(current_year, month_num, 28)
+                month_num = MONTHS_MAP[month_name]
+                # --day 31 en febrero (o en meses de 30 días) cae en el último día del mes
+                day = min(options['day'], calendar.monthrange(current_year, month_num)[1])
+                snapshot_date = date(current_year, month_num, day)
                 
                 self.stdout.write(f"Processing: {month_name} {current_year}...")
 
-                csv_columns = {
-                    'ING Esp': 1,
-                    'ING Bel': 2,
-                    'Revolut Corriente': 3,
-                    'Revolut Ahorro': 4,
-                    'MyInvestor (Corriente)': 5,
-                    'Trade Republic (Corriente)': 6
-                }
-
-                for csv_key, col_idx in csv_columns.items():
-                    db_name, institution, acc_type = account_config[csv_key]
-                    
+                for csv_key, col_idx in columns.items():
+                    account = accounts[csv_key]
+
                     # Numeric cleaning
                     raw_val = row[col_idx].replace('.', '').replace(',', '.')
                     if raw_val == '-' or not raw_val:
@@ -81,35 +142,32 @@ class Command(BaseCommand):
                         try:
                             balance = Decimal(raw_val)
                         except Exception as e:
-                            self.stdout.write(self.style.ERROR(f"   Error parsing {raw_val} for {db_name}: {e}"))
+                            self.stdout.write(self.style.ERROR(f"   Error parsing {raw_val} for {account.name}: {e}"))
                             balance = Decimal('0.00')
 
-                    # Get or Create Account
-                    account, created = BankAccount.objects.get_or_create(
-                        name=db_name,
-                        defaults={
-                            'institution': institution,
-                            'account_type': acc_type,
-                            'currency': 'EUR'
-                        }
-                    )
-                    if created:
-                        self.stdout.write(self.style.SUCCESS(f"   Created new account: {db_name}"))
-
-                    # Create or Update Snapshot
-                    obj, created_snap = AccountBalanceSnapshot.objects.update_or_create(
+                    snapshots[(account.id, snapshot_date)] = AccountBalanceSnapshot(
+                        user=user,
                         account=account,
                         date=snapshot_date,
-                        defaults={
-                            'balance': balance,
-                            'interest_earned': Decimal('0.00')
-                        }
+                        balance=balance,
+                        interest_earned=Decimal('0.00')
                     )
-                    
-                    action = "Imported" if created_snap else "Updated"
-                    # Opcional: print detallado por cada cuenta (puede generar mucho texto)
-                    # self.stdout.write(f"      {action} {db_name}: {balance}€")
 
                 processed_count += 1
 
-        self.stdout.write(self.style.SUCCESS(f"--- Finished! Processed {processed_count} months of data ---"))
\ No newline at end of file
+            AccountBalanceSnapshot.objects.bulk_create(
+                snapshots.values(),
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=['account', 'date'],
+                update_fields=['balance', 'interest_earned'],
+            )
+
+        # bulk_create no dispara señales: actualizamos la serie de patrimonio y la caché a mano
+        if snapshots:
+            update_net_worth_points(user, min(day for _, day in snapshots))
+        invalidate_user_cache(user)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"--- Finished! Processed {processed_count} months of data ({len(snapshots)} snapshots) ---"
+        ))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from core.services.cache import invalidate_user_cache
+from holdings.services.history import rebuild_net_worth_points
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye la serie mensual de patrimonio (NetWorthPoint) desde snapshots e histórico de activos'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=str, help='Username a reconstruir (por defecto, todos)')
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        user = None
+        if options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"Usuario no encontrado: {options['user']}")
+
+        with transaction.atomic():
+            created = rebuild_net_worth_points(user)
+
+            # La evolución del patrimonio cacheada se lee de NetWorthPoint
+            user_ids = [user.pk] if user else User.objects.values_list('pk', flat=True)
+            for user_id in user_ids:
+                invalidate_user_cache(user_id)
+
+        self.stdout.write(self.style.SUCCESS(f'Serie de patrimonio reconstruida: {created} puntos.'))
@@ -0,0 +1,70 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:16
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+
+
+def _month(day):
+    return date(day.year, day.month, 1)
+
+
+def populate_net_worth(apps, schema_editor):
+    # Carga inicial: último valor de cada cuenta/activo al cierre de cada mes, arrastrando el anterior
+    AccountBalanceSnapshot = apps.get_model('holdings', 'AccountBalanceSnapshot')
+    AssetHistory = apps.get_model('investments', 'AssetHistory')
+    NetWorthPoint = apps.get_model('holdings', 'NetWorthPoint')
+
+    # {usuario: {mes: {('cash'|'inv', id): valor}}}
+    values = defaultdict(lambda: defaultdict(dict))
+    sources = (
+        ('cash', AccountBalanceSnapshot.objects.values_list('account__user_id', 'account_id', 'date', 'balance')),
+        ('inv', AssetHistory.objects.values_list('asset__user_id', 'asset_id', 'date', 'total_value')),
+    )
+    for kind, rows in sources:
+        for user_id, key, day, value in rows.order_by('date'):
+            values[user_id][_month(day)][(kind, key)] = value
+
+    points = []
+    for user_id, by_month in values.items():
+        current = {}
+        month, last = min(by_month), max(by_month)
+        while month <= last:
+            current.update(by_month.get(month, {}))
+            cash = sum((v for (kind, _), v in current.items() if kind == 'cash'), Decimal('0'))
+            inv = sum((v for (kind, _), v in current.items() if kind == 'inv'), Decimal('0'))
+            points.append(NetWorthPoint(user_id=user_id, month=month, cash=cash, investments=inv, total=cash + inv))
+            month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+    NetWorthPoint.objects.bulk_create(points, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('holdings', '0006_alter_accountbalancesnapshot_user'),
+        ('investments', '0008_date_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NetWorthPoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('cash', models.DecimalField(decimal_places=2, default=0, max_digits=20)),
+                ('investments', models.DecimalField(decimal_places=2, default=0, max_digits=20)),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=20)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='net_worth_points', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['month'],
+                'unique_together': {('user', 'month')},
+            },
+        ),
+        migrations.RunPython(populate_net_worth, migrations.RunPython.noop),
+    ]
@@ -52,10 +52,34 @@ class AccountBalanceSnapshot(models.Model):
     )
 
     class Meta:
+        # unique_together ya crea el índice (account, date) de las búsquedas por cuenta
         unique_together = ('account', 'date')
         ordering = ['-date']
         verbose_name = "Balance Snapshot"
         verbose_name_plural = "Balance Snapshots"
 
     def __str__(self):
-        return f"{self.account.name} - {self.date} - {self.balance} {self.account.currency}"
\ No newline at end of file
+        return f"{self.account.name} - {self.date} - {self.balance} {self.account.currency}"
+
+class NetWorthPoint(models.Model):
+    """
+    Patrimonio al cierre de cada mes: último saldo de cada cuenta y último
+    valor de cada activo conocidos. Lo mantienen las señales de
+    holdings.signals (ver holdings.services.history).
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='net_worth_points',
+    )
+    month = models.DateField()
+    cash = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    investments = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    total = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+
+    class Meta:
+        ordering = ['month']
+        unique_together = ('user', 'month')
+
+    def __str__(self):
+        return f"{self.user.username} - {self.month:%Y-%m} - {self.total}"
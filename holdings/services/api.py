@@ -1,6 +1,21 @@
+from core.services.queries import latest_per
+from core.services.cache import cached_per_user
 from holdings.models import AccountBalanceSnapshot, BankAccount
 
 
+def get_latest_snapshots(user, as_of=None):
+    """
+    Último snapshot de cada cuenta del usuario (opcionalmente hasta una fecha)
+    en una sola consulta.
+    """
+    qs = AccountBalanceSnapshot.objects.filter(account__user=user)
+    if as_of:
+        qs = qs.filter(date__lte=as_of)
+
+    return latest_per(qs, 'account_id')
+
+
+@cached_per_user("holdings_value")
 def get_current_value(user):
     """
     Devuelve el valor total actual de las cuentas (cash)
@@ -9,57 +24,66 @@ def get_current_value(user):
     total = 0
     dates = []
 
-    accounts = BankAccount.objects.filter(user=user)
-    for acc in accounts:
-        last_snapshot = (
-            AccountBalanceSnapshot.objects
-            .filter(account=acc)
-            .order_by('-date')
-            .first()
-        )
-        if last_snapshot:
-            total += float(last_snapshot.balance)
-            dates.append(last_snapshot.date)
+    for last_snapshot in get_latest_snapshots(user):
+        total += float(last_snapshot.balance)
+        dates.append(last_snapshot.date)
 
     return total, dates
 
 
 # holdings/services/api.py
 from calendar import monthrange
-from datetime import date
+from datetime import date, timedelta
+from django.db.models import Q
+from core.services.timeseries import month_range, month_offset, forward_fill
 from ..models import BankAccount, AccountBalanceSnapshot
 
 def _get_last_day_of_month(year, month):
     _, last_day = monthrange(year, month)
     return date(year, month, last_day)
 
-def get_annual_balance_evolution(user, year):
-    accounts = BankAccount.objects.filter(user=user)
-    months = range(1, 13)
-    
-    # 1. Estructura para la tabla: Una fila por cuenta
+@cached_per_user("balance_matrix")
+def get_balance_matrix(user, start_date, end_date):
+    """
+    Matriz cuentas x meses con el saldo al cierre de cada mes.
+    Carga en una sola consulta los snapshots del rango más el último anterior
+    al inicio de cada cuenta y arrastra el último saldo conocido.
+    """
+    months = month_range(start_date, end_date)
+    first_month = months[0]
+    cutoff = _get_last_day_of_month(months[-1].year, months[-1].month)
+
+    opening = get_latest_snapshots(user, as_of=first_month - timedelta(days=1))
+    snapshots = (
+        AccountBalanceSnapshot.objects
+        .filter(account__user=user, date__lte=cutoff)
+        .filter(Q(date__gte=first_month) | Q(pk__in=opening.values('pk')))
+        .order_by('date')
+        .values_list('account_id', 'date', 'balance')
+    )
+
+    # Último saldo de cada cuenta en cada mes (ordenado por fecha: gana el último)
+    points = {}
+    for account_id, snap_date, balance in snapshots:
+        offset = month_offset(snap_date, first_month)
+        points.setdefault(account_id, {})[offset] = float(balance)
+
     matrix = []
-    for acc in accounts:
-        row = {'account_name': acc.name, 'balances': []}
-        for month in months:
-            cutoff = _get_last_day_of_month(year, month)
-            snapshot = AccountBalanceSnapshot.objects.filter(
-                account=acc,
-                date__lte=cutoff
-            ).order_by('-date').first()
-            
-            balance = float(snapshot.balance) if snapshot else 0.0
-            row['balances'].append(balance)
-        matrix.append(row)
-
-    # 2. Totales mensuales (Fila inferior de la tabla)
-    monthly_totals = []
-    for month_idx in range(12): # 0 a 11
-        total_month = sum(row['balances'][month_idx] for row in matrix)
-        monthly_totals.append(total_month)
+    for acc in BankAccount.objects.filter(user=user):
+        matrix.append({
+            'account_name': acc.name,
+            'balances': forward_fill(points.get(acc.id, {}), len(months)),
+        })
+
+    monthly_totals = [sum(column) for column in zip(*(row['balances'] for row in matrix))]
+    if not matrix:
+        monthly_totals = [0] * len(months)
 
     return {
         "matrix": matrix,
         "monthly_totals": monthly_totals,
-        "month_names": [date(year, m, 1) for m in months]
-    }
\ No newline at end of file
+        "month_names": months
+    }
+
+def get_annual_balance_evolution(user, year):
+    return get_balance_matrix(user, date(year, 1, 1), date(year, 12, 31))
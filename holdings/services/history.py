@@ -1,62 +1,143 @@
+import threading
 from collections import defaultdict
-from django.db.models import Sum
-from django.db.models.functions import TruncMonth
+from decimal import Decimal
 
-from holdings.models import AccountBalanceSnapshot
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from core.services.cache import cached_per_user, invalidate_user_cache
+from core.services.queries import latest_per
+from core.services.timeseries import month_range, month_start
+from holdings.models import AccountBalanceSnapshot, NetWorthPoint
 from investments.models import AssetHistory
 
+BATCH_SIZE = 1000
 
-def get_net_worth_evolution(user):
+# Mes más antiguo pendiente de recalcular por usuario (por hilo, como las conexiones)
+_pending = threading.local()
+
+
+def _closing_values(qs, partition_field, value_field, start):
     """
-    Calcula la evolución del patrimonio neto desglosado por cash e inversiones.
-    Devuelve una lista ordenada por mes.
+    Devuelve la apertura ({partición: último valor anterior a start}) y el
+    último valor de cada partición en cada mes desde start
+    ({mes: {partición: valor}}), en dos consultas.
     """
+    opening = {}
+    if start:
+        opening = {
+            row[partition_field]: row[value_field]
+            for row in latest_per(qs.filter(date__lt=start), partition_field).values(
+                partition_field, 'date', value_field
+            )
+        }
+        qs = qs.filter(date__gte=start)
 
-    # 1. Cash por mes
-    cash_by_month = (
-        AccountBalanceSnapshot.objects
-        .filter(account__user=user)
-        .annotate(month_trunc=TruncMonth('date'))
-        .values('month_trunc')
-        .annotate(total_cash=Sum('balance'))
-        .order_by('month_trunc')
-    )
+    closing = defaultdict(dict)
+    for partition, day, value in qs.order_by('date').values_list(partition_field, 'date', value_field):
+        closing[month_start(day)][partition] = value
+    return opening, closing
+
+
+def update_net_worth_points(user, start=None):
+    """
+    Recalcula los NetWorthPoint del usuario desde el mes de start (o desde el
+    principio) arrastrando el último valor conocido de cada cuenta y activo.
+    Devuelve el número de puntos escritos.
+    """
+    user_id = getattr(user, 'pk', user)
+    start = month_start(start) if start else None
 
-    # 2. Inversiones por mes
-    inv_by_month = (
-        AssetHistory.objects
-        .filter(asset__user=user)
-        .annotate(month_trunc=TruncMonth('date'))
-        .values('month_trunc')
-        .annotate(total_inv=Sum('total_value'))
-        .order_by('month_trunc')
+    cash, cash_by_month = _closing_values(
+        AccountBalanceSnapshot.objects.filter(account__user_id=user_id), 'account_id', 'balance', start
     )
+    investments, inv_by_month = _closing_values(
+        AssetHistory.objects.filter(asset__user_id=user_id), 'asset_id', 'total_value', start
+    )
+
+    points = []
+    data_months = set(cash_by_month) | set(inv_by_month)
+    if data_months:
+        first = start if start and (cash or investments) else min(data_months)
+        for month in month_range(first, max(data_months)):
+            cash.update(cash_by_month.get(month, {}))
+            investments.update(inv_by_month.get(month, {}))
+            month_cash = sum(cash.values(), Decimal('0'))
+            month_inv = sum(investments.values(), Decimal('0'))
+            points.append(NetWorthPoint(
+                user_id=user_id,
+                month=month,
+                cash=month_cash,
+                investments=month_inv,
+                total=month_cash + month_inv,
+            ))
+
+    stale = NetWorthPoint.objects.filter(user_id=user_id)
+    if start:
+        stale = stale.filter(month__gte=start)
+
+    with transaction.atomic():
+        stale.delete()
+        NetWorthPoint.objects.bulk_create(points, batch_size=BATCH_SIZE)
+
+    return len(points)
 
-    # 3. Consolidación
-    consolidated = defaultdict(lambda: {'cash': 0.0, 'inv': 0.0})
 
-    for entry in cash_by_month:
-        month = entry['month_trunc']
-        if month:
-            consolidated[month]['cash'] = float(entry['total_cash'] or 0)
+def _pending_starts():
+    if not hasattr(_pending, 'starts'):
+        _pending.starts = {}
+    return _pending.starts
 
-    for entry in inv_by_month:
-        month = entry['month_trunc']
-        if month:
-            consolidated[month]['inv'] = float(entry['total_inv'] or 0)
 
-    # 4. Lista final ordenada
-    history = []
-    for month in sorted(consolidated.keys()):
-        cash = consolidated[month]['cash']
-        inv = consolidated[month]['inv']
+def _run_pending_update(user_id):
+    pending = _pending_starts()
+    if user_id not in pending:
+        # Ya recalculado por una llamada anterior de la misma transacción
+        return
+    update_net_worth_points(user_id, pending.pop(user_id))
+    # Tras escribir los puntos: nadie cachea la serie anterior bajo la versión nueva
+    invalidate_user_cache(user_id)
 
-        history.append({
+
+def schedule_net_worth_update(user, start):
+    """
+    Recalcula los NetWorthPoint del usuario tras el commit, desde el mes más
+    antiguo afectado. Los cambios de una misma transacción (por ejemplo el
+    borrado en cascada de una cuenta con todos sus snapshots) se agrupan en un
+    único recálculo por usuario en lugar de uno por fila.
+    """
+    user_id = getattr(user, 'pk', user)
+    pending = _pending_starts()
+    pending[user_id] = min(start, pending.get(user_id, start))
+    transaction.on_commit(lambda: _run_pending_update(user_id))
+
+
+def rebuild_net_worth_points(user=None):
+    """Reconstruye la serie completa de un usuario o de todos."""
+    if user is not None:
+        return update_net_worth_points(user)
+
+    user_ids = get_user_model().objects.values_list('pk', flat=True)
+    return sum(update_net_worth_points(user_id) for user_id in user_ids)
+
+
+@cached_per_user("net_worth_evolution")
+def get_net_worth_evolution(user):
+    """
+    Evolución del patrimonio neto desglosado por cash e inversiones, leída
+    de NetWorthPoint. Devuelve una lista ordenada por mes.
+    """
+    points = NetWorthPoint.objects.filter(user=user).order_by('month').values_list(
+        'month', 'cash', 'investments', 'total'
+    )
+
+    return [
+        {
             'date': month,
             'label': month.strftime('%b %y'),
-            'savings': cash,
-            'investments': inv,
-            'value': cash + inv,
-        })
-
-    return history
+            'savings': float(cash),
+            'investments': float(inv),
+            'value': float(total),
+        }
+        for month, cash, inv, total in points
+    ]
@@ -0,0 +1,34 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from investments.models import AssetHistory
+from .models import AccountBalanceSnapshot
+from .services.history import schedule_net_worth_update
+
+# Modelos cuyos valores componen NetWorthPoint
+NET_WORTH_MODELS = [AccountBalanceSnapshot, AssetHistory]
+
+
+def remember_previous_date(sender, instance, **kwargs):
+    # Si la edición mueve el registro a otro mes hay que recalcular desde el menor
+    instance._previous_net_worth_date = None
+    if instance.pk:
+        instance._previous_net_worth_date = (
+            sender.objects.filter(pk=instance.pk).values_list('date', flat=True).first()
+        )
+
+
+def update_net_worth_on_save(sender, instance, **kwargs):
+    dates = [instance.date, getattr(instance, '_previous_net_worth_date', None)]
+    schedule_net_worth_update(instance.user_id, min(d for d in dates if d))
+
+
+def update_net_worth_on_delete(sender, instance, **kwargs):
+    schedule_net_worth_update(instance.user_id, instance.date)
+
+
+def connect_signals():
+    for model in NET_WORTH_MODELS:
+        label = model._meta.label
+        pre_save.connect(remember_previous_date, sender=model, dispatch_uid=f"net_worth:{label}:pre_save")
+        post_save.connect(update_net_worth_on_save, sender=model, dispatch_uid=f"net_worth:{label}:save")
+        post_delete.connect(update_net_worth_on_delete, sender=model, dispatch_uid=f"net_worth:{label}:delete")
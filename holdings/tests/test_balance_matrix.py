@@ -0,0 +1,55 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from datetime import date
+
+from holdings.models import BankAccount, AccountBalanceSnapshot
+from holdings.services.api import get_annual_balance_evolution, get_balance_matrix
+
+User = get_user_model()
+
+
+class BalanceMatrixTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="test", password="1234")
+
+        self.checking = BankAccount.objects.create(
+            user=self.user, name="Checking", institution="Bank", account_type="CHECKING"
+        )
+        self.savings = BankAccount.objects.create(
+            user=self.user, name="Savings", institution="Bank", account_type="SAVINGS"
+        )
+        BankAccount.objects.create(
+            user=self.user, name="Empty", institution="Bank", account_type="CASH"
+        )
+
+        for account, snap_date, balance in [
+            (self.checking, date(2023, 6, 30), 50),
+            (self.checking, date(2023, 11, 30), 100),
+            (self.checking, date(2024, 3, 1), 150),
+            (self.checking, date(2024, 3, 31), 300),
+            (self.savings, date(2024, 2, 15), 1000),
+            (self.savings, date(2025, 1, 31), 2000),
+        ]:
+            AccountBalanceSnapshot.objects.create(
+                user=self.user, account=account, date=snap_date, balance=balance
+            )
+
+    def test_annual_matrix_forward_fills(self):
+        with self.assertNumQueries(2):
+            data = get_annual_balance_evolution(self.user, 2024)
+
+        rows = {row["account_name"]: row["balances"] for row in data["matrix"]}
+        self.assertEqual(rows["Checking"][:4], [100.0, 100.0, 300.0, 300.0])
+        self.assertEqual(rows["Checking"][-1], 300.0)
+        self.assertEqual(rows["Savings"][:3], [0.0, 1000.0, 1000.0])
+        self.assertEqual(rows["Empty"], [0.0] * 12)
+        self.assertEqual(data["monthly_totals"][:3], [100.0, 1100.0, 1300.0])
+        self.assertEqual(data["month_names"][0], date(2024, 1, 1))
+
+    def test_multi_year_range(self):
+        data = get_balance_matrix(self.user, date(2023, 12, 1), date(2025, 1, 31))
+
+        self.assertEqual(len(data["month_names"]), 14)
+        self.assertEqual(data["monthly_totals"][0], 100.0)
+        self.assertEqual(data["monthly_totals"][-1], 2300.0)
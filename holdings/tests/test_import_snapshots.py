@@ -0,0 +1,116 @@
+import os
+import tempfile
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from holdings.models import BankAccount, AccountBalanceSnapshot
+
+User = get_user_model()
+
+CSV_CONTENT = """2024;ING Esp;ING Bel;Revolut Corriente;Revolut Ahorro;MyInvestor (Corriente);Trade Republic (Corriente);Remuneración Global
+Noviembre;321,86;0;645;2182;0;0;-
+Diciembre;882,96;99,85;382,79;3587,47;0;0;-
+2025;;;;;;;
+Enero;1.000,50;-;10;20;30;40;-
+"""
+
+
+class ImportSnapshotsCommandTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="saver", password="1234")
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            f.write(CSV_CONTENT)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_import_upserts_snapshots(self):
+        call_command("import_snapshots", file=self.path, user="saver", stdout=StringIO())
+
+        self.assertEqual(BankAccount.objects.filter(user=self.user).count(), 6)
+        self.assertEqual(AccountBalanceSnapshot.objects.filter(user=self.user).count(), 18)
+
+        ing = AccountBalanceSnapshot.objects.get(account__name="ING Spain Corriente", date=date(2025, 1, 28))
+        self.assertEqual(ing.balance, Decimal("1000.50"))
+
+        # Reimportar actualiza los saldos existentes en vez de duplicarlos
+        ing.balance = 1
+        ing.save()
+        call_command("import_snapshots", file=self.path, user="saver", stdout=StringIO())
+
+        ing.refresh_from_db()
+        self.assertEqual(ing.balance, Decimal("1000.50"))
+        self.assertEqual(AccountBalanceSnapshot.objects.filter(user=self.user).count(), 18)
+
+    def test_column_mapping_and_year_range(self):
+        mapping_handle, mapping_path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(mapping_handle, "w", encoding="utf-8") as f:
+            f.write('{"Revolut Ahorro": {"name": "Savings", "institution": "Revolut", "type": "SAVINGS"}}')
+
+        try:
+            call_command(
+                "import_snapshots", file=self.path, user="saver", mapping=mapping_path,
+                start_year=2023, end_year=2024, day=1, stdout=StringIO()
+            )
+        finally:
+            os.remove(mapping_path)
+
+        # "2025" queda fuera del rango: sus filas se descartan, no pasan a otro año
+        self.assertEqual(
+            list(AccountBalanceSnapshot.objects.order_by("date").values_list("date", "balance")),
+            [
+                (date(2023, 11, 1), Decimal("2182")),
+                (date(2023, 12, 1), Decimal("3587.47")),
+            ]
+        )
+
+    def test_out_of_range_year_does_not_overwrite_existing_snapshots(self):
+        account = BankAccount.objects.create(
+            user=self.user, name="ING Spain Corriente", institution="ING Spain", account_type="CHECKING"
+        )
+        AccountBalanceSnapshot.objects.create(
+            user=self.user, account=account, date=date(2024, 1, 28), balance=Decimal("777")
+        )
+
+        call_command("import_snapshots", file=self.path, user="saver", end_year=2024, stdout=StringIO())
+
+        self.assertEqual(
+            AccountBalanceSnapshot.objects.get(account=account, date=date(2024, 1, 28)).balance, Decimal("777")
+        )
+        self.assertFalse(AccountBalanceSnapshot.objects.filter(date__year=2025).exists())
+
+    def test_day_is_capped_at_month_length(self):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("Febrero;5;0;0;0;0;0;-\nAbril;6;0;0;0;0;0;-\n")
+
+        call_command("import_snapshots", file=self.path, user="saver", day=31, stdout=StringIO())
+
+        dates = set(AccountBalanceSnapshot.objects.filter(
+            account__name="ING Spain Corriente"
+        ).values_list("date", flat=True))
+        self.assertEqual(dates, {date(2024, 11, 30), date(2024, 12, 31), date(2025, 1, 31),
+                                 date(2025, 2, 28), date(2025, 4, 30)})
+
+    def test_invalid_day_is_an_error(self):
+        with self.assertRaisesMessage(CommandError, "--day must be between 1 and 31"):
+            call_command("import_snapshots", file=self.path, user="saver", day=32, stdout=StringIO())
+
+    def test_missing_mapped_column_is_an_error(self):
+        mapping_handle, mapping_path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(mapping_handle, "w", encoding="utf-8") as f:
+            f.write('{"N26": {"name": "N26", "institution": "N26", "type": "CHECKING"}}')
+
+        try:
+            with self.assertRaisesMessage(CommandError, 'Column "N26" not found'):
+                call_command("import_snapshots", file=self.path, user="saver", mapping=mapping_path, stdout=StringIO())
+        finally:
+            os.remove(mapping_path)
+        self.assertFalse(BankAccount.objects.filter(user=self.user).exists())
@@ -0,0 +1,43 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from datetime import date
+
+from holdings.models import BankAccount, AccountBalanceSnapshot
+from holdings.services.api import get_current_value, get_latest_snapshots
+
+User = get_user_model()
+
+
+class LatestSnapshotsTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="test", password="1234")
+        other = User.objects.create_user(username="other", password="1234")
+
+        for idx, owner in enumerate([self.user, self.user, self.user, other]):
+            account = BankAccount.objects.create(
+                user=owner, name=f"Account {idx}", institution="Bank", account_type="CHECKING"
+            )
+            for month, balance in [(1, 100), (2, 200), (3, 300)]:
+                AccountBalanceSnapshot.objects.create(
+                    user=owner,
+                    account=account,
+                    date=date(2024, month, 28),
+                    balance=balance * (idx + 1)
+                )
+
+    def test_get_current_value_single_query(self):
+        with self.assertNumQueries(1):
+            value, dates = get_current_value(self.user)
+
+        self.assertEqual(value, 300 + 600 + 900)
+        self.assertEqual(dates, [date(2024, 3, 28)] * 3)
+
+    def test_latest_snapshots_as_of(self):
+        snapshots = get_latest_snapshots(self.user, as_of=date(2024, 2, 28))
+
+        self.assertEqual(
+            sorted(float(s.balance) for s in snapshots),
+            [200.0, 400.0, 600.0]
+        )
+        self.assertFalse(get_latest_snapshots(self.user, as_of=date(2023, 12, 31)).exists())
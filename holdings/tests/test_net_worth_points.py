@@ -0,0 +1,123 @@
+from unittest import mock
+
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from datetime import date
+from io import StringIO
+
+from holdings.models import BankAccount, AccountBalanceSnapshot, NetWorthPoint
+from holdings.services.history import (
+    get_net_worth_evolution,
+    rebuild_net_worth_points,
+    update_net_worth_points,
+)
+from investments.models import Asset, AssetHistory
+
+User = get_user_model()
+
+
+def _series(user):
+    return list(NetWorthPoint.objects.filter(user=user).values_list('month', 'cash', 'investments', 'total'))
+
+
+class NetWorthPointTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="test", password="1234")
+        self.checking = BankAccount.objects.create(
+            user=self.user, name="Checking", institution="Bank", account_type="CHECKING"
+        )
+        self.savings = BankAccount.objects.create(
+            user=self.user, name="Savings", institution="Bank", account_type="SAVINGS"
+        )
+        self.asset = Asset.objects.create(user=self.user, name="ETF", category="INDEX_FUND")
+
+        # La serie se recalcula tras el commit
+        with self.captureOnCommitCallbacks(execute=True):
+            for account, snap_date, balance in [
+                (self.checking, date(2024, 1, 10), 100),
+                (self.checking, date(2024, 1, 31), 300),
+                (self.savings, date(2024, 1, 31), 1000),
+                (self.checking, date(2024, 3, 31), 500),
+            ]:
+                AccountBalanceSnapshot.objects.create(
+                    user=self.user, account=account, date=snap_date, balance=balance
+                )
+            self.history = AssetHistory.objects.create(
+                user=self.user, asset=self.asset, date=date(2024, 2, 29), total_value=2000
+            )
+
+    def assert_matches_rebuild(self):
+        incremental = _series(self.user)
+        rebuild_net_worth_points(self.user)
+        self.assertEqual(incremental, _series(self.user))
+
+    def test_takes_last_value_per_month_and_forward_fills(self):
+        self.assertEqual(
+            [(m, float(c), float(i), float(t)) for m, c, i, t in _series(self.user)],
+            [
+                (date(2024, 1, 1), 1300.0, 0.0, 1300.0),
+                (date(2024, 2, 1), 1300.0, 2000.0, 3300.0),
+                (date(2024, 3, 1), 1500.0, 2000.0, 3500.0),
+            ],
+        )
+        self.assert_matches_rebuild()
+
+    def test_edits_and_deletes_update_incrementally(self):
+        snapshot = AccountBalanceSnapshot.objects.get(account=self.checking, date=date(2024, 3, 31))
+        snapshot.date = date(2024, 5, 31)
+        with self.captureOnCommitCallbacks(execute=True):
+            snapshot.save()
+        self.assertEqual(_series(self.user)[-1][0], date(2024, 5, 1))
+        self.assert_matches_rebuild()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            snapshot.delete()
+            self.history.delete()
+        self.assertEqual([point[0] for point in _series(self.user)], [date(2024, 1, 1)])
+        self.assert_matches_rebuild()
+
+    def test_evolution_reads_series_in_one_query(self):
+        with self.assertNumQueries(1):
+            history = get_net_worth_evolution.uncached(self.user)
+        self.assertEqual(
+            [(p['date'], p['savings'], p['investments'], p['value']) for p in history][-1],
+            (date(2024, 3, 1), 1500.0, 2000.0, 3500.0),
+        )
+
+    def test_cascade_delete_recomputes_once(self):
+        with mock.patch(
+            'holdings.services.history.update_net_worth_points', wraps=update_net_worth_points
+        ) as update:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.checking.delete()
+
+        update.assert_called_once_with(self.user.pk, date(2024, 1, 10))
+        self.assertEqual(
+            [(m, float(c)) for m, c, _, _ in _series(self.user)],
+            [(date(2024, 1, 1), 1000.0), (date(2024, 2, 1), 1000.0)],
+        )
+        self.assert_matches_rebuild()
+
+    def test_rolled_back_changes_do_not_block_later_updates(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            AccountBalanceSnapshot.objects.create(
+                user=self.user, account=self.savings, date=date(2023, 12, 31), balance=50
+            )
+            raise IntegrityError
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AccountBalanceSnapshot.objects.create(
+                user=self.user, account=self.savings, date=date(2024, 3, 31), balance=2000
+            )
+        self.assertEqual(float(_series(self.user)[-1][3]), 4500.0)
+        self.assert_matches_rebuild()
+
+    def test_rebuild_command(self):
+        NetWorthPoint.objects.all().delete()
+        out = StringIO()
+        call_command('rebuild_net_worth', user=self.user.username, stdout=out)
+        self.assertIn('3 puntos', out.getvalue())
+        self.assertEqual(len(_series(self.user)), 3)
@@ -4,9 +4,15 @@ from datetime import date, timedelta
 from decimal import Decimal, InvalidOperation
 
 # Django imports
+from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from core.services.cache import invalidate_user_cache
 from investments.models import Asset, Transaction
 
+AMOUNT_QUANT = Decimal('0.01')
+SHARES_QUANT = Decimal('0.00000001')
+
 class Command(BaseCommand):
     help = 'Importa transacciones de inversión desde un archivo CSV'
 
@@ -18,14 +24,36 @@ class Command(BaseCommand):
             help='Ruta al archivo CSV', 
             default='migracion_inversiones.csv'
         )
+        parser.add_argument(
+            '--user',
+            type=str,
+            help='Username propietario de los activos (por defecto, el primer superusuario)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Filas por cada bulk_create'
+        )
 
     def handle(self, *args, **options):
         file_path = options['file']
+        batch_size = options['batch_size']
 
         if not os.path.exists(file_path):
             self.stdout.write(self.style.ERROR(f"Archivo no encontrado: {file_path}"))
             return
 
+        User = get_user_model()
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+        else:
+            user = User.objects.filter(is_superuser=True).first()
+
+        if not user:
+            self.stdout.write(self.style.ERROR('Error: Usuario no encontrado.'))
+            return
+
         # Mapeo de activos (lo mantenemos igual)
         ASSET_MAPPING = {
             'Vanguard Emerging Markets Stock Index Fund EUR Acc': {'name': 'Vanguard Emerging Markets', 'cat': 'INDEX_FUND'},
@@ -38,7 +66,17 @@ class Command(BaseCommand):
         skipped_duplicates = 0
         skipped_invalid_date = 0
 
-        with open(file_path, encoding='utf-8-sig') as f:
+        # ---- Activos y claves existentes (una consulta cada uno) ----
+        assets = {asset.name: asset for asset in Asset.objects.filter(user=user)}
+        existing_keys = set(
+            Transaction.objects
+            .filter(asset__user=user)
+            .values_list('asset_id', 'date', 'action', 'shares', 'amount')
+        )
+
+        pending = []
+
+        with open(file_path, encoding='utf-8-sig') as f, transaction.atomic():
             reader = csv.DictReader(f, delimiter=';')
             # Limpiar espacios en los nombres de las columnas
             reader.fieldnames = [h.strip() for h in reader.fieldnames]
@@ -60,36 +98,33 @@ class Command(BaseCommand):
                 orig_name = row['Nombre Fondo/Activo'].strip()
                 info = ASSET_MAPPING.get(orig_name, {'name': orig_name, 'cat': 'INDEX_FUND'})
 
-                asset, _ = Asset.objects.get_or_create(
-                    name=info['name'],
-                    defaults={
-                        'category': info['cat'],
-                        'platform': row['Entidad'].strip(),
-                        'isin': row['ISIN'].strip()
-                    }
-                )
+                asset = assets.get(info['name'])
+                if asset is None:
+                    asset = Asset.objects.create(
+                        user=user,
+                        name=info['name'],
+                        category=info['cat'],
+                        platform=row['Entidad'].strip(),
+                        isin=row['ISIN'].strip()
+                    )
+                    assets[asset.name] = asset
 
                 # ---- Datos de transacción ----
                 action = row['Compra/Venta'].strip().upper()
-                shares = self.clean_decimal(row['Participaciones'])
-                amount = self.clean_decimal(row['Cantidad'])
+                shares = self.clean_decimal(row['Participaciones']).quantize(SHARES_QUANT)
+                amount = self.clean_decimal(row['Cantidad']).quantize(AMOUNT_QUANT)
                 price = self.clean_decimal(row['Valor liquidativo'])
                 notes = str(row['Comentarios']).strip() if row['Comentarios'] else ''
 
-                # ---- Anti-duplicados ----
-                exists = Transaction.objects.filter(
-                    asset=asset,
-                    date=tx_date,
-                    action=action,
-                    shares=shares,
-                    amount=amount
-                ).exists()
-
-                if exists:
+                # ---- Anti-duplicados (en BD y dentro del propio fichero) ----
+                key = (asset.id, tx_date, action, shares, amount)
+                if key in existing_keys:
                     skipped_duplicates += 1
                     continue
+                existing_keys.add(key)
 
-                Transaction.objects.create(
+                pending.append(Transaction(
+                    user=user,
                     asset=asset,
                     date=tx_date,
                     action=action,
@@ -97,8 +132,17 @@ class Command(BaseCommand):
                     price_per_share=price,
                     amount=amount,
                     notes=notes
-                )
-                imported += 1
+                ))
+
+                if len(pending) >= batch_size:
+                    imported += len(Transaction.objects.bulk_create(pending))
+                    pending = []
+
+            if pending:
+                imported += len(Transaction.objects.bulk_create(pending))
+
+        # bulk_create no dispara señales: invalidamos la caché a mano
+        invalidate_user_cache(user)
 
         # ---- Informe Final ----
         self.stdout.write("\n" + self.style.SUCCESS("========== INFORME DE IMPORTACIÓN =========="))
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investments', '0007_alter_transaction_price_per_share_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assethistory',
+            index=models.Index(fields=['asset', 'date'], name='inv_hist_asset_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['asset', 'date'], name='inv_tx_asset_date_idx'),
+        ),
+    ]
@@ -66,6 +66,9 @@ class Transaction(models.Model):
         ordering = ['-date']
         verbose_name = "Transaction"
         verbose_name_plural = "Transactions"
+        indexes = [
+            models.Index(fields=['asset', 'date'], name='inv_tx_asset_date_idx'),
+        ]
 
 
 class AssetHistory(models.Model):
@@ -84,4 +87,7 @@ class AssetHistory(models.Model):
     class Meta:
         ordering = ['-date']
         verbose_name = "Asset History"
-        verbose_name_plural = "Asset Histories"
\ No newline at end of file
+        verbose_name_plural = "Asset Histories"
+        indexes = [
+            models.Index(fields=['asset', 'date'], name='inv_hist_asset_date_idx'),
+        ]
\ No newline at end of file
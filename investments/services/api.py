@@ -1,11 +1,45 @@
-from django.db.models import Sum
-from investments.models import Asset, Transaction
+from datetime import date
+
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from core.services.cache import cached_per_user
+from investments.models import Asset, AssetHistory, Transaction
 
 EXCLUDE_ASSET_NAME = "Family Investments"
 
 
+def _get_assets_with_market_data(user):
+    """
+    Activos del usuario anotados con su último registro de mercado y lo
+    invertido hasta esa fecha (todo si no hay histórico), en una consulta.
+    """
+    last_history = AssetHistory.objects.filter(asset=OuterRef("pk")).order_by("-date")
+
+    invested = (
+        Transaction.objects
+        .filter(
+            asset=OuterRef("pk"),
+            date__lte=Coalesce(OuterRef("last_market_date"), Value(date.max)),
+        )
+        .order_by()
+        .values("asset")
+        .annotate(total=Sum("amount"))
+        .values("total")
+    )
+
+    return Asset.objects.filter(user=user).annotate(
+        last_market_date=Subquery(last_history.values("date")[:1]),
+        last_market_value=Subquery(last_history.values("total_value")[:1]),
+        invested=Subquery(
+            invested,
+            output_field=DecimalField(max_digits=20, decimal_places=2),
+        ),
+    )
+
+
+@cached_per_user("portfolio_overview")
 def get_portfolio_overview(user):
-    assets = Asset.objects.filter(user=user)
+    assets = _get_assets_with_market_data(user)
 
     portfolio = []
     global_invested = 0
@@ -15,19 +49,14 @@ def get_portfolio_overview(user):
     temp = []
 
     for asset in assets:
-        last_market_record = asset.history.order_by("-date").first()
-        last_market_date = last_market_record.date if last_market_record else None
+        last_market_date = asset.last_market_date
 
         if last_market_date:
             last_market_dates.append(last_market_date)
 
-        tx_qs = asset.transactions.all()
-        if last_market_date:
-            tx_qs = tx_qs.filter(date__lte=last_market_date)
-
-        invested = tx_qs.aggregate(total=Sum("amount"))["total"] or 0
+        invested = asset.invested or 0
         current_value = (
-            last_market_record.total_value if last_market_record else invested
+            asset.last_market_value if last_market_date else invested
         )
 
         profit_loss = current_value - invested
@@ -84,87 +113,116 @@ def get_portfolio_overview(user):
 
 
 from calendar import monthrange
-from datetime import date
-from django.db.models import Sum
-from ..models import Asset 
+from itertools import accumulate
+from django.db.models import Q
+from django.db.models.functions import TruncMonth
+from core.services.queries import latest_per
+from core.services.timeseries import (
+    month_range, month_offset, forward_fill, opening_value
+)
 
 def _get_last_day_of_month(year, month):
     _, last_day = monthrange(year, month)
     return date(year, month, last_day)
 
-def get_annual_portfolio_evolution(user, year):
-    assets = Asset.objects.filter(user=user)
+def _load_asset_series(user, months, cutoff):
+    """
+    Series por activo alineadas con `months`: aportaciones del mes,
+    invertido acumulado y valor de mercado (arrastrando el último registro).
+    Además devuelve el valor de mercado de apertura (antes del primer mes).
+    """
+    first_month = months[0]
+    size = len(months)
+
+    contributions = (
+        Transaction.objects
+        .filter(asset__user=user, date__lte=cutoff)
+        .exclude(asset__name=EXCLUDE_ASSET_NAME)
+        .annotate(month=TruncMonth("date"))
+        .values_list("asset_id", "month")
+        .annotate(total=Sum("amount"))
+        .order_by()
+    )
+
+    history_qs = AssetHistory.objects.filter(asset__user=user).exclude(asset__name=EXCLUDE_ASSET_NAME)
+    opening = latest_per(history_qs.filter(date__lt=first_month), "asset_id")
+    history = (
+        history_qs
+        .filter(date__lte=cutoff)
+        .filter(Q(date__gte=first_month) | Q(pk__in=opening.values("pk")))
+        .order_by("date")
+        .values_list("asset_id", "date", "total_value")
+    )
+
+    contrib_points = {}
+    opening_invested = {}
+    for asset_id, month, total in contributions:
+        offset = month_offset(month, first_month)
+        if offset < 0:
+            opening_invested[asset_id] = opening_invested.get(asset_id, 0.0) + float(total)
+        else:
+            contrib_points.setdefault(asset_id, [0.0] * size)[offset] += float(total)
+
+    market_points = {}
+    for asset_id, hist_date, value in history:
+        market_points.setdefault(asset_id, {})[month_offset(hist_date, first_month)] = float(value)
+
+    series = {}
+    opening_market_value = 0.0
+    for asset_id in set(contrib_points) | set(opening_invested) | set(market_points):
+        contrib = contrib_points.get(asset_id, [0.0] * size)
+        invested = list(accumulate(contrib, initial=opening_invested.get(asset_id, 0.0)))[1:]
+        points = market_points.get(asset_id, {})
+        market = [
+            inv if value is None else value
+            for inv, value in zip(invested, forward_fill(points, size, default=None))
+        ]
+        opening_market_value += opening_value(points)
+        series[asset_id] = (contrib, invested, market)
+
+    return series, opening_market_value
+
+@cached_per_user("portfolio_evolution")
+def get_portfolio_evolution(user, start_date, end_date):
+    """
+    Evolución mensual de la cartera (sin Family Investments) entre dos fechas,
+    calculada a partir de dos consultas: aportaciones e histórico de mercado.
+    """
+    months = month_range(start_date, end_date)
+    cutoff = _get_last_day_of_month(months[-1].year, months[-1].month)
+    series, previous_market_value = _load_asset_series(user, months, cutoff)
+
+    def column_totals(position):
+        return [sum(col) for col in zip(*(s[position] for s in series.values()))] or [0.0] * len(months)
+
+    contributions = column_totals(0)
+    invested = column_totals(1)
+    market_values = column_totals(2)
+
     monthly_data = []
-    EXCLUDE_NAME = "Family Investments"
-
-    # Variable para arrastrar el valor del mes anterior
-    previous_market_value = 0.0
-
-    for month in range(1, 13):
-        cutoff_date = _get_last_day_of_month(year, month)
-        
-        monthly_stats = {
-            "month": month,
-            "date_obj": date(year, month, 1),
-            "invested": 0.0,
-            "market_value": 0.0,
-            "contributions": 0.0,
-            "profit_loss": 0.0,
-            "roi": 0.0
-        }
-
-        for asset in assets:
-            if asset.name == EXCLUDE_NAME:
-                continue
-
-            # 1. Invertido ACUMULADO hasta hoy
-            invested = asset.transactions.filter(
-                date__lte=cutoff_date
-            ).aggregate(t=Sum("amount"))["t"] or 0
-
-            # 2. Aportaciones del mes
-            month_contrib = asset.transactions.filter(
-                date__year=year, 
-                date__month=month
-            ).aggregate(t=Sum("amount"))["t"] or 0
-
-            # 3. Valor de mercado fin de mes
-            history = asset.history.filter(
-                date__lte=cutoff_date
-            ).order_by('-date').first()
-            
-            market_val = history.total_value if history else invested
-
-            monthly_stats["invested"] += float(invested)
-            monthly_stats["market_value"] += float(market_val)
-            monthly_stats["contributions"] += float(month_contrib)
-
-        # --- CÁLCULO CORREGIDO DE PROFIT/LOSS MENSUAL ---
+    for idx, month_date in enumerate(months):
         # Formula: MV(actual) - MV(anterior) - Aportaciones(mes)
-        if month == 1:
-            # Para enero, el MV anterior es el MV del 31 de diciembre del año pasado
-            last_day_prev_year = date(year - 1, 12, 31)
-            # Reutilizamos lógica para buscar el valor de cierre del año pasado
-            prev_mv_total = 0
-            for asset in assets:
-                if asset.name == EXCLUDE_NAME: continue
-                h = asset.history.filter(date__lte=last_day_prev_year).order_by('-date').first()
-                prev_mv_total += float(h.total_value if h else 0)
-            previous_market_value = prev_mv_total
-
-        monthly_stats["profit_loss"] = (
-            monthly_stats["market_value"] - previous_market_value - monthly_stats["contributions"]
-        )
+        profit_loss = market_values[idx] - previous_market_value - contributions[idx]
 
-        # ROI mensual: (Beneficio del mes / Valor al inicio del mes + aportaciones)
-        # Una forma simple es: beneficio / valor anterior (si valor anterior > 0)
-        divisor = previous_market_value + monthly_stats["contributions"]
+        # ROI mensual: beneficio del mes / (valor anterior + aportaciones)
+        roi = 0.0
+        divisor = previous_market_value + contributions[idx]
         if divisor > 0:
-            monthly_stats["roi"] = (monthly_stats["profit_loss"] / divisor) * 100
+            roi = (profit_loss / divisor) * 100
+
+        monthly_data.append({
+            "month": month_date.month,
+            "date_obj": month_date,
+            "invested": invested[idx],
+            "market_value": market_values[idx],
+            "contributions": contributions[idx],
+            "profit_loss": profit_loss,
+            "roi": roi
+        })
 
-        # Actualizamos para el siguiente mes
-        previous_market_value = monthly_stats["market_value"]
+        previous_market_value = market_values[idx]
 
-        monthly_data.append(monthly_stats)
+    return monthly_data
 
-    return monthly_data
\ No newline at end of file
+def get_annual_portfolio_evolution(user, year):
+    return get_portfolio_evolution(user, date(year, 1, 1), date(year, 12, 31))
@@ -1,46 +1,30 @@
 from django.db.models import Sum
 from django.db.models.functions import TruncMonth
 
+from core.services.cache import cached_per_user
 from investments.models import Transaction, AssetHistory
 
 EXCLUDE_ASSET_NAME = "Family Investments"
 
 
-def get_performance_history(user):
-    contributions = (
-        Transaction.objects
-        .filter(asset__user=user)
-        .exclude(asset__name=EXCLUDE_ASSET_NAME)
-        .annotate(month=TruncMonth("date"))
-        .values("month")
-        .annotate(total=Sum("amount"))
-        .order_by("month")
-    )
+def _month_index(rows, value_key="total"):
+    """Materializa filas agrupadas por mes en {mes: valor} (búsquedas O(1))."""
+    return {row["month"]: row[value_key] for row in rows if row["month"]}
 
-    market_history = (
-        AssetHistory.objects
-        .filter(asset__user=user)
-        .exclude(asset__name=EXCLUDE_ASSET_NAME)
-        .annotate(month=TruncMonth("date"))
-        .values("month")
-        .annotate(total=Sum("total_value"))
-        .order_by("month")
-    )
 
-    all_months = sorted(set(
-        [c["month"] for c in contributions if c["month"]] +
-        [m["month"] for m in market_history if m["month"]]
-    ))
+def build_performance_history(contributions, market_history):
+    contrib_by_month = _month_index(contributions)
+    market_by_month = _month_index(market_history)
+    all_months = sorted(set(contrib_by_month) | set(market_by_month))
 
     history = []
     running_invested = 0
     last_market_value = 0
 
     for m in all_months:
-        contrib = next((c["total"] for c in contributions if c["month"] == m), 0)
-        running_invested += float(contrib or 0)
+        running_invested += float(contrib_by_month.get(m) or 0)
 
-        market = next((mh["total"] for mh in market_history if mh["month"] == m), None)
+        market = market_by_month.get(m)
         if market is not None:
             last_market_value = float(market)
         else:
@@ -55,6 +39,31 @@ def get_performance_history(user):
     return history
 
 
+@cached_per_user("performance_history")
+def get_performance_history(user):
+    contributions = (
+        Transaction.objects
+        .filter(asset__user=user)
+        .exclude(asset__name=EXCLUDE_ASSET_NAME)
+        .annotate(month=TruncMonth("date"))
+        .values("month")
+        .annotate(total=Sum("amount"))
+        .order_by("month")
+    )
+
+    market_history = (
+        AssetHistory.objects
+        .filter(asset__user=user)
+        .exclude(asset__name=EXCLUDE_ASSET_NAME)
+        .annotate(month=TruncMonth("date"))
+        .values("month")
+        .annotate(total=Sum("total_value"))
+        .order_by("month")
+    )
+
+    return build_performance_history(contributions, market_history)
+
+
 def get_allocation_chart(chart_assets):
     sorted_assets = sorted(
         chart_assets,
@@ -69,6 +78,27 @@ def get_allocation_chart(chart_assets):
 
 
 
+def build_contributions_bar(contributions):
+    rows_by_asset = {}
+    for c in contributions:
+        rows_by_asset.setdefault(c["asset__name"], []).append(c)
+
+    by_asset = {asset: _month_index(rows) for asset, rows in rows_by_asset.items()}
+    by_asset = {asset: series for asset, series in by_asset.items() if series}
+
+    months = sorted({m for series in by_asset.values() for m in series})
+    labels = [m.strftime("%b %y") for m in months]
+
+    datasets = []
+    for asset in sorted(by_asset):
+        series = by_asset[asset]
+        data = [float(series.get(m, 0)) for m in months]
+        datasets.append({"label": asset, "data": data})
+
+    return labels, datasets
+
+
+@cached_per_user("contributions_bar")
 def get_monthly_contributions_bar(user):
     contributions = (
         Transaction.objects
@@ -80,20 +110,4 @@ def get_monthly_contributions_bar(user):
         .order_by("month")
     )
 
-    months = sorted(set(c["month"] for c in contributions if c["month"]))
-    labels = [m.strftime("%b %y") for m in months]
-    asset_names = sorted(set(c["asset__name"] for c in contributions))
-
-    datasets = []
-    for asset in asset_names:
-        data = []
-        for m in months:
-            val = next(
-                (c["total"] for c in contributions
-                 if c["month"] == m and c["asset__name"] == asset),
-                0
-            )
-            data.append(float(val))
-        datasets.append({"label": asset, "data": data})
-
-    return labels, datasets
+    return build_contributions_bar(contributions)
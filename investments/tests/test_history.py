@@ -0,0 +1,138 @@
+import os
+import time
+from datetime import date
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, tag
+
+from core.services.timeseries import add_months
+from investments.models import Asset, AssetHistory, Transaction
+from investments.services.history import (
+    build_contributions_bar,
+    build_performance_history,
+    get_monthly_contributions_bar,
+    get_performance_history,
+)
+
+User = get_user_model()
+
+ASSETS = 50
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+
+
+def _synthetic_rows(years):
+    months = [add_months(date(2000, 1, 1), i) for i in range(years * 12)]
+    by_asset = [
+        {"month": m, "asset__name": f"Asset {a:02d}", "total": Decimal("100.00")}
+        for m in months for a in range(ASSETS)
+    ]
+    monthly = [{"month": m, "total": Decimal(ASSETS * 100)} for m in months]
+    return by_asset, monthly
+
+
+def _best_time(func, *args, repeat=5, number=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@tag("benchmark")
+@skipUnless(RUN_BENCHMARKS, "Benchmark de reloj: se ejecuta con RUN_BENCHMARKS=1")
+class HistoryScalingBenchmark(SimpleTestCase):
+    """
+    Con 50 activos, multiplicar por 4 los años de histórico debe multiplicar
+    el tiempo de forma aproximadamente lineal (un algoritmo cuadrático daría ~16x).
+    """
+
+    def assert_linear(self, build):
+        small = _best_time(build, *_synthetic_rows(10))
+        large = _best_time(build, *_synthetic_rows(40))
+        self.assertLess(large / small, 8, f"10y: {small:.4f}s, 40y: {large:.4f}s")
+
+    def test_contributions_bar_scales_linearly(self):
+        self.assert_linear(lambda by_asset, monthly: build_contributions_bar(by_asset))
+
+    def test_performance_history_scales_linearly(self):
+        self.assert_linear(lambda by_asset, monthly: build_performance_history(monthly, monthly))
+
+
+class HistoryBuildersTest(SimpleTestCase):
+
+    def test_outputs(self):
+        by_asset, monthly = _synthetic_rows(10)
+
+        labels, datasets = build_contributions_bar(by_asset)
+        self.assertEqual(len(labels), 120)
+        self.assertEqual(len(datasets), ASSETS)
+        self.assertEqual(datasets[0]["data"][0], 100.0)
+
+        history = build_performance_history(monthly, monthly)
+        self.assertEqual(history[-1]["invested"], 120 * ASSETS * 100.0)
+
+    def test_contributions_bar_fills_missing_months_with_zero(self):
+        rows = [
+            {"month": date(2024, 1, 1), "asset__name": "Gold", "total": Decimal("50")},
+            {"month": date(2024, 3, 1), "asset__name": "ETF", "total": Decimal("200")},
+            {"month": None, "asset__name": "Orphan", "total": Decimal("10")},
+        ]
+
+        labels, datasets = build_contributions_bar(rows)
+
+        self.assertEqual(labels, ["Jan 24", "Mar 24"])
+        self.assertEqual(datasets, [
+            {"label": "ETF", "data": [0.0, 200.0]},
+            {"label": "Gold", "data": [50.0, 0.0]},
+        ])
+
+
+class HistoryQueryCountTest(TestCase):
+    """
+    El coste en base de datos no depende del volumen de histórico:
+    cada serie se resuelve con una única consulta agregada.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="test", password="1234")
+        self.assets = [
+            Asset.objects.create(user=self.user, name=f"Asset {a}", category="INDEX_FUND")
+            for a in range(3)
+        ]
+
+    def seed(self, months):
+        Transaction.objects.bulk_create([
+            Transaction(user=self.user, asset=asset, date=add_months(date(2020, 1, 1), i), amount=100)
+            for i in range(months) for asset in self.assets
+        ])
+        AssetHistory.objects.bulk_create([
+            AssetHistory(user=self.user, asset=asset, date=add_months(date(2020, 1, 1), i), total_value=150)
+            for i in range(months) for asset in self.assets
+        ])
+
+    def test_contributions_bar_uses_one_query(self):
+        for months in (6, 48):
+            with self.subTest(months=months):
+                Transaction.objects.all().delete()
+                AssetHistory.objects.all().delete()
+                self.seed(months)
+                with self.assertNumQueries(1):
+                    labels, datasets = get_monthly_contributions_bar.uncached(self.user)
+                self.assertEqual(len(labels), months)
+                self.assertEqual(len(datasets), len(self.assets))
+
+    def test_performance_history_uses_two_queries(self):
+        for months in (6, 48):
+            with self.subTest(months=months):
+                Transaction.objects.all().delete()
+                AssetHistory.objects.all().delete()
+                self.seed(months)
+                with self.assertNumQueries(2):
+                    history = get_performance_history.uncached(self.user)
+                self.assertEqual(len(history), months)
+                self.assertEqual(history[-1]["invested"], months * 300.0)
@@ -0,0 +1,53 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from investments.models import Asset, Transaction
+
+User = get_user_model()
+
+CSV_CONTENT = """Nombre Fondo/Activo;Entidad;ISIN;Valor liquidativo;Cantidad;Participaciones;Fecha;Compra/Venta;Comentarios
+Fidelity MSCI World Index Fund P-ACC-EUR;MyInvestor;IE00BYX5NX33;9,978;160;16,035;45759;Buy;
+Vanguard Emerging Markets Stock Index Fund EUR Acc;MyInvestor;IE0031786696;188,88;18,88;0,1;45759;Buy;
+Fidelity MSCI World Index Fund P-ACC-EUR;MyInvestor;IE00BYX5NX33;9,978;160;16,035;45759;Buy;
+Physical Gold USD (Acc);Trade Republic;IE00B4ND3602;56,32;20;0,355113;;Buy;
+Fidelity MSCI World Index Fund P-ACC-EUR;MyInvestor;IE00BYX5NX33;10,16;170;16,732;45771;Buy;Segunda compra
+"""
+
+
+class ImportInvestmentsCommandTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="investor", password="1234")
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            f.write(CSV_CONTENT)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def run_import(self):
+        out = StringIO()
+        call_command("import_investments", file=self.path, user="investor", batch_size=2, stdout=out)
+        return out.getvalue()
+
+    def test_import_is_idempotent(self):
+        output = self.run_import()
+
+        self.assertIn("importadas: 3", output)
+        self.assertIn("Duplicados omitidos: 1", output)
+        self.assertIn("Fechas inválidas omitidas: 1", output)
+        self.assertEqual(
+            sorted(Asset.objects.filter(user=self.user).values_list("name", flat=True)),
+            ["Fidelity MSCI World Index", "Vanguard Emerging Markets"]
+        )
+
+        output = self.run_import()
+
+        self.assertIn("importadas: 0", output)
+        self.assertIn("Duplicados omitidos: 4", output)
+        self.assertEqual(Transaction.objects.filter(user=self.user).count(), 3)
@@ -0,0 +1,74 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from datetime import date
+
+from investments.models import Asset, AssetHistory, Transaction
+from investments.services.api import (
+    get_annual_portfolio_evolution,
+    get_portfolio_evolution,
+)
+
+User = get_user_model()
+
+
+class PortfolioEvolutionTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="test", password="1234")
+
+        etf = Asset.objects.create(user=self.user, name="ETF World", category="INDEX_FUND")
+        gold = Asset.objects.create(user=self.user, name="Gold", category="COMMODITY")
+        family = Asset.objects.create(user=self.user, name="Family Investments", category="STOCK")
+
+        for asset, tx_date, amount in [
+            (etf, date(2023, 11, 10), 1000),
+            (etf, date(2024, 2, 10), 500),
+            (gold, date(2024, 3, 5), 200),
+            (family, date(2024, 1, 5), 9000),
+        ]:
+            Transaction.objects.create(user=self.user, asset=asset, date=tx_date, amount=amount)
+
+        for asset, hist_date, value in [
+            (etf, date(2023, 12, 31), 1100),
+            (etf, date(2024, 2, 29), 1700),
+            (etf, date(2025, 1, 31), 2000),
+            (family, date(2024, 1, 31), 9500),
+        ]:
+            AssetHistory.objects.create(user=self.user, asset=asset, date=hist_date, total_value=value)
+
+    def test_annual_evolution(self):
+        with self.assertNumQueries(2):
+            data = get_annual_portfolio_evolution(self.user, 2024)
+
+        self.assertEqual(len(data), 12)
+        jan, feb, mar = data[:3]
+
+        self.assertEqual(jan["invested"], 1000.0)
+        self.assertEqual(jan["market_value"], 1100.0)
+        self.assertEqual(jan["profit_loss"], 0.0)
+
+        self.assertEqual(feb["contributions"], 500.0)
+        self.assertEqual(feb["invested"], 1500.0)
+        self.assertEqual(feb["profit_loss"], 100.0)
+        self.assertAlmostEqual(feb["roi"], 100 / 1600 * 100)
+
+        # Gold no tiene histórico: su valor de mercado es lo invertido
+        self.assertEqual(mar["invested"], 1700.0)
+        self.assertEqual(mar["market_value"], 1900.0)
+        self.assertEqual(data[-1]["market_value"], 1900.0)
+
+    def test_multi_year_window_matches_annual(self):
+        window = get_portfolio_evolution(self.user, date(2024, 1, 1), date(2025, 12, 31))
+        annual = (
+            get_annual_portfolio_evolution(self.user, 2024)
+            + get_annual_portfolio_evolution(self.user, 2025)
+        )
+
+        self.assertEqual(len(window), 24)
+        for row, expected in zip(window, annual):
+            for key in ("invested", "market_value", "contributions"):
+                self.assertAlmostEqual(row[key], expected[key])
+
+        # La ventana encadena el valor de mercado de diciembre (incluido el
+        # invertido sin histórico) en lugar de recalcular el cierre anual.
+        self.assertEqual(window[12]["profit_loss"], 2200.0 - 1900.0)
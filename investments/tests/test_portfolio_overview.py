@@ -0,0 +1,58 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from datetime import date
+
+from investments.models import Asset, AssetHistory, Transaction
+from investments.services.api import get_portfolio_overview
+
+User = get_user_model()
+
+
+class PortfolioOverviewTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="test", password="1234")
+
+        etf = Asset.objects.create(user=self.user, name="ETF World", category="INDEX_FUND")
+        gold = Asset.objects.create(user=self.user, name="Gold", category="COMMODITY")
+        family = Asset.objects.create(user=self.user, name="Family Investments", category="STOCK")
+
+        for asset, tx_date, amount in [
+            (etf, date(2024, 1, 10), 1000),
+            (etf, date(2024, 2, 10), 1000),
+            (etf, date(2024, 4, 10), 500),   # posterior al último valor de mercado
+            (gold, date(2024, 1, 5), 400),
+            (family, date(2023, 5, 1), 3000),
+        ]:
+            Transaction.objects.create(user=self.user, asset=asset, date=tx_date, amount=amount)
+
+        for asset, hist_date, value in [
+            (etf, date(2024, 1, 31), 1100),
+            (etf, date(2024, 3, 31), 2500),
+            (family, date(2024, 2, 29), 3600),
+        ]:
+            AssetHistory.objects.create(user=self.user, asset=asset, date=hist_date, total_value=value)
+
+    def test_overview_single_query(self):
+        with self.assertNumQueries(1):
+            data = get_portfolio_overview(self.user)
+
+        by_name = {item["obj"].name: item for item in data["portfolio"]}
+
+        self.assertEqual(by_name["ETF World"]["invested"], 2000.0)
+        self.assertEqual(by_name["ETF World"]["current_value"], 2500.0)
+        self.assertEqual(by_name["ETF World"]["roi"], 25.0)
+        # Sin histórico: el valor actual es lo invertido
+        self.assertEqual(by_name["Gold"]["current_value"], 400.0)
+        self.assertEqual(by_name["Gold"]["roi"], 0.0)
+
+        self.assertEqual(data["global_invested"], 5400.0)
+        self.assertEqual(data["global_current_value"], 6500.0)
+        self.assertEqual(data["no_family_invested"], 2400.0)
+        self.assertEqual(data["no_family_value"], 2900.0)
+        self.assertEqual(data["last_market_date"], date(2024, 2, 29))
+        self.assertEqual(by_name["Family Investments"]["allocation_display"], round(3600 / 6500 * 100, 1))
+        self.assertEqual(
+            sorted(item["obj"].name for item in data["chart_assets"]),
+            ["ETF World", "Gold"]
+        )
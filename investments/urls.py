@@ -1,6 +1,10 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
+# Bajo ASGI (settings.ASYNC_VIEWS) se sirven las variantes async
+ASYNC = settings.ASYNC_VIEWS
+
 urlpatterns = [
-    path('', views.investments_dashboard, name='investment_dashboard'),
+    path('', views.investments_dashboard_async if ASYNC else views.investments_dashboard, name='investment_dashboard'),
 ]
\ No newline at end of file
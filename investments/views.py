@@ -1,6 +1,10 @@
+import asyncio
+
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 
+from core.decorators import async_login_required
+from core.services.concurrency import run_concurrently, run_in_pool
 from investments.services.api import get_portfolio_overview
 from investments.services.history import (
     get_performance_history,
@@ -9,23 +13,42 @@ from investments.services.history import (
 )
 
 
-@login_required
-def investments_dashboard(request):
-    portfolio_data = get_portfolio_overview(request.user)
-
+def _dashboard_context(portfolio_data, performance_history, contributions_bar):
     allocation_labels, allocation_data = get_allocation_chart(
         portfolio_data["chart_assets"]
     )
+    bar_labels, bar_datasets = contributions_bar
 
-    bar_labels, bar_datasets = get_monthly_contributions_bar(request.user)
-
-    context = {
+    return {
         **portfolio_data,
-        "performance_history": get_performance_history(request.user),
+        "performance_history": performance_history,
         "allocation_labels": allocation_labels,
         "allocation_data": allocation_data,
         "bar_labels": bar_labels,
         "bar_datasets": bar_datasets,
     }
 
+
+@login_required
+def investments_dashboard(request):
+    # Servicios independientes: se lanzan en paralelo
+    results = run_concurrently(
+        lambda: get_portfolio_overview(request.user),
+        lambda: get_performance_history(request.user),
+        lambda: get_monthly_contributions_bar(request.user),
+    )
+
+    context = _dashboard_context(*results)
     return render(request, "investments/investment_dashboard.html", context)
+
+
+@async_login_required
+async def investments_dashboard_async(request):
+    results = await asyncio.gather(
+        run_in_pool(get_portfolio_overview, request.user),
+        run_in_pool(get_performance_history, request.user),
+        run_in_pool(get_monthly_contributions_bar, request.user),
+    )
+
+    context = _dashboard_context(*results)
+    return await run_in_pool(render, request, "investments/investment_dashboard.html", context)
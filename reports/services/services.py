@@ -8,9 +8,7 @@ def get_available_years(user):
     return get_available_transaction_years(user)
 
 # 1. REPORTE FINANCIERO (Flujo de caja)
-def get_financial_annual_report(user, year):
-    monthly_data = get_annual_cashflow_summary(user, year)
-    
+def _annual_cashflow_stats(monthly_data):
     annual_stats = {
         "income": sum(m["income"] for m in monthly_data),
         "expenses": sum(m["expenses"] for m in monthly_data),
@@ -25,13 +23,24 @@ def get_financial_annual_report(user, year):
         (annual_stats["savings"] / annual_stats["income"] * 100) 
         if annual_stats["income"] > 0 else 0
     )
+    return annual_stats
+
+def get_financial_annual_report(user, year):
+    monthly_data = get_annual_cashflow_summary(user, year)
 
     return {
         "year": year,
         "monthly_data": monthly_data,
-        "annual_stats": annual_stats,
-        'annual_savings_rule_labels': ['Savings', 'Fixed', 'Variable'],
-        'annual_savings_rule_data': [
+        "annual_stats": _annual_cashflow_stats(monthly_data),
+    }
+
+def get_financial_annual_chart(user, year):
+    # Datos de la gráfica de la regla de ahorro, servidos aparte del informe
+    annual_stats = _annual_cashflow_stats(get_annual_cashflow_summary(user, year))
+
+    return {
+        "labels": ['Savings', 'Fixed', 'Variable'],
+        "data": [
             max(0, float(annual_stats["savings"])), 
             float(annual_stats["fixed_total"]), 
             float(annual_stats["variable_total"])
@@ -70,6 +79,15 @@ def get_holdings_annual_report(user, year):
     # Asumimos que esta función devuelve la estructura con 'matrix' (cuentas) 
     # y 'month_names' (fechas) que ya usas en la tabla.
     report_data = get_annual_balance_evolution(user, year)
+
+    return {
+        "report": report_data,
+        "year": year,
+        "monthly_data": report_data
+    }
+
+def get_holdings_annual_chart(user, year):
+    report_data = get_annual_balance_evolution(user, year)
     
     # 1. Preparar etiquetas de los meses (Ene 24, Feb 24...)
     labels = [m.strftime("%b %y") for m in report_data['month_names']]
@@ -83,9 +101,6 @@ def get_holdings_annual_report(user, year):
         })
     
     return {
-        "report": report_data,
-        "bar_labels": labels,
-        "bar_datasets": bar_datasets,
-        "year": year,
-        "monthly_data": report_data
-    }
\ No newline at end of file
+        "labels": labels,
+        "datasets": bar_datasets,
+    }
@@ -3,25 +3,23 @@ const SummaryModule = {
         this.setupCharts();
     },
 
-    // Función auxiliar para leer los JSON del HTML
-    getData: function(id) {
-        const el = document.getElementById(id);
-        return el ? JSON.parse(el.textContent) : null;
-    },
-
     setupCharts: function() {
-        const savLabels = this.getData('savings-labels');
-        const savValues = this.getData('savings-data');
+        const canvas = document.getElementById('AnnualsavingsRuleChart');
+        if (!canvas) return;
 
-        if (savLabels && savValues) {
-            ChartFactory.createInteractiveDonut(
-                'AnnualsavingsRuleChart', 
-                'AnnualsavingsLegendContainer', 
-                savLabels, 
-                savValues, 
-                ['#10b981', '#6366f1', '#f59e0b']
-            );
-        }
+        // Los datos de la gráfica se piden después de renderizar el informe
+        fetch(canvas.dataset.url, { credentials: 'same-origin' })
+            .then(response => response.ok ? response.json() : null)
+            .then(chart => {
+                if (!chart) return;
+                ChartFactory.createInteractiveDonut(
+                    'AnnualsavingsRuleChart', 
+                    'AnnualsavingsLegendContainer', 
+                    chart.labels, 
+                    chart.data, 
+                    ['#10b981', '#6366f1', '#f59e0b']
+                );
+            });
     }
 };
 
@@ -1,15 +1,16 @@
 const HoldingsModule = {
     init: function() {
-        // Buscamos los elementos para asegurar que existen antes de parsear
-        const labelsEl = document.getElementById('bar-labels');
-        const dataEl = document.getElementById('bar-datasets');
+        // Buscamos el canvas para asegurar que existe antes de pedir los datos
+        const canvas = document.getElementById('holdingsEvolutionChart');
+        if (!canvas) return;
 
-        if (labelsEl && dataEl) {
-            const labels = JSON.parse(labelsEl.textContent);
-            const datasets = JSON.parse(dataEl.textContent);
-            
-            ChartFactory.createStackedBarChart('holdingsEvolutionChart', labels, datasets);
-        }
+        fetch(canvas.dataset.url, { credentials: 'same-origin' })
+            .then(response => response.ok ? response.json() : null)
+            .then(chart => {
+                if (chart) {
+                    ChartFactory.createStackedBarChart('holdingsEvolutionChart', chart.labels, chart.datasets);
+                }
+            });
     }
 };
 
@@ -0,0 +1,50 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from datetime import date
+
+from finances.models import Category, SubCategory, Transaction
+from holdings.models import BankAccount, AccountBalanceSnapshot
+
+User = get_user_model()
+
+
+class ReportChartEndpointsTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="test", password="1234")
+        income = Category.objects.create(
+            user=self.user, name="Salary", transaction_type='INCOME', expense_type='N/A'
+        )
+        rent = Category.objects.create(
+            user=self.user, name="Rent", transaction_type='EXPENSE', expense_type='FIXED', is_housing=True
+        )
+        Transaction.objects.create(
+            user=self.user, date=date(2024, 1, 25), amount=3000,
+            subcategory=SubCategory.objects.create(user=self.user, name="Main Job", parent_category=income)
+        )
+        Transaction.objects.create(
+            user=self.user, date=date(2024, 1, 5), amount=1000,
+            subcategory=SubCategory.objects.create(user=self.user, name="Apartment", parent_category=rent)
+        )
+        account = BankAccount.objects.create(
+            user=self.user, name="Checking", institution="Bank", account_type="CHECKING"
+        )
+        AccountBalanceSnapshot.objects.create(user=self.user, account=account, date=date(2024, 1, 31), balance=500)
+        self.client.force_login(self.user)
+
+    def test_report_pages_point_to_chart_endpoints(self):
+        response = self.client.get(reverse('reports:report_finance'), {'year': 2024})
+        self.assertContains(response, f"{reverse('reports:report_finance_chart')}?year=2024")
+        response = self.client.get(reverse('reports:report_holdings'), {'year': 2024})
+        self.assertContains(response, f"{reverse('reports:report_holdings_chart')}?year=2024")
+
+    def test_financial_chart(self):
+        response = self.client.get(reverse('reports:report_finance_chart'), {'year': 2024})
+        self.assertEqual(response.json(), {'labels': ['Savings', 'Fixed', 'Variable'], 'data': [2000.0, 1000.0, 0.0]})
+        self.assertIn('ETag', response)
+
+    def test_holdings_chart(self):
+        data = self.client.get(reverse('reports:report_holdings_chart'), {'year': 2024}).json()
+        self.assertEqual(data['labels'][0], 'Jan 24')
+        self.assertEqual(data['datasets'], [{'label': 'Checking', 'data': [500.0] * 12}])
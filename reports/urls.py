@@ -1,9 +1,15 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
+# Bajo ASGI (settings.ASYNC_VIEWS) se sirven las variantes async
+ASYNC = settings.ASYNC_VIEWS
+
 app_name = 'reports'
 urlpatterns = [
-    path('finances/', views.financial_report, name='report_finance'),
-    path('investments/', views.investment_report, name='report_investments'),
-    path('holdings/', views.holdings_report, name='report_holdings'),
-]
\ No newline at end of file
+    path('finances/', views.financial_report_async if ASYNC else views.financial_report, name='report_finance'),
+    path('investments/', views.investment_report_async if ASYNC else views.investment_report, name='report_investments'),
+    path('holdings/', views.holdings_report_async if ASYNC else views.holdings_report, name='report_holdings'),
+    path('finances/chart/', views.financial_report_chart, name='report_finance_chart'),
+    path('holdings/chart/', views.holdings_report_chart, name='report_holdings_chart'),
+]
@@ -1,8 +1,20 @@
+from django.http import JsonResponse
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 from django.utils import timezone
+import asyncio
+from core.api import user_data_endpoint
+from core.decorators import async_login_required
+from core.services.concurrency import run_in_pool
 from .services import services
 
+def _selected_year(request):
+    now = timezone.now()
+    try:
+        return int(request.GET.get('year', now.year))
+    except ValueError:
+        return now.year
+
 @login_required
 def financial_report(request):
     """
@@ -71,4 +83,51 @@ def holdings_report(request):
         'page_title': f'Cash Holdings {current_year}'
     }
     # CORRECCIÓN: Apuntar al template de holdings
-    return render(request, 'reports/holdings_report.html', context)
\ No newline at end of file
+    return render(request, 'reports/holdings_report.html', context)
+
+# Datos de las gráficas, cargados por los templates después del HTML
+@user_data_endpoint
+def financial_report_chart(request):
+    return JsonResponse(services.get_financial_annual_chart(request.user, _selected_year(request)))
+
+@user_data_endpoint
+def holdings_report_chart(request):
+    return JsonResponse(services.get_holdings_annual_chart(request.user, _selected_year(request)))
+
+# Variantes async (ASGI): años y reporte se calculan en paralelo en el pool acotado
+async def _render_report_async(request, report_fn, template, active_tab, title):
+    current_year = _selected_year(request)
+    available_years, report_data = await asyncio.gather(
+        run_in_pool(services.get_available_years, request.user),
+        run_in_pool(report_fn, request.user, current_year),
+    )
+
+    context = {
+        'active_tab': active_tab,
+        'selected_year': current_year,
+        'years': available_years,
+        'report': report_data,
+        'page_title': f'{title} {current_year}'
+    }
+    return await run_in_pool(render, request, template, context)
+
+@async_login_required
+async def financial_report_async(request):
+    return await _render_report_async(
+        request, services.get_financial_annual_report,
+        'reports/financial_report.html', 'finance', 'Financial Report',
+    )
+
+@async_login_required
+async def investment_report_async(request):
+    return await _render_report_async(
+        request, services.get_investment_annual_report,
+        'reports/investment_report.html', 'investments', 'Investment Report',
+    )
+
+@async_login_required
+async def holdings_report_async(request):
+    return await _render_report_async(
+        request, services.get_holdings_annual_report,
+        'reports/holdings_report.html', 'holdings', 'Cash Holdings',
+    )